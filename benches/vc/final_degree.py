@@ -1,41 +1,19 @@
 import argparse
-from dataclasses import dataclass
-from time import time_ns
-import random
 import sys
 
-import galois
 import numpy
 from tqdm import tqdm
 from matplotlib import pyplot as plt
 import scienceplots
 
-from vc.constants import FIELD_GOLDILOCKS
-from vc.fri.parameters import FriParameters
-from vc.fri.prover import FriProver
-from vc.fri.verifier import FriVerifier
-
-
-@dataclass(slots=True, init=False)
-class TestCase:
-    seed: int
-    polynomial: galois.Poly
-    prover: FriProver
-    verifier: FriVerifier
-
-    def __init__(self, fri_parameters: FriParameters, seed: int) -> None:
-        self.seed = seed
-        self.polynomial = galois.Poly.Random(
-            fri_parameters.initial_coefficients_length - 1,
-            field=fri_parameters.field,
-            seed=seed,
-        )
-        self.prover = FriProver(fri_parameters)
-        self.verifier = FriVerifier(fri_parameters)
-
-
-def generate_random_seed() -> int:
-    return random.getrandbits(64)
+from store import add_store_arguments, append_run
+from sweep import (
+    add_sweep_arguments,
+    get_fri_cases,
+    get_mean_times,
+    run_fri_case,
+    run_sweep,
+)
 
 
 def parse_args() -> argparse.Namespace:
@@ -49,11 +27,16 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
     )
 
+    add_sweep_arguments(parser, RESULTS_DATA)
+    add_store_arguments(parser)
+
     return parser.parse_args()
 
 
+BENCHMARK = "final-degree"
 PROVER_DATA = "./benches/results/data/final-degree-prover.txt"
 VERIFIER_DATA = "./benches/results/data/final-degree-verifier.txt"
+RESULTS_DATA = "./benches/results/data/final-degree.jsonl"
 DEGREE_DATA = "./benches/results/data/final-degree-degrees.txt"
 FIGURE = "./benches/results/fig/final-degree.pdf"
 
@@ -66,48 +49,38 @@ def main() -> int:
         final_degree_logs = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
         n_tests = 8
 
-        fri_parameter_cases = [
-            FriParameters(
-                folding_factor_log=1,
-                expansion_factor_log=1,
-                security_level_bits=5,
-                final_coefficients_length_log=fd_log,
-                initial_coefficients_length_log=13,
-                field=FIELD_GOLDILOCKS,
-            )
-            for fd_log in final_degree_logs
-        ]
-
-        seeds = [generate_random_seed() for _ in range(n_tests)]
-
-        prover_times = []
-        verifier_times = []
-        for fri_parameters in tqdm(fri_parameter_cases):
-            test_case_prover_times = []
-            test_case_verifier_times = []
-            for seed in tqdm(seeds, leave=False):
-                test_case = TestCase(fri_parameters, seed)
-
-                begin = time_ns()
-                proof = test_case.prover.prove(test_case.polynomial)
-                end = time_ns()
-
-                test_case_prover_times.append(end - begin)
-
-                begin = time_ns()
-                result = test_case.verifier.verify(proof)
-                end = time_ns()
-                assert result == True, "generated invalid proof"
-
-                test_case_verifier_times.append(end - begin)
+        cases = get_fri_cases(
+            "final_coefficients_length_log",
+            final_degree_logs,
+            {
+                "folding_factor_log": 1,
+                "expansion_factor_log": 1,
+                "security_level_bits": 5,
+                "initial_coefficients_length_log": 13,
+            },
+            n_tests,
+        )
 
-            prover_times.append(
-                numpy.array(test_case_prover_times).mean() // 1_000_000,
+        with tqdm(total=len(cases)) as progress:
+            sweep = run_sweep(
+                cases,
+                run_fri_case,
+                args.output,
+                args.workers,
+                restart=args.restart,
+                progress=progress.update,
             )
 
-            verifier_times.append(
-                numpy.array(test_case_verifier_times).mean() // 1_000_000,
-            )
+        results = sweep.records
+        if len(sweep.new_records) > 0:
+            run_id = append_run(BENCHMARK, sweep.new_records, args.store)
+            print(f"results are stored as run {run_id}")
+
+        prover_times, verifier_times = get_mean_times(
+            results,
+            cases,
+            final_degree_logs,
+        )
 
         numpy.savetxt(PROVER_DATA, prover_times)
         numpy.savetxt(VERIFIER_DATA, verifier_times)
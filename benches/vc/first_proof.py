@@ -0,0 +1,187 @@
+"""Cold and warm first proof latency.
+
+Every case runs in a fresh interpreter, like a short-lived worker would. In a
+cold case the first FRI proof pays for compiling the field kernels. In a warm
+case :func:`vc.warmup.warmup` is called first and its time is reported
+separately from the first proof.
+
+Example::
+
+    python benches/vc/first_proof.py -f babybear -n 5
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from time import perf_counter_ns
+import typing
+
+from store import add_store_arguments, append_run
+
+
+BENCHMARK = "first-proof"
+FIELDS = ["goldilocks", "babybear"]
+MODES = ["cold", "warm"]
+
+
+def run_case(
+    field_name: str,
+    mode: str,
+    initial_degree_log: int,
+) -> typing.Dict[str, int]:
+    """Measure the first proof in the current interpreter."""
+
+    import galois
+
+    from vc import constants
+    from vc.fri.parameters import FriParameters
+    from vc.fri.prover import FriProver
+    from vc.fri.verifier import FriVerifier
+    from vc.warmup import warmup
+
+    field = getattr(constants, f"FIELD_{field_name.upper()}")
+
+    begin = perf_counter_ns()
+    if mode == "warm":
+        warmup([field])
+    warmup_ns = perf_counter_ns() - begin
+
+    # INFO: 32 bit fields cannot reach 32 bits of security.
+    parameters = FriParameters(
+        folding_factor_log=2,
+        expansion_factor_log=2,
+        security_level_bits=16,
+        initial_coefficients_length_log=initial_degree_log,
+        final_coefficients_length_log=2,
+        field=field,
+    )
+    g = galois.Poly.Random((1 << initial_degree_log) - 1, field=field, seed=1)
+
+    begin = perf_counter_ns()
+    proof = FriProver(parameters).prove(g)
+    prover_ns = perf_counter_ns() - begin
+
+    begin = perf_counter_ns()
+    assert FriVerifier(parameters).verify(proof), "proof must be valid"
+    verifier_ns = perf_counter_ns() - begin
+
+    return {
+        "warmup_ns": warmup_ns,
+        "prover_ns": prover_ns,
+        "verifier_ns": verifier_ns,
+        "first_proof_ns": prover_ns + verifier_ns,
+    }
+
+
+def run_in_fresh_interpreter(
+    field_name: str,
+    mode: str,
+    initial_degree_log: int,
+) -> typing.Dict[str, int]:
+    result = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--case",
+            field_name,
+            mode,
+            str(initial_degree_log),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="measure cold and warm first proof latency in fresh interpreters",
+    )
+
+    parser.add_argument(
+        "-f",
+        "--field",
+        dest="fields",
+        help="fields to benchmark. default: all",
+        nargs="+",
+        choices=FIELDS,
+        default=FIELDS,
+    )
+
+    parser.add_argument(
+        "--id",
+        "--initial-degree-log",
+        dest="initial_degree_log",
+        help="initial number of coefficients logarithm. default: 8",
+        type=int,
+        default=8,
+    )
+
+    parser.add_argument(
+        "-n",
+        "--repetitions",
+        dest="repetitions",
+        help="number of fresh interpreters per case. default: 3",
+        type=int,
+        default=3,
+    )
+
+    parser.add_argument(
+        "--case",
+        dest="case",
+        help=argparse.SUPPRESS,
+        nargs=3,
+        default=None,
+    )
+
+    add_store_arguments(parser)
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+
+    if args.case is not None:
+        field_name, mode, initial_degree_log = args.case
+        print(json.dumps(run_case(field_name, mode, int(initial_degree_log))))
+        return 0
+
+    records = []
+    for field_name in args.fields:
+        for mode in MODES:
+            for i in range(args.repetitions):
+                result = run_in_fresh_interpreter(
+                    field_name,
+                    mode,
+                    args.initial_degree_log,
+                )
+                records.append(
+                    {
+                        "key": f"{field_name}-{mode}-{i}",
+                        "parameters": {
+                            "field": field_name,
+                            "mode": mode,
+                            "initial_degree_log": args.initial_degree_log,
+                            "seed": i,
+                        },
+                        "result": result,
+                    }
+                )
+                print(
+                    f"{field_name:>10} {mode:>4} "
+                    + f"warmup {result['warmup_ns'] / 1_000_000:>9.1f} ms "
+                    + f"first proof {result['first_proof_ns'] / 1_000_000:>9.1f} ms",
+                    flush=True,
+                )
+
+    append_run(BENCHMARK, records, args.store)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
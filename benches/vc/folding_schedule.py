@@ -0,0 +1,214 @@
+"""FRI folding schedules against uniform folding.
+
+Every schedule folds the same polynomial down to the same final length, so
+the cases only differ in how the folding is split between the rounds. Large
+first folds make the expensive first round cheaper to open, while small
+last folds keep the final rows short.
+
+Example::
+
+    python benches/vc/folding_schedule.py --id 12 --fd 2 -S 4 4 2 -S 2 4 4 -w 4
+"""
+
+import argparse
+import json
+import sys
+from time import time_ns
+import typing
+
+import galois
+import numpy
+from tqdm import tqdm
+
+from vc.constants import FIELD_GOLDILOCKS
+from vc.fri.parameters import FriParameters
+from vc.fri.plan import FriPlan
+from vc.fri.prover import FriProver
+from vc.fri.verifier import FriVerifier
+
+from store import add_store_arguments, append_run
+from sweep import SweepCase, add_sweep_arguments, run_sweep
+
+
+BENCHMARK = "folding-schedule"
+RESULTS_DATA = "./benches/results/data/folding-schedule.jsonl"
+SCHEDULES = [
+    [2, 2, 2, 2, 2],
+    [3, 3, 3, 1],
+    [4, 4, 2],
+    [4, 3, 3],
+    [3, 3, 4],
+    [4, 2, 2, 2],
+    [2, 2, 2, 4],
+]
+"""Default schedules for the default degrees. Uniform ones come first."""
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument(
+        "-S",
+        "--schedule",
+        dest="schedules",
+        help="folding factor log of every fold. may be repeated. default: a few uniform and mixed schedules",
+        action="append",
+        nargs="+",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "--id",
+        "--initial-degree-log",
+        dest="initial_degree_log",
+        help="initial number of coefficients. default: 12",
+        type=int,
+        default=12,
+    )
+    parser.add_argument(
+        "--fd",
+        "--final-degree-log",
+        dest="final_degree_log",
+        help="number of coefficients when to stop the protocol. default: 2",
+        type=int,
+        default=2,
+    )
+    parser.add_argument(
+        "--ef",
+        "--expansion-factor-log",
+        dest="expansion_factor_log",
+        help="expansion factor. default: 2",
+        type=int,
+        default=2,
+    )
+    parser.add_argument(
+        "--sl",
+        "--security-level-bits",
+        dest="security_level_bits",
+        help="desired security level in bits. default: 48",
+        type=int,
+        default=48,
+    )
+    parser.add_argument(
+        "-n",
+        "--repetitions",
+        dest="repetitions",
+        help="number of repetitions of every case. default: 3",
+        type=int,
+        default=3,
+    )
+
+    add_sweep_arguments(parser, RESULTS_DATA)
+    add_store_arguments(parser)
+
+    return parser.parse_args()
+
+
+def run_case(
+    schedule: typing.List[int],
+    initial_degree_log: int,
+    final_degree_log: int,
+    expansion_factor_log: int,
+    security_level_bits: int,
+    seed: int,
+) -> dict:
+    fri_parameters = FriParameters(
+        folding_factor_log=schedule[0],
+        expansion_factor_log=expansion_factor_log,
+        security_level_bits=security_level_bits,
+        final_coefficients_length_log=final_degree_log,
+        initial_coefficients_length_log=initial_degree_log,
+        field=FIELD_GOLDILOCKS,
+        folding_schedule=schedule,
+    )
+
+    polynomial = galois.Poly.Random(
+        fri_parameters.initial_coefficients_length - 1,
+        field=fri_parameters.field,
+        seed=seed,
+    )
+
+    # INFO: The plan is shared by all the proofs with these parameters, so
+    #       it is not part of the prover time.
+    plan = FriPlan.from_parameters(fri_parameters)
+    prover = FriProver(fri_parameters, plan)
+    verifier = FriVerifier(fri_parameters)
+
+    begin = time_ns()
+    proof = prover.prove(polynomial)
+    end = time_ns()
+    prover_time = end - begin
+
+    begin = time_ns()
+    result = verifier.verify(proof)
+    end = time_ns()
+    assert result == True, "generated invalid proof"
+    verifier_time = end - begin
+
+    return {
+        "prover_ns": prover_time,
+        "verifier_ns": verifier_time,
+        "proof_bytes": len(proof.serialize()),
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    schedules = args.schedules if args.schedules is not None else SCHEDULES
+
+    # INFO: Repetition index is used as a seed so that a resumed sweep
+    #       only runs the missing repetitions. The key holds every parameter,
+    #       so that cases of another configuration are not resumed.
+    parameters = [
+        {
+            "schedule": schedule,
+            "initial_degree_log": args.initial_degree_log,
+            "final_degree_log": args.final_degree_log,
+            "expansion_factor_log": args.expansion_factor_log,
+            "security_level_bits": args.security_level_bits,
+            "seed": i,
+        }
+        for schedule in schedules
+        for i in range(args.repetitions)
+    ]
+    cases = [
+        SweepCase(
+            key=json.dumps(case_parameters, sort_keys=True, separators=(",", ":")),
+            parameters=case_parameters,
+        )
+        for case_parameters in parameters
+    ]
+
+    with tqdm(total=len(cases)) as progress:
+        sweep = run_sweep(
+            cases,
+            run_case,
+            args.output,
+            args.workers,
+            restart=args.restart,
+            progress=progress.update,
+        )
+
+    results = sweep.records
+    if len(sweep.new_records) > 0:
+        run_id = append_run(BENCHMARK, sweep.new_records, args.store)
+        print(f"results are stored as run {run_id}")
+
+    for schedule, begin in zip(schedules, range(0, len(cases), args.repetitions)):
+        records = [
+            results[case.key]["result"]
+            for case in cases[begin : begin + args.repetitions]
+        ]
+        prover_ms = numpy.mean([r["prover_ns"] for r in records]) / 1_000_000
+        verifier_ms = numpy.mean([r["verifier_ns"] for r in records]) / 1_000_000
+        print(
+            f"schedule={str(schedule):<16} "
+            + f"prover={prover_ms:.0f} ms verifier={verifier_ms:.1f} ms "
+            + f"proof={records[0]['proof_bytes'] // 1024} KB"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Import time and CLI startup benchmark.
+
+Every target is run in a fresh interpreter and the wall time is compared to
+the time of starting a bare interpreter. Targets with a budget fail the
+benchmark when their overhead over the bare interpreter exceeds it, so the
+script exits with a non-zero code when importing gets slow again.
+
+Example::
+
+    python benches/vc/import_time.py -r 10
+"""
+
+import argparse
+from dataclasses import dataclass
+from time import perf_counter_ns
+import subprocess
+import sys
+import typing
+
+from store import add_store_arguments, append_run
+
+
+BENCHMARK = "import-time"
+
+
+@dataclass(slots=True, frozen=True)
+class Target:
+    name: str
+    code: str
+    """Code to run in a fresh interpreter."""
+    budget_ms: float | None
+    """Allowed overhead over the bare interpreter. ``None`` means reported only."""
+
+
+def _cli(*argv: str) -> str:
+    return f"import sys; sys.argv = {['vc', *argv]!r}; import vc.cli.main; vc.cli.main.parse_arguments()"
+
+
+TARGETS: typing.List[Target] = [
+    Target("import vc", "import vc", 50),
+    Target("import vc.constants", "import vc.constants", 50),
+    Target("vc fri argument parsing", _cli("fri"), 100),
+    Target("vc stark argument parsing", _cli("stark", "-a", "fibonacci", "8"), 100),
+    Target("import vc.fri.verifier", "import vc.fri.verifier", None),
+    Target(
+        "construct goldilocks",
+        "from vc.constants import FIELD_GOLDILOCKS",
+        None,
+    ),
+]
+
+
+def measure(code: str, repetitions: int) -> int:
+    """Measure the best of ``repetitions`` runs of the code in a fresh interpreter.
+
+    :return: Elapsed time in nanoseconds.
+    :rtype: int
+    """
+
+    elapsed = []
+    for _ in range(repetitions):
+        begin = perf_counter_ns()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        end = perf_counter_ns()
+        elapsed.append(end - begin)
+
+    return min(elapsed)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="measure import time and CLI startup and check them against budgets",
+    )
+
+    parser.add_argument(
+        "-r",
+        "--repetitions",
+        dest="repetitions",
+        help="number of runs per target, the best one is used. default: 5",
+        type=int,
+        default=5,
+    )
+
+    add_store_arguments(parser)
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+
+    interpreter = measure("pass", args.repetitions)
+    print(f"{'bare interpreter':>28} {interpreter / 1_000_000:>9.1f} ms")
+
+    records = []
+    failures = 0
+    for target in TARGETS:
+        elapsed = measure(target.code, args.repetitions)
+        overhead_ms = (elapsed - interpreter) / 1_000_000
+
+        is_failure = target.budget_ms is not None and overhead_ms > target.budget_ms
+        failures += is_failure
+
+        budget = "" if target.budget_ms is None else f"budget {target.budget_ms:.0f} ms"
+        mark = "FAIL" if is_failure else "ok" if target.budget_ms is not None else ""
+        print(
+            f"{target.name:>28} {elapsed / 1_000_000:>9.1f} ms "
+            + f"(+{overhead_ms:.1f} ms) {budget} {mark}"
+        )
+
+        records.append(
+            {
+                "key": target.name,
+                "parameters": {"target": target.name},
+                "result": {"elapsed_ns": elapsed, "overhead_ns": elapsed - interpreter},
+            }
+        )
+
+    append_run(BENCHMARK, records, args.store)
+
+    print(f"{failures} targets over budget")
+
+    return 1 if failures > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
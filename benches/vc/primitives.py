@@ -0,0 +1,490 @@
+"""Microbenchmarks for the primitives the protocols are built from.
+
+Every benchmark is run for each requested field and each arithmetic backend
+(galois ufunc mode) the field supports, so backends can be compared side by
+side. Results are printed as a table and can be saved to a file.
+
+Example::
+
+    python benches/vc/primitives.py --min-log 8 --max-log 16 -f babybear
+"""
+
+import argparse
+from dataclasses import dataclass
+from time import perf_counter_ns
+import pickle
+import sys
+import typing
+
+import galois
+import numpy
+
+from vc.constants import FIELD_BABYBEAR, FIELD_GOLDILOCKS
+from vc.fri.fold import fold_domain, fold_polynomial, stack
+from vc.merkle import MerkleTree
+from vc.polynomial import MPoly, evaluate_degree_correction, expand_ext
+from vc.sponge import Sponge
+
+
+FIELDS = {
+    "goldilocks": FIELD_GOLDILOCKS,
+    "babybear": FIELD_BABYBEAR,
+}
+
+FOLDING_FACTOR = 8
+NUMBER_OF_INDICES = 64
+LOOKUP_TABLES_MAX_ORDER = 1 << 20
+"""galois lists ``jit-lookup`` for large fields too, but cannot allocate the tables."""
+RESULTS_DATA = "./benches/results/data/primitives.txt"
+
+
+@dataclass(slots=True)
+class Measurement:
+    field: str
+    backend: str
+    primitive: str
+    size_log: int
+    elapsed_ns: int
+    amount: float
+    unit: str
+
+    @property
+    def throughput(self) -> float:
+        return self.amount / (self.elapsed_ns / 1_000_000_000)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.field:>10} {self.backend:>16} {self.primitive:>28} "
+            + f"2^{self.size_log:<3} {self.elapsed_ns / 1_000_000:>12.3f} ms "
+            + f"{self.throughput:>14.4g} {self.unit}"
+        )
+
+
+@dataclass(slots=True)
+class Primitive:
+    """Single microbenchmark.
+
+    ``setup`` receives the field and the size and returns the arguments for
+    ``run``. ``amount`` converts the size and the prepared arguments into the
+    amount of work in ``unit``, which is used to compute the throughput.
+    """
+
+    name: str
+    setup: typing.Callable[[type[galois.FieldArray], int], typing.Tuple]
+    run: typing.Callable[..., typing.Any]
+    amount: typing.Callable[[int, typing.Tuple], float]
+    unit: str
+    max_size_log: int = 22
+    """Largest size this primitive is run for. Quadratic primitives are capped."""
+
+
+def _pair(field: type[galois.FieldArray], n: int) -> typing.Tuple:
+    return field.Random(n, seed=1), field.Random(n, seed=2)
+
+
+def _single(field: type[galois.FieldArray], n: int) -> typing.Tuple:
+    return (field.Random(n, seed=1),)
+
+
+def _polynomial_and_domain(field: type[galois.FieldArray], n: int) -> typing.Tuple:
+    polynomial = galois.Poly.Random(n - 1, field=field, seed=1)
+    omega = field.primitive_root_of_unity(n)
+    domain = field.primitive_element * (omega ** numpy.arange(n))
+    return polynomial, domain
+
+
+def _interpolation(field: type[galois.FieldArray], n: int) -> typing.Tuple:
+    polynomial, domain = _polynomial_and_domain(field, n)
+    return domain, polynomial(domain)
+
+
+def _polynomial_and_randomness(
+    field: type[galois.FieldArray],
+    n: int,
+) -> typing.Tuple:
+    polynomial = galois.Poly.Random(n - 1, field=field, seed=1)
+    return polynomial, field.Random(seed=2), FOLDING_FACTOR
+
+
+def _domain(field: type[galois.FieldArray], n: int) -> typing.Tuple:
+    _, domain = _polynomial_and_domain(field, n)
+    return domain, FOLDING_FACTOR
+
+
+def _stacked_evaluations(field: type[galois.FieldArray], n: int) -> typing.Tuple:
+    return (stack(field.Random(n, seed=1), FOLDING_FACTOR),)
+
+
+def _merkle_tree(field: type[galois.FieldArray], n: int) -> typing.Tuple:
+    stacked_evaluations = stack(field.Random(n, seed=1), FOLDING_FACTOR)
+    merkle_tree = MerkleTree()
+    merkle_tree.append_bulk(stacked_evaluations)
+    indices = numpy.arange(min(NUMBER_OF_INDICES, stacked_evaluations.shape[0]))
+    return merkle_tree, stacked_evaluations, indices
+
+
+def _merkle_proofs(field: type[galois.FieldArray], n: int) -> typing.Tuple:
+    merkle_tree, stacked_evaluations, indices = _merkle_tree(field, n)
+    proofs = merkle_tree.prove_bulk(indices)
+    return stacked_evaluations[indices], merkle_tree.get_root(), proofs
+
+
+def _degree_correction(field: type[galois.FieldArray], n: int) -> typing.Tuple:
+    _, domain = _polynomial_and_domain(field, n)
+    return field.Random(seed=2), n // 2, domain
+
+
+def _expansion(field: type[galois.FieldArray], n: int) -> typing.Tuple:
+    polynomial = galois.Poly.Random(n // 2 - 1, field=field, seed=1)
+    return polynomial, field.Random(seed=2), n
+
+
+def _transition_constraint(field: type[galois.FieldArray]) -> MPoly:
+    """Constraint ``y2 - x1 * x2`` over the current and the next rows of two
+    registers, like the constraints of the STARK AIRs."""
+
+    return MPoly(
+        {
+            (0, 0, 0, 1): field(1),
+            (1, 1, 0, 0): -field(1),
+        },
+        field,
+    )
+
+
+def _symbolic_evaluation(field: type[galois.FieldArray], n: int) -> typing.Tuple:
+    polynomials = [
+        galois.Poly.Random(n - 1, field=field, seed=seed) for seed in range(4)
+    ]
+    return _transition_constraint(field), polynomials
+
+
+def _pointwise_evaluation(field: type[galois.FieldArray], n: int) -> typing.Tuple:
+    return _transition_constraint(field), field.Random((4, n), seed=1)
+
+
+def _sponge(field: type[galois.FieldArray], n: int) -> typing.Tuple:
+    sponge = Sponge(field)
+    sponge.absorb(b"\x00" * 32)
+    return sponge, min(NUMBER_OF_INDICES, n), n
+
+
+def _roots(field: type[galois.FieldArray], n: int) -> typing.Tuple:
+    return Sponge(field), [bytes([i % 256]) * 32 for i in range(n)]
+
+
+def _transcript(field: type[galois.FieldArray], n: int) -> typing.Tuple:
+    sponge, roots = _roots(field, n)
+    for root in roots:
+        sponge.absorb(root)
+
+    return (sponge,)
+
+
+def _absorb_all(sponge: Sponge, objects: typing.List[typing.Any]) -> None:
+    for obj in objects:
+        sponge.absorb(obj)
+
+
+def _stacked_bytes(stacked_evaluations: galois.FieldArray) -> int:
+    return sum(len(pickle.dumps(row)) for row in stacked_evaluations)
+
+
+PRIMITIVES: typing.List[Primitive] = [
+    Primitive("field add", _pair, lambda a, b: a + b, lambda n, _: n, "elements/s"),
+    Primitive("field mul", _pair, lambda a, b: a * b, lambda n, _: n, "elements/s"),
+    Primitive(
+        "field inv",
+        _single,
+        lambda a: numpy.reciprocal(a),
+        lambda n, _: n,
+        "elements/s",
+    ),
+    Primitive(
+        "field pow",
+        _single,
+        lambda a: a**FOLDING_FACTOR,
+        lambda n, _: n,
+        "elements/s",
+    ),
+    Primitive(
+        "poly evaluation",
+        _polynomial_and_domain,
+        lambda g, xs: g(xs),
+        lambda n, _: n,
+        "points/s",
+        max_size_log=12,
+    ),
+    Primitive(
+        "lagrange interpolation",
+        _interpolation,
+        galois.lagrange_poly,
+        lambda n, _: n,
+        "points/s",
+        max_size_log=10,
+    ),
+    Primitive(
+        "degree correction",
+        _degree_correction,
+        evaluate_degree_correction,
+        lambda n, _: n,
+        "points/s",
+    ),
+    Primitive(
+        "expand_ext",
+        _expansion,
+        expand_ext,
+        lambda n, _: n,
+        "coefficients/s",
+        max_size_log=12,
+    ),
+    Primitive(
+        "mpoly evals",
+        _symbolic_evaluation,
+        lambda constraint, polynomials: constraint.evals(polynomials),
+        lambda n, _: n,
+        "coefficients/s",
+        max_size_log=12,
+    ),
+    Primitive(
+        "mpoly evalv2",
+        _pointwise_evaluation,
+        lambda constraint, points: constraint.evalv2(points),
+        lambda n, _: n,
+        "points/s",
+        max_size_log=12,
+    ),
+    Primitive(
+        "fold_polynomial",
+        _polynomial_and_randomness,
+        fold_polynomial,
+        lambda n, _: n,
+        "coefficients/s",
+    ),
+    Primitive(
+        "fold_domain",
+        _domain,
+        fold_domain,
+        lambda n, _: n,
+        "elements/s",
+    ),
+    Primitive(
+        "stack",
+        lambda field, n: (field.Random(n, seed=1), FOLDING_FACTOR),
+        stack,
+        lambda n, _: n,
+        "elements/s",
+    ),
+    Primitive(
+        "merkle append_bulk",
+        _stacked_evaluations,
+        lambda se: MerkleTree().append_bulk(se),
+        lambda n, _: n // FOLDING_FACTOR,
+        "hashes/s",
+        max_size_log=20,
+    ),
+    Primitive(
+        "merkle append_bulk MB",
+        _stacked_evaluations,
+        lambda se: MerkleTree().append_bulk(se),
+        lambda _, args: _stacked_bytes(args[0]) / 1_000_000,
+        "MB/s",
+        max_size_log=20,
+    ),
+    Primitive(
+        "merkle prove_bulk",
+        _merkle_tree,
+        lambda tree, _, indices: tree.prove_bulk(indices),
+        lambda _, args: args[2].size,
+        "proofs/s",
+        max_size_log=20,
+    ),
+    Primitive(
+        "merkle verify_bulk",
+        _merkle_proofs,
+        MerkleTree.verify_bulk,
+        lambda _, args: len(args[2]),
+        "proofs/s",
+        max_size_log=20,
+    ),
+    Primitive(
+        "sponge squeeze_indices",
+        _sponge,
+        lambda sponge, amount, upper_bound: sponge.squeeze_indices(amount, upper_bound),
+        lambda _, args: args[1],
+        "indices/s",
+    ),
+    Primitive(
+        "sponge absorb",
+        _roots,
+        _absorb_all,
+        lambda n, _: n,
+        "roots/s",
+        max_size_log=16,
+    ),
+    # INFO: Squeezing hashes the whole transcript, so its cost grows with the
+    #       number of absorbed roots.
+    Primitive(
+        "sponge squeeze_field_element",
+        _transcript,
+        lambda sponge: sponge.squeeze_field_element(),
+        lambda n, _: n,
+        "absorbed roots/s",
+        max_size_log=16,
+    ),
+]
+
+
+def measure(
+    primitive: Primitive,
+    field: type[galois.FieldArray],
+    size_log: int,
+    repetitions: int,
+) -> typing.Tuple[int, typing.Tuple]:
+    """Measure the best of ``repetitions`` runs of the primitive.
+
+    :return: Elapsed time in nanoseconds and the arguments the primitive was run with.
+    :rtype: typing.Tuple[int, typing.Tuple]
+    """
+
+    args = primitive.setup(field, 1 << size_log)
+
+    # INFO: The first call compiles the JIT kernels, do not count it.
+    primitive.run(*args)
+
+    elapsed = []
+    for _ in range(repetitions):
+        begin = perf_counter_ns()
+        primitive.run(*args)
+        end = perf_counter_ns()
+        elapsed.append(end - begin)
+
+    return min(elapsed), args
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="microbenchmarks for field arithmetic, polynomials, folding, Merkle trees and Sponge",
+    )
+
+    parser.add_argument(
+        "--min-log",
+        dest="min_log",
+        help="smallest size logarithm. default: 8",
+        type=int,
+        default=8,
+    )
+
+    parser.add_argument(
+        "--max-log",
+        dest="max_log",
+        help="largest size logarithm. quadratic primitives are capped lower. default: 22",
+        type=int,
+        default=22,
+    )
+
+    parser.add_argument(
+        "-f",
+        "--field",
+        dest="fields",
+        help="fields to benchmark. default: all",
+        nargs="+",
+        choices=list(FIELDS.keys()),
+        default=list(FIELDS.keys()),
+    )
+
+    parser.add_argument(
+        "-b",
+        "--backend",
+        dest="backends",
+        help="galois ufunc modes to compare. unsupported modes are skipped. default: all supported",
+        nargs="+",
+        choices=["jit-lookup", "jit-calculate", "python-calculate"],
+        default=None,
+    )
+
+    parser.add_argument(
+        "-p",
+        "--primitive",
+        dest="primitives",
+        help="primitives to run. default: all",
+        nargs="+",
+        choices=[p.name for p in PRIMITIVES],
+        default=None,
+    )
+
+    parser.add_argument(
+        "-r",
+        "--repetitions",
+        dest="repetitions",
+        help="number of timed runs, the best one is reported. default: 3",
+        type=int,
+        default=3,
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        help=f"file to save the results to. default: {RESULTS_DATA}",
+        default=RESULTS_DATA,
+    )
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+
+    primitives = [
+        p for p in PRIMITIVES if args.primitives is None or p.name in args.primitives
+    ]
+
+    measurements: typing.List[Measurement] = []
+    for field_name in args.fields:
+        field = FIELDS[field_name]
+        default_mode = field.ufunc_mode
+        backends = [
+            mode
+            for mode in field.ufunc_modes
+            if args.backends is None or mode in args.backends
+            if mode != "jit-lookup" or field.order <= LOOKUP_TABLES_MAX_ORDER
+        ]
+
+        for backend in backends:
+            field.compile(backend)
+
+            for primitive in primitives:
+                for size_log in range(
+                    args.min_log,
+                    min(args.max_log, primitive.max_size_log) + 1,
+                ):
+                    elapsed, primitive_args = measure(
+                        primitive,
+                        field,
+                        size_log,
+                        args.repetitions,
+                    )
+                    measurement = Measurement(
+                        field=field_name,
+                        backend=backend,
+                        primitive=primitive.name,
+                        size_log=size_log,
+                        elapsed_ns=elapsed,
+                        amount=primitive.amount(1 << size_log, primitive_args),
+                        unit=primitive.unit,
+                    )
+                    measurements.append(measurement)
+                    print(measurement, flush=True)
+
+        field.compile(default_mode)
+
+    with open(args.output, "w") as file:
+        for measurement in measurements:
+            print(measurement, file=file)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
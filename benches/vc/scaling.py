@@ -0,0 +1,413 @@
+"""Asymptotic scaling regression suite.
+
+Every major stage of the provers is run over a geometric series of sizes and
+the empirical exponent is fitted with a least squares line in log-log scale:
+``time ~ n^a * log(n)^b``. A stage fails when its exponent exceeds the
+declared bound (plus a tolerance for noise). The script exits with a non-zero
+code when any stage fails, so it can be used as a regression gate.
+
+Bounds declare the complexity every stage is meant to have, not the one it
+has today. Stages which are known to miss their bound fail until they are
+fixed, and the fix is named next to their bound.
+
+Example::
+
+    python benches/vc/scaling.py -s commitment transcript
+"""
+
+import argparse
+from dataclasses import dataclass
+from time import perf_counter_ns
+import sys
+import typing
+
+import galois
+import numpy
+
+from vc.constants import FIELD_GOLDILOCKS
+from vc.fri.fold import fold_domain, fold_polynomial, stack
+from vc.fri.parameters import FriParameters
+from vc.fri.prover import FriProver
+from vc.fri.verifier import FriVerifier
+from vc.merkle import MerkleTree
+from vc.ntt import evaluate_on_coset, get_twiddles
+from vc.polynomial import MPoly
+from vc.sponge import Sponge
+
+from store import add_store_arguments, append_run
+
+
+field = FIELD_GOLDILOCKS
+
+BENCHMARK = "scaling"
+EXPANSION_FACTOR_LOG = 2
+FOLDING_FACTOR_LOG = 2
+SECURITY_LEVEL_BITS = 32
+RESULTS_DATA = "./benches/results/data/scaling.txt"
+
+
+@dataclass(slots=True, frozen=True)
+class Bound:
+    """Complexity bound ``n^exponent * log(n)^log_exponent``."""
+
+    exponent: int
+    log_exponent: int = 0
+
+    def __str__(self) -> str:
+        n = "n" if self.exponent == 1 else f"n^{self.exponent}"
+        if self.log_exponent == 0:
+            return n
+
+        log = "log n" if self.log_exponent == 1 else f"log^{self.log_exponent} n"
+        return log if self.exponent == 0 else f"{n} {log}"
+
+
+@dataclass(slots=True)
+class Stage:
+    """Single stage of the protocols.
+
+    ``setup`` receives the size and returns the arguments for ``run``.
+    Only ``run`` is timed.
+    """
+
+    name: str
+    setup: typing.Callable[[int], typing.Tuple]
+    run: typing.Callable[..., typing.Any]
+    bound: Bound
+    min_size_log: int
+    max_size_log: int
+
+
+def fit_exponent(
+    sizes: numpy.ndarray,
+    elapsed: numpy.ndarray,
+    log_exponent: int = 0,
+) -> float:
+    """Fit the exponent ``a`` of ``elapsed ~ sizes^a * log(sizes)^log_exponent``.
+
+    :param sizes: Problem sizes.
+    :type sizes: numpy.ndarray
+    :param elapsed: Measured times.
+    :type elapsed: numpy.ndarray
+    :param log_exponent: Known exponent of the logarithmic factor, which is
+        divided out before fitting, defaults to 0.
+    :type log_exponent: int, optional
+    :return: Slope of the least squares line in log-log scale.
+    :rtype: float
+    """
+
+    assert sizes.size >= 2, "at least two sizes are required to fit an exponent"
+
+    xs = numpy.log2(sizes)
+    ys = numpy.log2(elapsed / xs**log_exponent)
+    slope, _ = numpy.polyfit(xs, ys, 1)
+
+    return float(slope)
+
+
+def _omicron_domain(n: int) -> galois.FieldArray:
+    return field.primitive_root_of_unity(n) ** numpy.arange(n)
+
+
+def _trace_column(n: int) -> typing.Tuple:
+    return _omicron_domain(n), field.Random(n, seed=1)
+
+
+def _zerofier(n: int) -> typing.Tuple:
+    return (_omicron_domain(n)[:-1],)
+
+
+def _constraint_and_trace_polynomials(n: int) -> typing.Tuple:
+    # INFO: A degree 2 constraint, linear ones do not multiply polynomials.
+    constraint = MPoly({(1, 1): field(1), (1, 0): field(field.order - 1)}, field)
+    polynomials = [galois.Poly.Random(n - 1, field=field, seed=seed) for seed in [1, 2]]
+    return constraint, polynomials
+
+
+def _polynomial_and_extended_domain(n: int) -> typing.Tuple:
+    polynomial = galois.Poly.Random(n - 1, field=field, seed=1)
+    length = n << EXPANSION_FACTOR_LOG
+    twiddles = get_twiddles(field.primitive_root_of_unity(length), length)
+    return polynomial, field.primitive_element, twiddles, length
+
+
+def _evaluations(n: int) -> typing.Tuple:
+    return (field.Random(n, seed=1),)
+
+
+def _commit(evaluations: galois.FieldArray) -> bytes:
+    merkle_tree = MerkleTree()
+    merkle_tree.append_bulk(stack(evaluations, 1 << FOLDING_FACTOR_LOG))
+    return merkle_tree.get_root()
+
+
+def _transcript(n: int) -> typing.Tuple:
+    return ([bytes(32) for _ in range(n)],)
+
+
+def _absorb_and_squeeze(messages: typing.List[bytes]) -> None:
+    sponge = Sponge(field)
+    for message in messages:
+        sponge.absorb(message)
+        sponge.squeeze_field_element()
+
+
+def _fold(n: int) -> typing.Tuple:
+    polynomial = galois.Poly.Random(n - 1, field=field, seed=1)
+    domain = field.primitive_element * _omicron_domain(n << EXPANSION_FACTOR_LOG)
+    return polynomial, domain, field.Random(seed=2)
+
+
+def _fold_polynomial_and_domain(
+    polynomial: galois.Poly,
+    domain: galois.FieldArray,
+    randomness: galois.FieldArray,
+) -> None:
+    fold_polynomial(polynomial, randomness, 1 << FOLDING_FACTOR_LOG)
+    fold_domain(domain, 1 << FOLDING_FACTOR_LOG)
+
+
+def _fri_parameters(n: int) -> FriParameters:
+    return FriParameters(
+        folding_factor_log=FOLDING_FACTOR_LOG,
+        expansion_factor_log=EXPANSION_FACTOR_LOG,
+        security_level_bits=SECURITY_LEVEL_BITS,
+        initial_coefficients_length_log=n.bit_length() - 1,
+        final_coefficients_length_log=FOLDING_FACTOR_LOG,
+        field=field,
+    )
+
+
+def _fri_prover(n: int) -> typing.Tuple:
+    parameters = _fri_parameters(n)
+    polynomial = galois.Poly.Random(n - 1, field=field, seed=1)
+    return FriProver(parameters), polynomial
+
+
+def _fri_proof(n: int) -> typing.Tuple:
+    prover, polynomial = _fri_prover(n)
+    return FriVerifier(prover._parameters), prover.prove(polynomial)
+
+
+STAGES: typing.List[Stage] = [
+    Stage(
+        "trace interpolation",
+        _trace_column,
+        galois.lagrange_poly,
+        # INFO: Fails, lagrange_poly is cubic. To be replaced with an inverse
+        #       NTT over the omicron domain.
+        Bound(1, 1),
+        4,
+        8,
+    ),
+    Stage(
+        "transition zerofier",
+        _zerofier,
+        galois.Poly.Roots,
+        # INFO: Fails, Poly.Roots is quadratic. To be replaced with the closed
+        #       form (x^n - 1) / (x - omicron^(n - 1)).
+        Bound(1),
+        6,
+        11,
+    ),
+    Stage(
+        "symbolic constraint evaluation",
+        _constraint_and_trace_polynomials,
+        lambda constraint, polynomials: constraint.evals(polynomials),
+        # INFO: Fails, polynomial multiplication is quadratic. To be
+        #       replaced with NTT-based multiplication.
+        Bound(1, 1),
+        6,
+        11,
+    ),
+    Stage(
+        "low degree extension",
+        _polynomial_and_extended_domain,
+        evaluate_on_coset,
+        Bound(1, 1),
+        6,
+        12,
+    ),
+    Stage(
+        "commitment",
+        _evaluations,
+        _commit,
+        Bound(1, 1),
+        8,
+        14,
+    ),
+    Stage(
+        "transcript",
+        _transcript,
+        _absorb_and_squeeze,
+        # INFO: Fails, the Sponge re-serializes the whole transcript on
+        #       every squeeze. To be replaced with incremental hashing.
+        Bound(1),
+        6,
+        11,
+    ),
+    Stage(
+        "folding",
+        _fold,
+        _fold_polynomial_and_domain,
+        Bound(1),
+        8,
+        14,
+    ),
+    Stage(
+        "fri prover",
+        _fri_prover,
+        lambda prover, polynomial: prover.prove(polynomial),
+        Bound(1, 1),
+        6,
+        12,
+    ),
+    Stage(
+        "fri verifier",
+        _fri_proof,
+        lambda verifier, proof: verifier.verify(proof),
+        # INFO: A logarithmic number of rounds, and a Merkle proof of
+        #       logarithmic length for every query of every round.
+        Bound(0, 2),
+        6,
+        11,
+    ),
+]
+
+
+def measure(stage: Stage, size_log: int, repetitions: int) -> int:
+    """Measure the best of ``repetitions`` runs of the stage.
+
+    :return: Elapsed time in nanoseconds.
+    :rtype: int
+    """
+
+    args = stage.setup(1 << size_log)
+
+    # INFO: The first call compiles the JIT kernels, do not count it.
+    stage.run(*args)
+
+    elapsed = []
+    for _ in range(repetitions):
+        begin = perf_counter_ns()
+        stage.run(*args)
+        end = perf_counter_ns()
+        elapsed.append(end - begin)
+
+    return min(elapsed)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="fit empirical complexity exponents of the protocol stages and check them against declared bounds",
+    )
+
+    parser.add_argument(
+        "-s",
+        "--stage",
+        dest="stages",
+        help="stages to run. default: all",
+        nargs="+",
+        choices=[s.name for s in STAGES],
+        default=None,
+    )
+
+    parser.add_argument(
+        "-r",
+        "--repetitions",
+        dest="repetitions",
+        help="number of timed runs per size, the best one is used. default: 3",
+        type=int,
+        default=3,
+    )
+
+    parser.add_argument(
+        "-t",
+        "--tolerance",
+        dest="tolerance",
+        help="allowed excess of the fitted exponent over the bound. default: 0.15",
+        type=float,
+        default=0.15,
+    )
+
+    parser.add_argument(
+        "--shift",
+        dest="shift",
+        help="shift all the size logarithms by this amount, e.g. -2 for a quick check. default: 0",
+        type=int,
+        default=0,
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        help=f"file to save the results to. default: {RESULTS_DATA}",
+        default=RESULTS_DATA,
+    )
+
+    add_store_arguments(parser)
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+
+    stages = [s for s in STAGES if args.stages is None or s.name in args.stages]
+
+    records = []
+    lines = []
+    failures = 0
+    for stage in stages:
+        sizes_log = range(
+            max(1, stage.min_size_log + args.shift),
+            stage.max_size_log + args.shift + 1,
+        )
+
+        elapsed = []
+        for size_log in sizes_log:
+            elapsed.append(measure(stage, size_log, args.repetitions))
+            records.append(
+                {
+                    "key": f"{stage.name}-{size_log}",
+                    "parameters": {"stage": stage.name, "size_log": size_log},
+                    "result": {"elapsed_ns": elapsed[-1]},
+                }
+            )
+
+        exponent = fit_exponent(
+            numpy.array([1 << size_log for size_log in sizes_log], dtype=float),
+            numpy.array(elapsed, dtype=float),
+            stage.bound.log_exponent,
+        )
+        is_failure = exponent > stage.bound.exponent + args.tolerance
+        failures += is_failure
+
+        log = "" if stage.bound.log_exponent == 0 else f" log^{stage.bound.log_exponent} n"
+        line = (
+            f"{stage.name:>32} 2^{sizes_log.start}..2^{sizes_log.stop - 1} "
+            + f"fitted n^{exponent:.2f}{log} bound {str(stage.bound):>10} "
+            + ("FAIL" if is_failure else "ok")
+        )
+        lines.append(line)
+        print(line, flush=True)
+
+    with open(args.output, "w") as file:
+        for line in lines:
+            print(line, file=file)
+
+    append_run(
+        BENCHMARK,
+        records,
+        args.store,
+        metadata={"tolerance": args.tolerance, "field": field.name},
+    )
+
+    print(f"{failures} stages scale worse than declared in {len(stages)} stages")
+
+    return 1 if failures > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
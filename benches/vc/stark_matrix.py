@@ -0,0 +1,282 @@
+"""STARK benchmark matrix across AIRs and trace heights.
+
+Every case records the time of each phase of ``StarkProver.prove`` and
+``StarkVerifier.verify``, the proof size and the AET shape, so the prover
+cost can be tracked against the trace length and the number of registers.
+
+Example::
+
+    python benches/vc/stark_matrix.py --min-height-log 4 --max-height-log 10 -w 4
+"""
+
+import argparse
+import json
+import math
+import pickle
+import sys
+from time import time_ns
+import typing
+
+import numpy
+from tqdm import tqdm
+
+from vc.cli.airs.common import StarkFriConfiguration, get_stark
+from vc.polynomial import MPoly
+from vc.stark.airs import counter, factorial, fibonacci
+from vc.stark.boundary import BoundaryConstraint
+
+from store import add_store_arguments, append_run
+from sweep import SweepCase, add_sweep_arguments, run_sweep
+
+
+BENCHMARK = "stark-matrix"
+RESULTS_DATA = "./benches/results/data/stark-matrix.jsonl"
+
+
+def get_fibonacci(height: int) -> typing.Tuple:
+    n = height
+    return (
+        fibonacci.get_aet(n),
+        fibonacci.get_transition_constraints(),
+        fibonacci.get_boundary_constraints(n, fibonacci.fib(n)),
+    )
+
+
+def get_factorial(height: int) -> typing.Tuple:
+    # INFO: Factorial AET has n + 1 rows.
+    n = height - 1
+    return (
+        factorial.get_aet(n),
+        factorial.get_transition_constraints(),
+        factorial.get_boundary_constraints(n, math.factorial(n)),
+    )
+
+
+def get_counter(height: int) -> typing.Tuple:
+    n = height
+    return (
+        counter.get_aet(n),
+        counter.get_transition_constraints(),
+        counter.get_boundary_constraints(n),
+    )
+
+
+AIRS: typing.Dict[
+    str,
+    typing.Callable[
+        [int],
+        typing.Tuple[
+            numpy.ndarray,
+            typing.List[MPoly],
+            typing.List[BoundaryConstraint],
+        ],
+    ],
+] = {
+    "fibonacci": get_fibonacci,
+    "factorial": get_factorial,
+    "counter": get_counter,
+}
+
+
+def run_case(
+    air: str,
+    height_log: int,
+    expansion_factor_log: int,
+    folding_factor_log: int,
+    security_level_bits: int,
+    final_coefficients_length_log: int,
+    seed: int,
+) -> dict:
+    # INFO: The seed only distinguishes the repetitions, the AIRs are deterministic.
+    _ = seed
+
+    aet, transition_constraints, boundary_constraints = AIRS[air](1 << height_log)
+    stark_prover, stark_verifier = get_stark(
+        aet.shape[0],
+        StarkFriConfiguration(
+            expansion_factor_log=expansion_factor_log,
+            folding_factor_log=folding_factor_log,
+            security_level_bits=security_level_bits,
+            final_coefficients_length_log=final_coefficients_length_log,
+        ),
+    )
+
+    prover_timings: typing.Dict[str, float] = {}
+    begin = time_ns()
+    proof = stark_prover.prove(
+        aet,
+        transition_constraints,
+        boundary_constraints,
+        timings=prover_timings,
+    )
+    end = time_ns()
+    prover_time = end - begin
+
+    verifier_timings: typing.Dict[str, float] = {}
+    begin = time_ns()
+    result = stark_verifier.verify(
+        proof,
+        transition_constraints,
+        boundary_constraints,
+        aet.shape[1],
+        aet.shape[0],
+        timings=verifier_timings,
+    )
+    end = time_ns()
+    assert result == True, "generated invalid proof"
+    verifier_time = end - begin
+
+    return {
+        "height": aet.shape[0],
+        "n_registers": aet.shape[1],
+        "proof_bytes": len(pickle.dumps(proof)),
+        "prover_ns": prover_time,
+        "verifier_ns": verifier_time,
+        **{
+            f"prover {name} ns": int(elapsed * 1_000_000_000)
+            for name, elapsed in prover_timings.items()
+        },
+        **{
+            f"verifier {name} ns": int(elapsed * 1_000_000_000)
+            for name, elapsed in verifier_timings.items()
+        },
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+
+    parser.add_argument(
+        "-a",
+        "--air",
+        dest="airs",
+        help="AIRs to benchmark. default: all",
+        nargs="+",
+        choices=list(AIRS.keys()),
+        default=list(AIRS.keys()),
+    )
+    parser.add_argument(
+        "--min-height-log",
+        dest="min_height_log",
+        help="smallest trace height logarithm. default: 4",
+        type=int,
+        default=4,
+    )
+    parser.add_argument(
+        "--max-height-log",
+        dest="max_height_log",
+        help="largest trace height logarithm. default: 16",
+        type=int,
+        default=16,
+    )
+    parser.add_argument(
+        "-n",
+        "--repetitions",
+        dest="repetitions",
+        help="number of repetitions of every case. default: 3",
+        type=int,
+        default=3,
+    )
+    parser.add_argument(
+        "--ff",
+        "--folding-factor-log",
+        dest="folding_factor_log",
+        help="folding factor. default: 3",
+        type=int,
+        default=3,
+    )
+    parser.add_argument(
+        "--ef",
+        "--expansion-factor-log",
+        dest="expansion_factor_log",
+        help="expansion factor. default: 3",
+        type=int,
+        default=3,
+    )
+    parser.add_argument(
+        "--fd",
+        "--final-degree-log",
+        dest="final_degree_log",
+        help="number of coefficients when to stop the protocol. default: 2",
+        type=int,
+        default=2,
+    )
+    parser.add_argument(
+        "--sl",
+        "--security-level-bits",
+        dest="security_level_bits",
+        help="desired security level in bits. default: 48",
+        type=int,
+        default=48,
+    )
+
+    add_sweep_arguments(parser, RESULTS_DATA)
+    add_store_arguments(parser)
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+
+    # INFO: Repetition index is used as a seed so that a resumed sweep
+    #       only runs the missing repetitions. The key holds every parameter,
+    #       so that cases of another configuration are not resumed.
+    parameters = [
+        {
+            "air": air,
+            "height_log": height_log,
+            "expansion_factor_log": args.expansion_factor_log,
+            "folding_factor_log": args.folding_factor_log,
+            "security_level_bits": args.security_level_bits,
+            "final_coefficients_length_log": args.final_degree_log,
+            "seed": i,
+        }
+        for height_log in range(args.min_height_log, args.max_height_log + 1)
+        for air in args.airs
+        for i in range(args.repetitions)
+    ]
+    cases = [
+        SweepCase(
+            key=json.dumps(case_parameters, sort_keys=True, separators=(",", ":")),
+            parameters=case_parameters,
+        )
+        for case_parameters in parameters
+    ]
+
+    with tqdm(total=len(cases)) as progress:
+        sweep = run_sweep(
+            cases,
+            run_case,
+            args.output,
+            args.workers,
+            restart=args.restart,
+            progress=progress.update,
+        )
+
+    results = sweep.records
+    if len(sweep.new_records) > 0:
+        run_id = append_run(BENCHMARK, sweep.new_records, args.store)
+        print(f"results are stored as run {run_id}")
+
+    for begin in range(0, len(cases), args.repetitions):
+        case = cases[begin]
+        records = [
+            results[repetition.key]["result"]
+            for repetition in cases[begin : begin + args.repetitions]
+        ]
+        prover_ms = numpy.mean([r["prover_ns"] for r in records]) / 1_000_000
+        verifier_ms = numpy.mean([r["verifier_ns"] for r in records]) / 1_000_000
+        print(
+            f"{case.parameters['air']:>10} "
+            + f"height=2^{case.parameters['height_log']:<3} "
+            + f"registers={records[0]['n_registers']} "
+            + f"prover={prover_ms:.0f} ms verifier={verifier_ms:.0f} ms "
+            + f"proof={records[0]['proof_bytes'] // 1024} KB"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
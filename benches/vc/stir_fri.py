@@ -0,0 +1,215 @@
+"""STIR against FRI at the same security level.
+
+Both low-degree tests prove the same polynomial with the same folding
+factor, expansion factor and final length, and get the number of queries
+from the same soundness regime. STIR lowers the rate every round, so its
+later rounds need fewer queries, at the cost of out-of-domain samples and
+a quotient per round.
+
+Example::
+
+    python benches/vc/stir_fri.py --id 12 --ff 2 3 --sl 48 -w 4
+"""
+
+import argparse
+import json
+import sys
+from time import time_ns
+
+import galois
+import numpy
+from tqdm import tqdm
+
+from vc.constants import FIELD_GOLDILOCKS
+from vc.fri.parameters import FriParameters
+from vc.fri.prover import FriProver
+from vc.fri.verifier import FriVerifier
+from vc.stir.parameters import StirParameters
+from vc.stir.prover import StirProver
+from vc.stir.verifier import StirVerifier
+
+from store import add_store_arguments, append_run
+from sweep import SweepCase, add_sweep_arguments, run_sweep
+
+
+BENCHMARK = "stir-fri"
+RESULTS_DATA = "./benches/results/data/stir-fri.jsonl"
+LOW_DEGREE_TESTS = ["fri", "stir"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument(
+        "--ff",
+        "--folding-factor-log",
+        dest="folding_factor_logs",
+        help="folding factors to compare at. default: 2 3",
+        nargs="+",
+        type=int,
+        default=[2, 3],
+    )
+    parser.add_argument(
+        "--id",
+        "--initial-degree-log",
+        dest="initial_degree_log",
+        help="initial number of coefficients. default: 12",
+        type=int,
+        default=12,
+    )
+    parser.add_argument(
+        "--fd",
+        "--final-degree-log",
+        dest="final_degree_log",
+        help="number of coefficients when to stop the protocol. default: 2",
+        type=int,
+        default=2,
+    )
+    parser.add_argument(
+        "--ef",
+        "--expansion-factor-log",
+        dest="expansion_factor_log",
+        help="expansion factor. default: 2",
+        type=int,
+        default=2,
+    )
+    parser.add_argument(
+        "--sl",
+        "--security-level-bits",
+        dest="security_level_bits",
+        help="desired security level in bits. default: 48",
+        type=int,
+        default=48,
+    )
+    parser.add_argument(
+        "-n",
+        "--repetitions",
+        dest="repetitions",
+        help="number of repetitions of every case. default: 3",
+        type=int,
+        default=3,
+    )
+
+    add_sweep_arguments(parser, RESULTS_DATA)
+    add_store_arguments(parser)
+
+    return parser.parse_args()
+
+
+def run_case(
+    low_degree_test: str,
+    folding_factor_log: int,
+    initial_degree_log: int,
+    final_degree_log: int,
+    expansion_factor_log: int,
+    security_level_bits: int,
+    seed: int,
+) -> dict:
+    if low_degree_test == "stir":
+        parameters = StirParameters(
+            folding_factor_log=folding_factor_log,
+            expansion_factor_log=expansion_factor_log,
+            security_level_bits=security_level_bits,
+            initial_coefficients_length_log=initial_degree_log,
+            final_coefficients_length_log=final_degree_log,
+            field=FIELD_GOLDILOCKS,
+        )
+        prover, verifier = StirProver(parameters), StirVerifier(parameters)
+    else:
+        parameters = FriParameters(
+            folding_factor_log=folding_factor_log,
+            expansion_factor_log=expansion_factor_log,
+            security_level_bits=security_level_bits,
+            initial_coefficients_length_log=initial_degree_log,
+            final_coefficients_length_log=final_degree_log,
+            field=FIELD_GOLDILOCKS,
+        )
+        prover, verifier = FriProver(parameters), FriVerifier(parameters)
+
+    polynomial = galois.Poly.Random(
+        parameters.initial_coefficients_length - 1,
+        field=parameters.field,
+        seed=seed,
+    )
+
+    begin = time_ns()
+    proof = prover.prove(polynomial)
+    end = time_ns()
+    prover_time = end - begin
+
+    begin = time_ns()
+    result = verifier.verify(proof)
+    end = time_ns()
+    assert result == True, "generated invalid proof"
+    verifier_time = end - begin
+
+    return {
+        "prover_ns": prover_time,
+        "verifier_ns": verifier_time,
+        "proof_bytes": len(proof.serialize()),
+    }
+
+
+def main() -> int:
+    args = parse_args()
+
+    # INFO: Repetition index is used as a seed so that a resumed sweep
+    #       only runs the missing repetitions. The key holds every parameter,
+    #       so that cases of another configuration are not resumed.
+    parameters = [
+        {
+            "low_degree_test": low_degree_test,
+            "folding_factor_log": folding_factor_log,
+            "initial_degree_log": args.initial_degree_log,
+            "final_degree_log": args.final_degree_log,
+            "expansion_factor_log": args.expansion_factor_log,
+            "security_level_bits": args.security_level_bits,
+            "seed": i,
+        }
+        for folding_factor_log in args.folding_factor_logs
+        for low_degree_test in LOW_DEGREE_TESTS
+        for i in range(args.repetitions)
+    ]
+    cases = [
+        SweepCase(
+            key=json.dumps(case_parameters, sort_keys=True, separators=(",", ":")),
+            parameters=case_parameters,
+        )
+        for case_parameters in parameters
+    ]
+
+    with tqdm(total=len(cases)) as progress:
+        sweep = run_sweep(
+            cases,
+            run_case,
+            args.output,
+            args.workers,
+            restart=args.restart,
+            progress=progress.update,
+        )
+
+    results = sweep.records
+    if len(sweep.new_records) > 0:
+        run_id = append_run(BENCHMARK, sweep.new_records, args.store)
+        print(f"results are stored as run {run_id}")
+
+    for begin in range(0, len(cases), args.repetitions):
+        case = cases[begin]
+        records = [
+            results[repetition.key]["result"]
+            for repetition in cases[begin : begin + args.repetitions]
+        ]
+        prover_ms = numpy.mean([r["prover_ns"] for r in records]) / 1_000_000
+        verifier_ms = numpy.mean([r["verifier_ns"] for r in records]) / 1_000_000
+        print(
+            f"ldt={case.parameters['low_degree_test']:<4} "
+            + f"folding factor=2^{case.parameters['folding_factor_log']} "
+            + f"prover={prover_ms:.0f} ms verifier={verifier_ms:.1f} ms "
+            + f"proof={records[0]['proof_bytes'] / 1024:.1f} KB"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,348 @@
+"""Benchmark results store.
+
+Every benchmark run is appended to a JSON lines file together with the
+metadata needed to reproduce it: commit, machine, Python and library
+versions. Two runs can then be compared case by case, and statistically
+significant regressions above a threshold are reported.
+
+Examples::
+
+    python benches/vc/store.py list
+    python benches/vc/store.py compare <baseline run id> latest --threshold 0.05
+"""
+
+from datetime import datetime, timezone
+import argparse
+import importlib.metadata
+import json
+import os
+import platform
+import subprocess
+import sys
+import typing
+import uuid
+
+import numpy
+
+
+STORE = "./benches/results/store.jsonl"
+LIBRARIES = ["vc", "galois", "numpy", "numba", "llvmlite", "pymerkle"]
+PERMUTATIONS = 10_000
+"""Number of permutations in the significance test."""
+
+
+def _git(*args: str) -> str | None:
+    try:
+        return subprocess.run(
+            ["git", *args],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _version(library: str) -> str | None:
+    try:
+        return importlib.metadata.version(library)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def collect_metadata() -> typing.Dict[str, typing.Any]:
+    """Collect metadata describing current environment."""
+
+    status = _git("status", "--porcelain", "--untracked-files=no")
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": None if status is None else status != "",
+        "machine": {
+            "node": platform.node(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "cpus": os.cpu_count(),
+        },
+        "python": platform.python_version(),
+        "libraries": {library: _version(library) for library in LIBRARIES},
+    }
+
+
+def add_store_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add results store command line arguments to a benchmark parser."""
+
+    parser.add_argument(
+        "--store",
+        dest="store",
+        help=f"results store to append the run to. default: {STORE}",
+        default=STORE,
+    )
+
+
+def append_run(
+    benchmark: str,
+    records: typing.Iterable[typing.Dict[str, typing.Any]],
+    store: str = STORE,
+    metadata: typing.Dict[str, typing.Any] | None = None,
+) -> str:
+    """Append benchmark run to the store.
+
+    :param benchmark: Benchmark name.
+    :type benchmark: str
+    :param records: Case records with ``key``, ``parameters`` and ``result``
+        as produced by the sweep runner.
+    :type records: typing.Iterable[typing.Dict[str, typing.Any]]
+    :param store: Path to the store, defaults to STORE.
+    :type store: str, optional
+    :param metadata: Additional benchmark-specific metadata, defaults to None.
+    :type metadata: typing.Dict[str, typing.Any] | None, optional
+    :return: Identifier of the appended run.
+    :rtype: str
+    """
+
+    run_id = uuid.uuid4().hex[:12]
+    run = {
+        "type": "run",
+        "run_id": run_id,
+        "benchmark": benchmark,
+        "metadata": collect_metadata() | (metadata or {}),
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(store)), exist_ok=True)
+    with open(store, "a") as file:
+        file.write(json.dumps(run) + "\n")
+        for record in records:
+            case = {
+                "type": "case",
+                "run_id": run_id,
+                "key": record["key"],
+                "parameters": record["parameters"],
+                "result": record["result"],
+            }
+            file.write(json.dumps(case) + "\n")
+
+    return run_id
+
+
+def load(
+    store: str = STORE,
+) -> typing.Tuple[
+    typing.List[typing.Dict[str, typing.Any]],
+    typing.Dict[str, typing.List[typing.Dict[str, typing.Any]]],
+]:
+    """Load the store.
+
+    :return: Runs in the order they were added and case records by run id.
+    """
+
+    runs = []
+    cases: typing.Dict[str, typing.List[typing.Dict[str, typing.Any]]] = {}
+    if not os.path.exists(store):
+        return runs, cases
+
+    with open(store, "r") as file:
+        for line in file:
+            entry = json.loads(line)
+            if entry["type"] == "run":
+                runs.append(entry)
+                cases.setdefault(entry["run_id"], [])
+            else:
+                cases.setdefault(entry["run_id"], []).append(entry)
+
+    return runs, cases
+
+
+def resolve_run(runs: typing.List[typing.Dict[str, typing.Any]], name: str) -> str:
+    """Resolve ``latest``, ``latest~N`` or a run id prefix to a run id."""
+
+    if name.startswith("latest"):
+        back = int(name.removeprefix("latest~") or 0) if "~" in name else 0
+        if back >= len(runs):
+            raise KeyError(f"there are only {len(runs)} runs in the store")
+
+        return runs[-1 - back]["run_id"]
+
+    matches = [run["run_id"] for run in runs if run["run_id"].startswith(name)]
+    if len(matches) != 1:
+        raise KeyError(f"run id {name} matches {len(matches)} runs")
+
+    return matches[0]
+
+
+def _case_name(parameters: typing.Dict[str, typing.Any]) -> str:
+    """Case name shared by all repetitions: parameters without the seed."""
+
+    return ", ".join(f"{k}={v}" for k, v in sorted(parameters.items()) if k != "seed")
+
+
+def group_samples(
+    cases: typing.List[typing.Dict[str, typing.Any]],
+) -> typing.Dict[str, typing.Dict[str, numpy.ndarray]]:
+    """Group repetitions of the same case.
+
+    :return: Samples of every numeric metric by case name.
+    :rtype: typing.Dict[str, typing.Dict[str, numpy.ndarray]]
+    """
+
+    grouped: typing.Dict[str, typing.Dict[str, typing.List[float]]] = {}
+    for case in cases:
+        metrics = grouped.setdefault(_case_name(case["parameters"]), {})
+        for metric, value in case["result"].items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                metrics.setdefault(metric, []).append(value)
+
+    return {
+        name: {metric: numpy.array(values) for metric, values in metrics.items()}
+        for name, metrics in grouped.items()
+    }
+
+
+def permutation_test(
+    baseline: numpy.ndarray,
+    candidate: numpy.ndarray,
+    permutations: int = PERMUTATIONS,
+) -> float:
+    """One-sided permutation test of ``mean(candidate) > mean(baseline)``.
+
+    The test makes no assumptions about the distribution of timings, which
+    are usually skewed, and works for the small sample sizes of the benches.
+
+    :return: p-value.
+    :rtype: float
+    """
+
+    observed = candidate.mean() - baseline.mean()
+    pooled = numpy.concatenate([baseline, candidate])
+
+    generator = numpy.random.default_rng(0)
+    permuted = numpy.array(
+        [generator.permutation(pooled) for _ in range(permutations)],
+    )
+    differences = (
+        permuted[:, baseline.size :].mean(axis=1)
+        - permuted[:, : baseline.size].mean(axis=1)
+    )
+
+    return (numpy.count_nonzero(differences >= observed) + 1) / (permutations + 1)
+
+
+def compare(
+    baseline: typing.List[typing.Dict[str, typing.Any]],
+    candidate: typing.List[typing.Dict[str, typing.Any]],
+    threshold: float,
+    alpha: float,
+) -> typing.List[typing.Tuple[str, str, float, float, bool]]:
+    """Compare two runs case by case.
+
+    A case metric is a regression when its mean grew by more than
+    ``threshold`` (relative) and the growth is significant at level ``alpha``.
+
+    :return: List of (case, metric, relative change, p-value, is regression).
+    """
+
+    baseline_samples = group_samples(baseline)
+    candidate_samples = group_samples(candidate)
+
+    rows = []
+    for name in sorted(baseline_samples.keys() & candidate_samples.keys()):
+        for metric in sorted(baseline_samples[name].keys() & candidate_samples[name].keys()):
+            a = baseline_samples[name][metric]
+            b = candidate_samples[name][metric]
+
+            change = (b.mean() - a.mean()) / a.mean() if a.mean() != 0 else 0.0
+            p_value = permutation_test(a, b)
+            is_regression = change > threshold and p_value < alpha
+
+            rows.append((name, metric, change, p_value, is_regression))
+
+    return rows
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="benchmark results store")
+    parser.add_argument(
+        "--store",
+        dest="store",
+        help=f"path to the store. default: {STORE}",
+        default=STORE,
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="list stored runs")
+
+    compare_parser = subparsers.add_parser(
+        "compare",
+        help="compare two runs and report regressions",
+    )
+    compare_parser.add_argument(
+        "baseline",
+        help="baseline run: run id prefix, latest or latest~N",
+    )
+    compare_parser.add_argument(
+        "candidate",
+        help="candidate run: run id prefix, latest or latest~N",
+    )
+    compare_parser.add_argument(
+        "-t",
+        "--threshold",
+        dest="threshold",
+        help="relative slowdown to report as a regression. default: 0.05",
+        type=float,
+        default=0.05,
+    )
+    compare_parser.add_argument(
+        "-a",
+        "--alpha",
+        dest="alpha",
+        help="significance level. default: 0.05",
+        type=float,
+        default=0.05,
+    )
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    runs, cases = load(args.store)
+
+    if args.command == "list":
+        for run in runs:
+            metadata = run["metadata"]
+            dirty = "+dirty" if metadata["dirty"] else ""
+            print(
+                f"{run['run_id']} {metadata['timestamp']} {run['benchmark']:>16} "
+                + f"{(metadata['commit'] or 'unknown')[:10]}{dirty} "
+                + f"{metadata['machine']['node']} "
+                + f"cases={len(cases[run['run_id']])}"
+            )
+
+        return 0
+
+    baseline_id = resolve_run(runs, args.baseline)
+    candidate_id = resolve_run(runs, args.candidate)
+
+    rows = compare(
+        cases[baseline_id],
+        cases[candidate_id],
+        args.threshold,
+        args.alpha,
+    )
+
+    regressions = 0
+    for name, metric, change, p_value, is_regression in rows:
+        mark = "REGRESSION" if is_regression else ""
+        print(f"{name:>48} {metric:>16} {change:>+9.2%} p={p_value:.4f} {mark}")
+        regressions += is_regression
+
+    print(f"{regressions} regressions in {len(rows)} comparisons")
+
+    return 1 if regressions > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
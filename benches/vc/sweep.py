@@ -0,0 +1,359 @@
+"""Parallel runner for benchmark parameter sweeps.
+
+Every case of a sweep is independent, so cases are distributed over a
+process pool. Each worker is pinned to its own CPU (where the platform
+supports it) and runs one case at a time, so timings are not disturbed by
+other cases. Results are appended to a JSON lines file as soon as they are
+ready, and cases already present in the file are skipped, so an interrupted
+sweep can be resumed by running the same command again.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from time import time_ns
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import typing
+
+import galois
+import numpy
+
+from vc.constants import FIELD_GOLDILOCKS
+from vc.fri.parameters import FriParameters
+from vc.fri.prover import FriProver
+from vc.fri.verifier import FriVerifier
+
+
+@dataclass(slots=True, frozen=True)
+class SweepCase:
+    key: str
+    """Unique case identifier. Used to skip completed cases when resuming."""
+    parameters: typing.Dict[str, typing.Any]
+    """Parameters passed to the case function."""
+
+
+@dataclass(slots=True, frozen=True)
+class SweepResults:
+    records: typing.Dict[str, typing.Dict[str, typing.Any]]
+    """Records of all the cases by case key, including the resumed ones."""
+    new_records: typing.List[typing.Dict[str, typing.Any]]
+    """Records of the cases run by this sweep. Resumed cases may come from
+    another commit or machine, so only these are to be stored."""
+
+
+def add_sweep_arguments(parser: argparse.ArgumentParser, output: str) -> None:
+    """Add common sweep command line arguments to a benchmark parser.
+
+    :param parser: Benchmark argument parser.
+    :type parser: argparse.ArgumentParser
+    :param output: Default path of the results file.
+    :type output: str
+    """
+
+    parser.add_argument(
+        "-w",
+        "--workers",
+        dest="workers",
+        help="number of worker processes. default: number of available CPUs",
+        type=int,
+        default=get_available_cpus_count(),
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        help=f"file to stream the results to. default: {output}",
+        default=output,
+    )
+
+    parser.add_argument(
+        "--restart",
+        dest="restart",
+        help="discard the results of a previous run instead of resuming it",
+        action="store_true",
+    )
+
+
+def get_available_cpus() -> typing.List[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+
+    return list(range(os.cpu_count() or 1))
+
+
+def get_available_cpus_count() -> int:
+    return len(get_available_cpus())
+
+
+def load_results(output: str) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+    """Load completed cases from a results file.
+
+    A partially written last line (the sweep was killed while writing) is ignored.
+
+    :param output: Path to the results file.
+    :type output: str
+    :return: Completed records by case key.
+    :rtype: typing.Dict[str, typing.Dict[str, typing.Any]]
+    """
+
+    results = {}
+    if not os.path.exists(output):
+        return results
+
+    with open(output, "r") as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+            results[record["key"]] = record
+
+    return results
+
+
+def _terminate_partial_line(output: str) -> None:
+    """Make sure new records do not get glued to a partially written one."""
+
+    if not os.path.exists(output) or os.path.getsize(output) == 0:
+        return
+
+    with open(output, "rb+") as file:
+        file.seek(-1, os.SEEK_END)
+        if file.read(1) != b"\n":
+            file.write(b"\n")
+
+
+def _pin_worker(cpus: multiprocessing.Queue) -> None:
+    """Pin current worker process to a CPU nobody else uses."""
+
+    cpu = cpus.get()
+    if cpu is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cpu})
+
+
+def _run_case(
+    function: typing.Callable[..., typing.Dict[str, typing.Any]],
+    case: SweepCase,
+) -> typing.Dict[str, typing.Any]:
+    return {
+        "key": case.key,
+        "parameters": case.parameters,
+        "result": function(**case.parameters),
+    }
+
+
+def run_sweep(
+    cases: typing.List[SweepCase],
+    function: typing.Callable[..., typing.Dict[str, typing.Any]],
+    output: str,
+    workers: int,
+    restart: bool = False,
+    progress: typing.Callable[[int], typing.Any] | None = None,
+) -> SweepResults:
+    """Run all the sweep cases which are not completed yet.
+
+    :param cases: Sweep cases.
+    :type cases: typing.List[SweepCase]
+    :param function: Top-level (picklable) function running a single case.
+        It receives case parameters as keyword arguments and returns
+        a JSON-serializable dictionary.
+    :type function: typing.Callable[..., typing.Dict[str, typing.Any]]
+    :param output: Path to the JSON lines results file.
+    :type output: str
+    :param workers: Number of worker processes.
+    :type workers: int
+    :param restart: Discard previous results, defaults to False.
+    :type restart: bool, optional
+    :param progress: Progress callback called with the number of cases
+        completed by a previous run first, and with ``1`` after every case
+        completed since, e.g. ``tqdm(total=len(cases)).update``, defaults to None.
+    :type progress: typing.Callable[[int], typing.Any] | None, optional
+    :return: Records of the cases, and the ones run by this sweep.
+    :rtype: SweepResults
+    """
+
+    assert workers > 0, "number of workers must be at least 1"
+    assert len({case.key for case in cases}) == len(cases), "case keys must be unique"
+
+    if restart and os.path.exists(output):
+        os.remove(output)
+
+    # INFO: Records of cases which are no longer swept are left out.
+    previous_results = load_results(output)
+    results = {
+        case.key: previous_results[case.key]
+        for case in cases
+        if case.key in previous_results
+    }
+    remaining = [case for case in cases if case.key not in results]
+    new_records = []
+
+    # INFO: Resumed cases count as completed, so that the progress reaches
+    #       the total number of cases.
+    if progress is not None and len(remaining) < len(cases):
+        progress(len(cases) - len(remaining))
+
+    if len(remaining) == 0:
+        return SweepResults(results, new_records)
+
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    _terminate_partial_line(output)
+
+    # INFO: Workers beyond the number of available CPUs are left unpinned.
+    available_cpus = get_available_cpus()
+    workers = min(workers, len(remaining))
+
+    # INFO: Workers are spawned rather than forked: the numba threading layer
+    #       initialized by galois is not fork-safe and forked workers hang on
+    #       exit. Fresh interpreters also keep the timings of cases independent.
+    context = multiprocessing.get_context("spawn")
+    cpus = context.Queue()
+    for i in range(workers):
+        cpus.put(available_cpus[i] if i < len(available_cpus) else None)
+
+    with (
+        open(output, "a") as file,
+        ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_pin_worker,
+            initargs=(cpus,),
+        ) as executor,
+    ):
+        futures = [executor.submit(_run_case, function, case) for case in remaining]
+        for future in as_completed(futures):
+            record = future.result()
+            file.write(json.dumps(record) + "\n")
+            file.flush()
+
+            results[record["key"]] = record
+            new_records.append(record)
+            if progress is not None:
+                progress(1)
+
+    return SweepResults(results, new_records)
+
+
+def generate_random_seed() -> int:
+    return random.getrandbits(64)
+
+
+def run_fri_case(
+    parameter: str | typing.Sequence[str],
+    value: int,
+    seed: int,
+    fixed: typing.Dict[str, typing.Any],
+) -> typing.Dict[str, typing.Any]:
+    """Prove and verify a random polynomial of the initial coefficients length.
+
+    :param parameter: Name of the swept :class:`FriParameters` argument, or
+        names of the arguments which are all set to the swept value.
+    :type parameter: str | typing.Sequence[str]
+    :param value: Swept value.
+    :type value: int
+    :param seed: Seed of the random polynomial.
+    :type seed: int
+    :param fixed: Other :class:`FriParameters` arguments but the field.
+    :type fixed: typing.Dict[str, typing.Any]
+    :return: Prover and verifier times in nanoseconds.
+    :rtype: typing.Dict[str, typing.Any]
+    """
+
+    names = [parameter] if isinstance(parameter, str) else list(parameter)
+    fri_parameters = FriParameters(
+        field=FIELD_GOLDILOCKS,
+        **fixed,
+        **{name: value for name in names},
+    )
+
+    polynomial = galois.Poly.Random(
+        fri_parameters.initial_coefficients_length - 1,
+        field=fri_parameters.field,
+        seed=seed,
+    )
+    prover = FriProver(fri_parameters)
+    verifier = FriVerifier(fri_parameters)
+
+    begin = time_ns()
+    proof = prover.prove(polynomial)
+    end = time_ns()
+    prover_time = end - begin
+
+    begin = time_ns()
+    result = verifier.verify(proof)
+    end = time_ns()
+    assert result == True, "generated invalid proof"
+    verifier_time = end - begin
+
+    return {"prover_ns": prover_time, "verifier_ns": verifier_time}
+
+
+def get_fri_cases(
+    parameter: str | typing.Sequence[str],
+    values: typing.List[int],
+    fixed: typing.Dict[str, typing.Any],
+    n_tests: int,
+) -> typing.List[SweepCase]:
+    """Get the cases of a sweep over a single FRI parameter, see :func:`run_fri_case`.
+
+    :return: ``n_tests`` cases for every value.
+    :rtype: typing.List[SweepCase]
+    """
+
+    # INFO: Seeds are not part of the key, so that a resumed sweep
+    #       only runs the missing repetitions. Every other parameter is, so
+    #       that cases of another configuration are not resumed.
+    return [
+        SweepCase(
+            key=json.dumps(
+                [parameter, value, fixed, i],
+                sort_keys=True,
+                separators=(",", ":"),
+            ),
+            parameters={
+                "parameter": parameter,
+                "value": value,
+                "seed": generate_random_seed(),
+                "fixed": fixed,
+            },
+        )
+        for value in values
+        for i in range(n_tests)
+    ]
+
+
+def get_mean_times(
+    results: typing.Dict[str, typing.Dict[str, typing.Any]],
+    cases: typing.List[SweepCase],
+    values: typing.List[int],
+) -> typing.Tuple[typing.List[float], typing.List[float]]:
+    """Get the mean prover and verifier times of every value of a sweep
+    from :func:`get_fri_cases`.
+
+    :return: Mean prover and verifier times in milliseconds.
+    :rtype: typing.Tuple[typing.List[float], typing.List[float]]
+    """
+
+    prover_times = []
+    verifier_times = []
+    for value in values:
+        records = [
+            results[case.key]["result"]
+            for case in cases
+            if case.parameters["value"] == value
+        ]
+
+        prover_times.append(
+            numpy.array([r["prover_ns"] for r in records]).mean() // 1_000_000,
+        )
+
+        verifier_times.append(
+            numpy.array([r["verifier_ns"] for r in records]).mean() // 1_000_000,
+        )
+
+    return prover_times, verifier_times
@@ -0,0 +1,187 @@
+import argparse
+import pickle
+from dataclasses import dataclass
+import sys
+import time
+import typing
+
+import galois
+
+from vc.base import get_nearest_power_of_two_ext
+from vc.cli.stark import FRI, STIR
+from vc.constants import FIELD_GOLDILOCKS
+from vc.fri.parameters import FriParameters
+from vc.fri.prover import FriProver
+from vc.fri.soundness import CONJECTURED, get_number_of_ood_samples
+from vc.fri.verifier import FriVerifier
+from vc.polynomial import MPoly
+from vc.stark.boundary import BoundaryConstraint
+from vc.stark.parameters import StarkParameters
+from vc.stark.prover import StarkProver
+from vc.stark.verifier import StarkVerifier
+from vc.stir.parameters import StirParameters
+from vc.stir.prover import StirProver
+from vc.stir.verifier import StirVerifier
+
+
+field = FIELD_GOLDILOCKS
+
+
+@dataclass(slots=True)
+class StarkFriConfiguration:
+    expansion_factor_log: int
+    folding_factor_log: int
+    security_level_bits: int
+    final_coefficients_length_log: int
+    grinding_bits: int = 0
+    soundness_regime: str = CONJECTURED
+    low_degree_test: str = FRI
+
+
+def get_fri_configuration(args: argparse.Namespace) -> StarkFriConfiguration:
+    return StarkFriConfiguration(
+        expansion_factor_log=args.expansion_factor_log[0],
+        folding_factor_log=args.folding_factor_log[0],
+        security_level_bits=args.security_level_bits[0],
+        final_coefficients_length_log=args.final_degree_log[0],
+        grinding_bits=args.grinding_bits[0],
+        soundness_regime=args.soundness_regime[0],
+        low_degree_test=args.low_degree_test[0],
+    )
+
+
+def get_stark(
+    aet_height: int,
+    fri_config: StarkFriConfiguration,
+) -> typing.Tuple[StarkProver, StarkVerifier]:
+    aet_height_pow2, aet_height_log = get_nearest_power_of_two_ext(aet_height)
+    omicron = field.primitive_root_of_unity(aet_height_pow2)
+
+    initial_coefficients_length_log = aet_height_log + fri_config.expansion_factor_log
+    if fri_config.low_degree_test == STIR:
+        assert fri_config.grinding_bits == 0, "grinding is not supported by STIR"
+
+        fri_parameters = StirParameters(
+            folding_factor_log=fri_config.folding_factor_log,
+            expansion_factor_log=fri_config.expansion_factor_log,
+            security_level_bits=fri_config.security_level_bits,
+            initial_coefficients_length_log=initial_coefficients_length_log,
+            final_coefficients_length_log=fri_config.final_coefficients_length_log,
+            field=field,
+            soundness_regime=fri_config.soundness_regime,
+        )
+        fri_prover = StirProver(fri_parameters)
+        fri_verifier = StirVerifier(fri_parameters)
+    else:
+        fri_parameters = FriParameters(
+            folding_factor_log=fri_config.folding_factor_log,
+            expansion_factor_log=fri_config.expansion_factor_log,
+            security_level_bits=fri_config.security_level_bits,
+            initial_coefficients_length_log=initial_coefficients_length_log,
+            final_coefficients_length_log=fri_config.final_coefficients_length_log,
+            field=field,
+            grinding_bits=fri_config.grinding_bits,
+            soundness_regime=fri_config.soundness_regime,
+        )
+        fri_prover = FriProver(fri_parameters)
+        fri_verifier = FriVerifier(fri_parameters)
+
+    # INFO: Every polynomial the prover answers at the out-of-domain samples
+    #       has less coefficients than the evaluation domain has points.
+    stark_parameters = StarkParameters(
+        omicron=omicron,
+        field=field,
+        number_of_ood_samples=get_number_of_ood_samples(
+            fri_config.security_level_bits,
+            field.order,
+            fri_parameters.initial_evaluation_domain_length,
+        ),
+    )
+    return (
+        StarkProver(
+            stark_parameters=stark_parameters,
+            fri_prover=fri_prover,
+            state=StarkProver.StarkProverState(
+                field=field,
+                omicron=omicron,
+                aet_height=aet_height,
+            ),
+            fri_parameters=fri_parameters,
+        ),
+        StarkVerifier(
+            state=StarkVerifier.StarkVerifierState(
+                fri_verifier=fri_verifier,
+                fri_parameters=fri_parameters,
+                omicron=omicron,
+                number_of_ood_samples=stark_parameters.number_of_ood_samples,
+            )
+        ),
+    )
+
+
+def run_stark(
+    aet: galois.FieldArray,
+    transition_constraints: typing.List[MPoly],
+    boundary_constraints: typing.List[BoundaryConstraint],
+    fri_config: StarkFriConfiguration,
+) -> int:
+    """Prove and verify the AET, printing the statistics."""
+
+    print(f"AET shape: {aet.shape}")
+    print(f"number of boundary constraints: {len(boundary_constraints)}")
+    print(f"number of transition constraints: {len(transition_constraints)}")
+
+    stark_prover, stark_verifier = get_stark(aet.shape[0], fri_config)
+
+    print()
+    print(f"{fri_config.low_degree_test} parameters: {stark_prover.fri_parameters}")
+    print(
+        f"number of out-of-domain samples: {stark_prover.stark_parameters.number_of_ood_samples}"
+    )
+
+    begin = time.time()
+    proof = stark_prover.prove(
+        aet,
+        transition_constraints,
+        boundary_constraints,
+    )
+    end = time.time()
+    print(f"prover time: {end - begin:.2f} s")
+    print(f"proof size: {len(pickle.dumps(proof)) // 1024} KB")
+
+    begin = time.time()
+    verification_result = stark_verifier.verify(
+        proof,
+        transition_constraints,
+        boundary_constraints,
+        aet.shape[1],
+        aet.shape[0],
+    )
+    end = time.time()
+    print(f"verifier time: {(end - begin) * 1000:.0f} ms")
+    print(f"verification result: {verification_result}")
+
+    return 0
+
+
+def parse_n(args: argparse.Namespace, description: str) -> int | None:
+    """Parse the single positive integer AIR argument.
+
+    :param description: Description of the argument printed on error.
+    :type description: str
+    :return: Parsed argument or ``None`` if it is invalid.
+    :rtype: int | None
+    """
+
+    try:
+        if len(args.air_arguments) != 1:
+            raise ValueError()
+
+        n = int(args.air_arguments[0])
+        if n < 1:
+            raise ValueError()
+    except (TypeError, ValueError):
+        print(f"expected one positive integer: {description}", file=sys.stderr)
+        return None
+
+    return n
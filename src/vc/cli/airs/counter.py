@@ -0,0 +1,25 @@
+import argparse
+
+from vc.cli.airs.common import get_fri_configuration, parse_n, run_stark
+from vc.stark.airs.counter import (
+    get_aet,
+    get_boundary_constraints,
+    get_transition_constraints,
+)
+
+
+def run(args: argparse.Namespace) -> int:
+    fri_config = get_fri_configuration(args)
+
+    n = parse_n(args, "number of counter steps: {0, 1, ..., n - 1}")
+    if n is None:
+        return 1
+
+    print(f"proving that counter reaches {n - 1} in {n} steps")
+
+    return run_stark(
+        get_aet(n),
+        get_transition_constraints(),
+        get_boundary_constraints(n),
+        fri_config,
+    )
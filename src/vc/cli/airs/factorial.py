@@ -0,0 +1,27 @@
+import argparse
+import math
+
+from vc.cli.airs.common import get_fri_configuration, parse_n, run_stark
+from vc.stark.airs.factorial import (
+    get_aet,
+    get_boundary_constraints,
+    get_transition_constraints,
+)
+
+
+def run(args: argparse.Namespace) -> int:
+    fri_config = get_fri_configuration(args)
+
+    n = parse_n(args, 'number to compute the factorial of, like "n" in n!')
+    if n is None:
+        return 1
+
+    result = math.factorial(n)
+    print(f"proving that {n}! is {result}")
+
+    return run_stark(
+        get_aet(n),
+        get_transition_constraints(),
+        get_boundary_constraints(n, result),
+        fri_config,
+    )
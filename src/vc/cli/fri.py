@@ -4,14 +4,10 @@ import logging
 import random
 import time
 import sys
+import typing
 
-import galois
-
-from vc.constants import FIELD_GOLDILOCKS
-from vc.fri.prover import FriProver
-from vc.fri.parameters import FriParameters
-from vc.fri.verifier import FriVerifier
-from vc.constants import FIELD_GOLDILOCKS
+from vc.constants import FIELD_GOLDILOCKS_ORDER
+from vc.fri.soundness import CONJECTURED, REGIMES
 from vc.logging import (
     current_value,
     parameter_received,
@@ -23,11 +19,13 @@ logger = logging.getLogger(__name__)
 
 class FriOptionsDefault:
     folding_factor_log_default: int = 3
-    field_default: int = FIELD_GOLDILOCKS.order
+    field_default: int = FIELD_GOLDILOCKS_ORDER
     initial_degree_log_default: int = 10
     final_degree_log_default: int = 2
     security_level_bits_default: int = 5
     expansion_factor_log_default: int = 3
+    grinding_bits_default: int = 0
+    soundness_regime_default: str = CONJECTURED
 
 
 @dataclasses.dataclass(slots=True)
@@ -46,6 +44,12 @@ class FriOptions:
     """Number of verifier repetitions."""
     expansion_factor_log: int
     """Expansion factor. Code rate reciprocal."""
+    grinding_bits: int = 0
+    """Security bits from the prover proof-of-work."""
+    soundness_regime: str = CONJECTURED
+    """Soundness regime."""
+    folding_schedule: typing.List[int] | None = None
+    """Folding factor logarithm of every fold. Overrides the folding factor."""
     seed: int | None = None
     """Randomness seed."""
 
@@ -71,6 +75,19 @@ def parse_arguments(subparsers: argparse._SubParsersAction) -> None:
         type=int,
     )
 
+    parser.add_argument(
+        "--fs",
+        "--folding-schedule",
+        action="store",
+        dest="folding_schedule",
+        help="folding factor log of every fold, including the final one. overrides the folding factor. default: the folding factor in every fold",
+        nargs="+",
+        default=None,
+        required=False,
+        metavar="NUMBER",
+        type=int,
+    )
+
     parser.add_argument(
         "--ef",
         "--expansion-factor-log",
@@ -136,6 +153,33 @@ def parse_arguments(subparsers: argparse._SubParsersAction) -> None:
         type=int,
     )
 
+    parser.add_argument(
+        "--gb",
+        "--grinding-bits",
+        action="store",
+        dest="grinding_bits",
+        help=f"security bits to get from the prover proof-of-work instead of queries. default: {FriOptionsDefault.grinding_bits_default}",
+        nargs=1,
+        default=[FriOptionsDefault.grinding_bits_default],
+        required=False,
+        metavar="NUMBER",
+        type=int,
+    )
+
+    parser.add_argument(
+        "--sr",
+        "--soundness-regime",
+        action="store",
+        dest="soundness_regime",
+        help=f"soundness regime to compute the number of queries for. default: {FriOptionsDefault.soundness_regime_default}",
+        nargs=1,
+        default=[FriOptionsDefault.soundness_regime_default],
+        required=False,
+        choices=REGIMES,
+        metavar="REGIME",
+        type=str,
+    )
+
     parser.add_argument(
         "-s",
         "--seed",
@@ -158,6 +202,14 @@ def generate_random_seed() -> int:
 
 
 def main(args: argparse.Namespace) -> int:
+    # INFO: Imported here so that argument parsing does not pay for importing
+    #       galois, numba and pymerkle.
+    import galois
+
+    from vc.fri.parameters import FriParameters
+    from vc.fri.prover import FriProver
+    from vc.fri.verifier import FriVerifier
+
     logger.debug(parameter_received("cli_options", args))
     options = FriOptions(
         folding_factor_log=args.folding_factor_log[0],
@@ -166,6 +218,9 @@ def main(args: argparse.Namespace) -> int:
         initial_degree_log=args.initial_degree_log[0],
         security_level_bits=args.security_level_bits[0],
         expansion_factor_log=args.expansion_factor_log[0],
+        grinding_bits=args.grinding_bits[0],
+        soundness_regime=args.soundness_regime[0],
+        folding_schedule=args.folding_schedule,
         seed=args.seed[0],
     )
 
@@ -191,6 +246,9 @@ def main(args: argparse.Namespace) -> int:
         final_coefficients_length_log=options.final_degree_log,
         initial_coefficients_length_log=options.initial_degree_log,
         field=field,
+        grinding_bits=options.grinding_bits,
+        soundness_regime=options.soundness_regime,
+        folding_schedule=options.folding_schedule,
     )
 
     print(f"fri parameters: {fri_parameters}")
@@ -1,10 +1,10 @@
 import logging
-import logging.config
 import sys
 import argparse
 
 import vc.cli.fri
 import vc.cli.stark
+import vc.cli.tune
 
 
 logging_config = {
@@ -31,7 +31,6 @@ logging_config = {
 }
 
 logger = logging.getLogger(__name__)
-logging.config.dictConfig(logging_config)
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -48,11 +47,17 @@ def parse_arguments() -> argparse.Namespace:
 
     vc.cli.fri.parse_arguments(subparsers)
     vc.cli.stark.parse_arguments(subparsers)
+    vc.cli.tune.parse_arguments(subparsers)
 
     return parser.parse_args()
 
 
 def main() -> int:
+    # INFO: logging.config is imported here, it is slow to import.
+    import logging.config
+
+    logging.config.dictConfig(logging_config)
+
     args = parse_arguments()
     return args.func(args)
 
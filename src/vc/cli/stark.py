@@ -1,7 +1,21 @@
 import argparse
+import importlib
 
 from vc.cli.fri import FriOptionsDefault
-from vc.cli.airs import fibonacci
+from vc.fri.soundness import REGIMES
+
+
+AIRS = {
+    "fibonacci": "vc.cli.airs.fibonacci",
+    "factorial": "vc.cli.airs.factorial",
+    "count": "vc.cli.airs.counter",
+}
+"""AIR modules by name. Modules are imported only when the AIR is run."""
+
+FRI = "fri"
+STIR = "stir"
+LOW_DEGREE_TESTS = [FRI, STIR]
+"""Low-degree tests the combination polynomial can be proven with."""
 
 
 def parse_arguments(
@@ -32,7 +46,7 @@ def parse_arguments(
         help="chose the function STARK should prove the result for. default: fibonacci",
         type=str,
         default="fibonacci",
-        choices=["fibonacci", "factorial", "count"],
+        choices=list(AIRS.keys()),
     )
 
     parser.add_argument(
@@ -87,6 +101,47 @@ def parse_arguments(
         type=int,
     )
 
+    parser.add_argument(
+        "--gb",
+        "--grinding-bits",
+        action="store",
+        dest="grinding_bits",
+        help=f"security bits to get from the prover proof-of-work instead of queries. default: {FriOptionsDefault.grinding_bits_default}",
+        nargs=1,
+        default=[FriOptionsDefault.grinding_bits_default],
+        required=False,
+        metavar="NUMBER",
+        type=int,
+    )
+
+    parser.add_argument(
+        "--sr",
+        "--soundness-regime",
+        action="store",
+        dest="soundness_regime",
+        help=f"soundness regime to compute the number of queries for. default: {FriOptionsDefault.soundness_regime_default}",
+        nargs=1,
+        default=[FriOptionsDefault.soundness_regime_default],
+        required=False,
+        choices=REGIMES,
+        metavar="REGIME",
+        type=str,
+    )
+
+    parser.add_argument(
+        "--ldt",
+        "--low-degree-test",
+        action="store",
+        dest="low_degree_test",
+        help=f"low-degree test of the combination polynomial. grinding is supported by FRI only. default: {FRI}",
+        nargs=1,
+        default=[FRI],
+        required=False,
+        choices=LOW_DEGREE_TESTS,
+        metavar="LDT",
+        type=str,
+    )
+
     parser.add_argument(
         "-s",
         "--seed",
@@ -109,8 +164,8 @@ def parse_arguments(
 
 
 def main(args: argparse.Namespace) -> int:
-    if args.air == "fibonacci":
-        return fibonacci.run(args)
+    if args.list:
+        print("\n".join(AIRS.keys()))
+        return 0
 
-    print("not implemented yet")
-    return 0
+    return importlib.import_module(AIRS[args.air]).run(args)
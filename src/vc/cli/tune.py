@@ -0,0 +1,227 @@
+import argparse
+import logging
+import time
+
+from vc.cli.fri import FriOptionsDefault
+from vc.fri.soundness import REGIMES
+
+
+logger = logging.getLogger(__name__)
+
+OBJECTIVES = ["prover", "verifier", "size"]
+"""Same as vc.tune.OBJECTIVES, which is not imported to keep parsing fast."""
+
+
+class TuneOptionsDefault:
+    security_level_bits_default: int = 32
+    coefficients_length_log_default: int = 10
+    objective_default: str = "prover"
+    number_of_candidates_default: int = 5
+
+
+def parse_arguments(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "tune",
+        description="subprogram for finding the best FRI parameters for a security level and an objective with a cost model calibrated on this machine",
+        help="find the best FRI parameters",
+    )
+    parser.set_defaults(func=main)
+
+    parser.add_argument(
+        "-f",
+        "--field",
+        action="store",
+        dest="field",
+        help=f"prime field size. default: {FriOptionsDefault.field_default}",
+        nargs=1,
+        default=[FriOptionsDefault.field_default],
+        required=False,
+        metavar="NUMBER",
+        type=int,
+    )
+
+    parser.add_argument(
+        "--sl",
+        "--security-level-bits",
+        action="store",
+        dest="security_level_bits",
+        help=f"desired security level in bits. default: {TuneOptionsDefault.security_level_bits_default}",
+        nargs=1,
+        default=[TuneOptionsDefault.security_level_bits_default],
+        required=False,
+        metavar="NUMBER",
+        type=int,
+    )
+
+    parser.add_argument(
+        "-n",
+        "--size-log",
+        action="store",
+        dest="size_log",
+        help=f"number of polynomial coefficients, or trace length with --trace. default: 2^{TuneOptionsDefault.coefficients_length_log_default}",
+        nargs=1,
+        default=[TuneOptionsDefault.coefficients_length_log_default],
+        required=False,
+        metavar="NUMBER",
+        type=int,
+    )
+
+    parser.add_argument(
+        "-t",
+        "--trace",
+        action="store_true",
+        dest="trace",
+        help="tune STARK parameters for a trace of the given length",
+        default=False,
+        required=False,
+    )
+
+    parser.add_argument(
+        "-o",
+        "--objective",
+        action="store",
+        dest="objectives",
+        help=f"objectives to minimize. default: {TuneOptionsDefault.objective_default}",
+        nargs="+",
+        default=[TuneOptionsDefault.objective_default],
+        required=False,
+        choices=OBJECTIVES,
+        metavar="OBJECTIVE",
+        type=str,
+    )
+
+    parser.add_argument(
+        "-w",
+        "--weights",
+        action="store",
+        dest="weights",
+        help="weight of every objective. default: 1 for every objective",
+        nargs="+",
+        default=None,
+        required=False,
+        metavar="NUMBER",
+        type=float,
+    )
+
+    parser.add_argument(
+        "--gb",
+        "--grinding-bits",
+        action="store",
+        dest="grinding_bits",
+        help=f"security bits to get from the prover proof-of-work instead of queries. default: {FriOptionsDefault.grinding_bits_default}",
+        nargs=1,
+        default=[FriOptionsDefault.grinding_bits_default],
+        required=False,
+        metavar="NUMBER",
+        type=int,
+    )
+
+    parser.add_argument(
+        "--sr",
+        "--soundness-regime",
+        action="store",
+        dest="soundness_regime",
+        help=f"soundness regime to compute the number of queries for. default: {FriOptionsDefault.soundness_regime_default}",
+        nargs=1,
+        default=[FriOptionsDefault.soundness_regime_default],
+        required=False,
+        choices=REGIMES,
+        metavar="REGIME",
+        type=str,
+    )
+
+    parser.add_argument(
+        "-c",
+        "--candidates",
+        action="store",
+        dest="number_of_candidates",
+        help=f"number of best candidates to print. default: {TuneOptionsDefault.number_of_candidates_default}",
+        nargs=1,
+        default=[TuneOptionsDefault.number_of_candidates_default],
+        required=False,
+        metavar="NUMBER",
+        type=int,
+    )
+
+    parser.add_argument(
+        "-m",
+        "--measure",
+        action="store_true",
+        dest="measure",
+        help="prove and verify with the best parameters to compare with the prediction",
+        default=False,
+        required=False,
+    )
+
+
+def main(args: argparse.Namespace) -> int:
+    import galois
+
+    from vc.fri.plan import FriPlan
+    from vc.fri.prover import FriProver
+    from vc.fri.verifier import FriVerifier
+    from vc.tune import CostModel, tune
+
+    # INFO: Tuning builds parameters for every candidate, and most of them
+    #       do not reach the security level, which is logged. Proofs made
+    #       while calibrating and measuring are not interesting either.
+    logging.getLogger("vc.fri.parameters").setLevel(logging.ERROR)
+    logging.getLogger("vc.fri.prover").setLevel(logging.INFO)
+
+    weights = args.weights if args.weights is not None else [1.0] * len(args.objectives)
+    if len(weights) != len(args.objectives):
+        print("there must be a weight for every objective")
+        return 1
+
+    field = galois.GF(args.field[0])
+
+    begin = time.time()
+    cost_model = CostModel.calibrate(field)
+    print(f"calibration time: {time.time() - begin:.2f} s")
+    print(f"cost model: {cost_model}")
+
+    try:
+        candidates = tune(
+            field,
+            args.security_level_bits[0],
+            args.size_log[0],
+            dict(zip(args.objectives, weights)),
+            cost_model,
+            trace=args.trace,
+            grinding_bits=args.grinding_bits[0],
+            soundness_regime=args.soundness_regime[0],
+        )
+    except AssertionError as error:
+        print(error)
+        return 1
+
+    print()
+    for candidate in candidates[: args.number_of_candidates[0]]:
+        print(candidate)
+
+    best = candidates[0]
+    print()
+    print(f"best fri parameters: {best.parameters}")
+
+    if args.measure:
+        parameters = best.parameters
+        plan = FriPlan.from_parameters(parameters)
+        g = galois.Poly.Random(
+            parameters.initial_coefficients_length - 1,
+            field=field,
+            seed=1,
+        )
+
+        begin = time.time()
+        proof = FriProver(parameters, plan).prove(g)
+        end = time.time()
+        print(f"prover time: {(end - begin) * 1000:.0f} ms")
+        print(f"proof size: {len(proof.serialize()) // 1024} KB")
+
+        begin = time.time()
+        verification_result = FriVerifier(parameters).verify(proof)
+        end = time.time()
+        print(f"verifier time: {(end - begin) * 1000:.1f} ms")
+        print(f"verification result: {verification_result}")
+
+    return 0
@@ -1,7 +1,46 @@
-import galois
+"""Constants.
+
+Field classes are constructed on first access: building a galois field takes
+seconds, and importing galois alone takes hundreds of milliseconds, which is
+more than short-lived processes such as the CLI or verification jobs should
+pay for simply importing the package. Use field orders where a field class is
+not needed yet.
+"""
+
+import typing
+
+if typing.TYPE_CHECKING:
+    import galois
+
 
 MEKRLE_HASH_ALGORITHM = "sha3_256"
+MERKLE_HASH_SIZE = 32
+"""Size of a Merkle tree hash in bytes."""
+
+FIELD_BABYBEAR_ORDER = (1 << 31) - (1 << 27) + 1
+FIELD_GOLDILOCKS_ORDER = (1 << 64) - (1 << 32) + 1
+FIELD_193_ORDER = 193
+
+_FIELD_ORDERS = {
+    "FIELD_BABYBEAR": FIELD_BABYBEAR_ORDER,
+    "FIELD_GOLDILOCKS": FIELD_GOLDILOCKS_ORDER,
+    "FIELD_193": FIELD_193_ORDER,
+}
+
+FIELD_BABYBEAR: "type[galois.FieldArray]"
+FIELD_GOLDILOCKS: "type[galois.FieldArray]"
+FIELD_193: "type[galois.FieldArray]"
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name not in _FIELD_ORDERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import galois
+
+    # INFO: Cache the field in module globals, so that __getattr__ is not
+    #       called for it anymore.
+    field = galois.GF(_FIELD_ORDERS[name])
+    globals()[name] = field
 
-FIELD_BABYBEAR = galois.GF((1 << 31) - (1 << 27) + 1)
-FIELD_GOLDILOCKS = galois.GF((1 << 64) - (1 << 32) + 1)
-FIELD_193 = galois.GF(193)
+    return field
@@ -0,0 +1,296 @@
+"""Batch FRI.
+
+A single low-degree proof for many polynomials over the same domain. The
+evaluations of all the polynomials are committed in one Merkle tree, a leaf
+holding the stacked evaluations of every polynomial for the same row. FRI
+then proves that a random linear combination of the degree-corrected
+polynomials is of low degree, so the proof costs about as much as a single
+FRI proof plus one evaluation per polynomial.
+
+Polynomials may have different degree bounds: every polynomial is
+multiplied by its own degree correction polynomial to the common number of
+coefficients before the combination. The bounds are part of the statement,
+so the verifier is given them and both parties absorb them before the
+combination randomness is squeezed.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import pickle
+import typing
+
+import galois
+import numpy
+
+from vc.fri.fold import stack
+from vc.fri.parameters import FriParameters
+from vc.fri.plan import FriPlan
+from vc.fri.proof import RoundProof
+from vc.fri.prover import FriProver
+from vc.fri.verifier import FriVerifier
+from vc.logging import current_value, logging_mark
+from vc.polynomial import evaluate_degree_correction
+from vc.sponge import Sponge
+
+
+logger = logging.getLogger(__name__)
+
+
+def _get_degree_correction_lengths(
+    parameters: FriParameters,
+    coefficients_lengths: typing.List[int],
+) -> typing.List[int]:
+    """Get the number of coefficients of the degree correction polynomial of
+    every polynomial, which brings it to the initial coefficients length."""
+
+    return [
+        parameters.initial_coefficients_length - coefficients_length + 1
+        for coefficients_length in coefficients_lengths
+    ]
+
+
+@dataclasses.dataclass(slots=True)
+class BatchFriProof:
+    round_proofs: typing.List[RoundProof]
+    """Round proofs. First round rows hold the stacked evaluations of all
+    the polynomials one after another."""
+    merkle_roots: typing.List[bytes]
+    final_polynomial: galois.Poly
+    degree_correction_lengths: typing.List[int]
+    """Number of coefficients of the degree correction polynomial of every
+    polynomial."""
+    proof_of_work_nonce: int = 0
+    """Nonce absorbed before the query indices are squeezed."""
+
+    def serialize(self) -> bytes:
+        return pickle.dumps(self)
+
+    def __repr__(self) -> str:
+        return f"""
+    number of polynomials: {len(self.degree_correction_lengths)}
+    final polynomial: {self.final_polynomial}
+    proof size: {len(self.serialize()) // 1024} KB
+"""
+
+
+@dataclasses.dataclass(init=False, slots=True)
+class BatchFriProver:
+    """Batch FRI Prover."""
+
+    _parameters: FriParameters
+    """Public Prover options."""
+    _fri_prover: FriProver
+    """Prover for the combination polynomial."""
+
+    def __init__(
+        self,
+        parameters: FriParameters,
+        plan: FriPlan | None = None,
+    ) -> None:
+        """Initialize new Prover.
+
+        :param parameters: FRI parameters.
+        :type parameters: FriParameters
+        :param plan: Plan built for the same parameters. A new plan is built
+            when None, defaults to None.
+        :type plan: FriPlan | None, optional
+        """
+
+        self._parameters = parameters
+        self._fri_prover = FriProver(parameters, plan)
+
+    @property
+    def plan(self) -> FriPlan:
+        return self._fri_prover.plan
+
+    @logging_mark(logger)
+    def prove(
+        self,
+        fs: typing.List[galois.Poly],
+        coefficients_lengths: typing.List[int] | None = None,
+        sponge: Sponge | None = None,
+    ) -> BatchFriProof:
+        """Prove that all the polynomials are close to RS-code.
+
+        :param fs: Polynomials to be proven.
+        :type fs: typing.List[galois.Poly]
+        :param coefficients_lengths: Number of coefficients every polynomial
+            is proven to have at most. Initial coefficients length for every
+            polynomial when None, defaults to None.
+        :type coefficients_lengths: typing.List[int] | None, optional
+        :param sponge: Sponge, defaults to None.
+        :type sponge: Sponge | None, optional
+        :return: Proof for all the polynomials.
+        :rtype: BatchFriProof
+        """
+
+        assert len(fs) > 0, "there must be at least one polynomial"
+
+        initial_coefficients_length = self._parameters.initial_coefficients_length
+        if coefficients_lengths is None:
+            coefficients_lengths = [initial_coefficients_length] * len(fs)
+
+        assert len(coefficients_lengths) == len(
+            fs
+        ), "there must be a coefficients length for every polynomial"
+        for f, coefficients_length in zip(fs, coefficients_lengths):
+            assert (
+                f.degree < coefficients_length <= initial_coefficients_length
+            ), "polynomial has too many coefficients"
+
+        state = FriProver.State(None, self._parameters, sponge)
+
+        plan = self._fri_prover.plan
+        evaluations = [plan.evaluate(f, 0) for f in fs]
+        self._fri_prover.commit(
+            state,
+            numpy.concatenate(
+                [stack(e, self._parameters.folding_factor) for e in evaluations],
+                axis=1,
+            ),
+        )
+
+        state.sponge.absorb([int(length) for length in coefficients_lengths])
+
+        weights = [state.sponge.squeeze_field_element() for _ in fs]
+        randomness = state.sponge.squeeze_field_element()
+        logger.debug(current_value("randomness", randomness))
+
+        degree_correction_lengths = _get_degree_correction_lengths(
+            self._parameters,
+            coefficients_lengths,
+        )
+
+        g_evaluations = self._parameters.field.Zeros(
+            self._parameters.initial_evaluation_domain_length
+        )
+        for weight, e, degree_correction_length in zip(
+            weights,
+            evaluations,
+            degree_correction_lengths,
+        ):
+            g_evaluations += (
+                weight
+                * e
+                * evaluate_degree_correction(
+                    randomness,
+                    degree_correction_length,
+                    plan.domains[0],
+                )
+            )
+
+        final_polynomial = self._fri_prover.commit_phase(
+            state,
+            stack(g_evaluations, self._parameters.folding_factor),
+        )
+
+        return BatchFriProof(
+            self._fri_prover.query_phase(state),
+            state.merkle_roots,
+            final_polynomial,
+            degree_correction_lengths,
+            state.proof_of_work_nonce,
+        )
+
+
+@dataclasses.dataclass(init=False, slots=True)
+class BatchFriVerifier:
+    """Batch FRI Verifier."""
+
+    _parameters: FriParameters
+    _fri_verifier: FriVerifier
+
+    def __init__(
+        self,
+        parameters: FriParameters,
+        plan: FriPlan | None = None,
+    ) -> None:
+        """Initialize new Verifier.
+
+        :param parameters: FRI parameters.
+        :type parameters: FriParameters
+        :param plan: Plan built for the same parameters, defaults to None.
+        :type plan: FriPlan | None, optional
+        """
+
+        self._parameters = parameters
+        self._fri_verifier = FriVerifier(parameters, plan)
+
+    @logging_mark(logger)
+    def verify(
+        self,
+        proof: BatchFriProof,
+        coefficients_lengths: typing.List[int],
+        sponge: Sponge | None = None,
+    ) -> bool:
+        """Verify proof.
+
+        :param proof: Proof for some polynomials.
+        :type proof: BatchFriProof
+        :param coefficients_lengths: Number of coefficients every polynomial
+            must have at most, as given to :meth:`BatchFriProver.prove`.
+        :type coefficients_lengths: typing.List[int]
+        :param sponge: Sponge, defaults to None.
+        :type sponge: Sponge | None, optional
+        :return: ``True`` if ``proof`` is valid. ``False`` otherwise.
+        :rtype: bool
+        """
+
+        number_of_polynomials = len(coefficients_lengths)
+        assert number_of_polynomials > 0, "there must be at least one polynomial"
+        for coefficients_length in coefficients_lengths:
+            assert (
+                0 < coefficients_length <= self._parameters.initial_coefficients_length
+            ), "invalid coefficients length"
+
+        state = FriVerifier.State(self._parameters, sponge=sponge)
+
+        folding_factor = self._parameters.folding_factor
+        if proof.degree_correction_lengths != _get_degree_correction_lengths(
+            self._parameters,
+            coefficients_lengths,
+        ):
+            logger.error(f"invalid degree correction lengths")
+            return False
+
+        if not self._fri_verifier.check_structure(proof):
+            return False
+
+        if (
+            proof.round_proofs[0].stacked_evaluations.shape[-1]
+            != number_of_polynomials * folding_factor
+        ):
+            logger.error(f"invalid first round row length")
+            return False
+
+        state.sponge.absorb(proof.merkle_roots[0])
+        state.sponge.absorb([int(length) for length in coefficients_lengths])
+
+        weights = [
+            state.sponge.squeeze_field_element() for _ in range(number_of_polynomials)
+        ]
+        r = state.sponge.squeeze_field_element()
+        logger.debug(current_value("r", r))
+
+        def correct(
+            stacked_evaluations: galois.FieldArray,
+            xs: galois.FieldArray,
+        ) -> galois.FieldArray:
+            result = self._parameters.field.Zeros(xs.shape)
+            for j, (weight, degree_correction_length) in enumerate(
+                zip(weights, proof.degree_correction_lengths)
+            ):
+                columns = stacked_evaluations[
+                    :, j * folding_factor : (j + 1) * folding_factor
+                ]
+                result += (
+                    weight
+                    * columns
+                    * evaluate_degree_correction(r, degree_correction_length, xs)
+                )
+
+            return result
+
+        return self._fri_verifier.verify_rounds(proof, state, correct)
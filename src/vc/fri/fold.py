@@ -9,48 +9,39 @@ from vc.base import is_pow2
 
 # TODO: Rename.
 def fold_sort_generate(
-    query_indices: typing.List[int],
+    query_indices: numpy.ndarray,
     query_indices_range: int,
-    unordered_folded_values: galois.Array,
-):
+    unordered_folded_values: galois.FieldArray,
+) -> typing.Tuple[numpy.ndarray, numpy.ndarray, galois.FieldArray]:
     """This function folds indices, generates check indices used for
     consistency check in the next round of the FRI protocol and orders
     these query indices, check indices and evaluations corresponding
     to these indices in the current round of the FRI protocol.
 
+    Query indices folding to the same index are deduplicated keeping the
+    first of them.
+
     :param query_indices: Current query indices.
-    :type query_indices: typing.List[int]
+    :type query_indices: numpy.ndarray[int]
     :param query_indices_range: New query indices range.
     :type query_indices_range: int
     :param unordered_folded_values: Current unordered evaluations
         corresponding to query indices.
-    :type unordered_folded_values: galois.Array
-    :return: Sorted list of tuples of kind
-        (new query index, check index, evaluation).
-    :rtype: typing.Tuple
+    :type unordered_folded_values: galois.FieldArray
+    :return: Sorted new query indices, check indices and evaluations.
+    :rtype: typing.Tuple[numpy.ndarray, numpy.ndarray, galois.FieldArray]
     """
 
-    # Get array of tuples [(new_query_index, check_index, folded_value)]
-    temp_collected_array = list(
-        # |-Next query index,       |-Check index,              |-Value.
-        # V                         V                           V
-        (ids % query_indices_range, ids // query_indices_range, ufv)
-        for ids, ufv in zip(query_indices, unordered_folded_values)
-    )
-
-    # Sort array of tuples by new query index.
-    temp_sorted_array = sorted(temp_collected_array, key=lambda x: x[0])
-
-    seen = []
-    deduped_array = []
-    for element in temp_sorted_array:
-        if element[0] in seen:
-            continue
+    query_indices = numpy.asarray(query_indices, dtype=numpy.int64)
 
-        seen.append(element[0])
-        deduped_array.append(element)
+    # INFO: Unique returns the first occurrence of every folded index.
+    new_query_indices, first = numpy.unique(
+        query_indices % query_indices_range,
+        return_index=True,
+    )
+    check_indices = query_indices[first] // query_indices_range
 
-    return zip(*deduped_array)
+    return new_query_indices, check_indices, unordered_folded_values[first]
 
 
 def fold_indices(
@@ -72,32 +63,32 @@ def fold_indices(
 
 
 def extend_indices(
-    indices: typing.Iterable[int],
+    indices: numpy.ndarray,
     domain_length: int,
     folding_factor: int,
-) -> typing.List[typing.List[int]]:
+) -> numpy.ndarray:
     """Extend indices to be used for interpolation of stacked evaluations.
 
     :param indices: Indices corresponding to stacked evaluations rows.
-    :type indices: typing.List[int]
+    :type indices: numpy.ndarray[int]
     :param domain_length: Domain length.
     :type domain_length: int
     :param folding_factor: Folding factor.
     :type folding_factor: int
-    :return: Extended indices.
-    :rtype: typing.List[typing.List[int]]
+    :return: Extended indices, one row per index.
+    :rtype: numpy.ndarray[int]
 
     Examples
     --------
 
     .. code:: python
-        assert all([[0, 8], [2, 10]] == extend_indices([0, 2], 8, 2))
+        assert numpy.all([[0, 4], [2, 6]] == extend_indices([0, 2], 8, 2))
     """
 
-    return [
-        [i + j * domain_length // folding_factor for j in range(folding_factor)]
-        for i in indices
-    ]
+    indices = numpy.asarray(indices, dtype=numpy.int64)
+    offsets = numpy.arange(folding_factor) * (domain_length // folding_factor)
+
+    return indices[:, numpy.newaxis] + offsets
 
 
 def fold_polynomial(
@@ -131,6 +122,76 @@ def fold_polynomial(
     return galois.Poly(folded_coefficients, order="asc", field=g.field)
 
 
+def fold_evaluations(
+    stacked_evaluations: galois.FieldArray,
+    randomness: galois.FieldArray,
+    coset_inverses: galois.FieldArray,
+    folding_matrix: galois.FieldArray,
+) -> galois.FieldArray:
+    """Fold stacked evaluations without interpolating the polynomial.
+
+    Row ``i`` holds evaluations of ``g(x) = sum_r x^r g_r(x^k)`` over the
+    coset ``x_i * <zeta>``. The inverse DFT of the row gives
+    ``x_i^r g_r(x_i^k)``, so the folded polynomial ``sum_r randomness^r g_r``
+    at ``x_i^k`` is the sum of the inverse DFT scaled by
+    ``(randomness / x_i)^r``. This is the same folding as in
+    :func:`fold_polynomial`.
+
+    :param stacked_evaluations: Stacked evaluations, one coset per row.
+        Leading axes hold independent instances.
+    :type stacked_evaluations: galois.FieldArray
+    :param randomness: Verifier's randomness, one per instance.
+    :type randomness: galois.FieldArray
+    :param coset_inverses: Inverses of the coset offsets ``x_i``, one per row.
+    :type coset_inverses: galois.FieldArray
+    :param folding_matrix: Scaled inverse DFT matrix ``zeta^(-i * j) / k``.
+    :type folding_matrix: galois.FieldArray
+    :return: Evaluations of the folded polynomial at ``x_i^k``.
+    :rtype: galois.FieldArray
+    """
+
+    folding_factor = folding_matrix.shape[0]
+    assert stacked_evaluations.shape[-1] == folding_factor, "invalid row length"
+    assert (
+        stacked_evaluations.shape[-2] == coset_inverses.size
+    ), "there must be a coset offset for every row"
+
+    field = type(stacked_evaluations)
+    ratios = field(randomness)[..., numpy.newaxis] * coset_inverses
+
+    # INFO: Powers by accumulation are much cheaper than by exponentiation.
+    weights = field.Ones(stacked_evaluations.shape)
+    weights[..., 1:] = ratios[..., numpy.newaxis]
+    weights = numpy.multiply.accumulate(weights, axis=-1)
+
+    return numpy.sum((stacked_evaluations @ folding_matrix.T) * weights, axis=-1)
+
+
+def get_folding_matrix(
+    omega: galois.FieldArray,
+    domain_length: int,
+    folding_factor: int,
+) -> galois.FieldArray:
+    """Get the matrix used by :func:`fold_evaluations`.
+
+    :param omega: Generator of the evaluation domain.
+    :type omega: galois.FieldArray
+    :param domain_length: Evaluation domain length.
+    :type domain_length: int
+    :param folding_factor: Folding factor.
+    :type folding_factor: int
+    :return: Scaled inverse DFT matrix ``zeta^(-i * j) / k`` of the cosets,
+        where ``zeta = omega^(domain_length / k)``.
+    :rtype: galois.FieldArray
+    """
+
+    field = type(omega)
+    zeta_inverse = numpy.reciprocal(omega ** (domain_length // folding_factor))
+    exponents = numpy.outer(numpy.arange(folding_factor), numpy.arange(folding_factor))
+
+    return zeta_inverse**exponents / field(folding_factor)
+
+
 def fold_domain(
     domain: galois.FieldArray,
     folding_factor: int,
@@ -161,6 +222,7 @@ def stack(
     """Stack evaluations.
 
     :param evaluations: Polynomial evaluations over some evaluation domain.
+        Leading axes hold independent instances.
     :type evaluations: galois.Array
     :param folding_factor: Folding factor.
     :type folding_factor: int
@@ -168,4 +230,5 @@ def stack(
     :rtype: galois.Array
     """
 
-    return evaluations.reshape((folding_factor, -1)).swapaxes(0, 1)
+    shape = evaluations.shape[:-1] + (folding_factor, -1)
+    return evaluations.reshape(shape).swapaxes(-1, -2)
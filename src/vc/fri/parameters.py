@@ -2,11 +2,18 @@ import dataclasses
 import logging
 import math
 from time import time_ns
+import typing
 
 import galois
-from numba import njit, prange
+import numpy
 
-from vc.base import is_pow2
+from vc.constants import MERKLE_HASH_SIZE
+from vc.fri.soundness import (
+    CONJECTURED,
+    Soundness,
+    get_number_of_queries,
+    get_soundness,
+)
 from vc.logging import logging_mark
 
 
@@ -18,9 +25,13 @@ class FriParameters:
     """Prover options."""
 
     folding_factor_log: int
-    """Folding factor logarithm."""
+    """Folding factor logarithm of the first round."""
     folding_factor: int
-    """Folding factor."""
+    """Folding factor of the first round."""
+    folding_factor_logs: typing.List[int]
+    """Folding factor logarithm of every fold, including the final one."""
+    folding_factors: typing.List[int]
+    """Folding factor of every fold, including the final one."""
     expansion_factor_log: int
     """Expansion factor logarithm."""
     expansion_factor: int
@@ -35,16 +46,26 @@ class FriParameters:
     """Number of coefficients in final polynomial."""
     initial_evaluation_domain_length: int
     """Length of the initial evaluation domain."""
-    initial_evaluation_domain: galois.FieldArray
-    """Initial evaluation domain."""
+    _initial_evaluation_domain: galois.FieldArray | None
+    """Initial evaluation domain. Computed on first access."""
     security_level_bits: int
     """Security level in bits."""
+    grinding_bits: int
+    """Security bits bought with the prover proof-of-work instead of queries."""
+    soundness_regime: str
+    """Soundness regime the number of queries is computed for."""
     number_of_repetitions: int
     """Number of Verifier checks."""
     number_of_rounds: int
     """Number of FRI rounds."""
+    number_of_committed_rounds: int
+    """Number of rounds committed with Merkle trees, including the first
+    one. Later rounds are sent in full, because they are smaller than the
+    openings of their queries would be."""
     field: type[galois.FieldArray]
     """Field."""
+    soundness: Soundness
+    """Security achieved by the parameters."""
     omega: galois.FieldArray
     """Root of unity for initial domain generation."""
     offset: galois.FieldArray
@@ -53,14 +74,16 @@ class FriParameters:
     def __repr__(self) -> str:
         return f"""
     expansion factor = {self.expansion_factor} (2^{self.expansion_factor_log})
-    folding factor = {self.folding_factor} (2^{self.folding_factor_log})
+    folding factors = {self.folding_factors} (2^{self.folding_factor_logs})
     initial coefficients length = {self.initial_coefficients_length} (2^{self.initial_coefficients_length_log})
     final coefficients length = {self.final_coefficients_length} (2^{self.final_coefficients_length_log})
     initial evaluation domain length = {self.initial_evaluation_domain_length} (2^{math.log2(self.initial_evaluation_domain_length):.0f})
 
     security level = {self.security_level_bits} bits
-    number of rounds = {self.number_of_rounds}
+    grinding = {self.grinding_bits} bits
+    number of rounds = {self.number_of_rounds} ({self.number_of_committed_rounds} committed)
     number of query indices = {self.number_of_repetitions}
+    soundness:{self.soundness}
 """
 
     @logging_mark(logger)
@@ -72,14 +95,30 @@ class FriParameters:
         initial_coefficients_length_log: int,
         final_coefficients_length_log: int,
         field: type[galois.FieldArray],
+        grinding_bits: int = 0,
+        soundness_regime: str = CONJECTURED,
+        folding_schedule: typing.Sequence[int] | None = None,
     ) -> None:
+        """Initialize parameters.
+
+        :param folding_schedule: Folding factor logarithm of every fold,
+            including the final one. Overrides ``folding_factor_log``, and
+            the last fold must be the first one to reach the final
+            coefficients length. Every fold uses ``folding_factor_log``
+            when None, defaults to None.
+        :type folding_schedule: typing.Sequence[int] | None, optional
+        """
+
         assert folding_factor_log > 0, "folding factor log must be at least 1"
         assert expansion_factor_log > 0, "expansion factor log must be at least 1"
+        assert (
+            0 <= grinding_bits < security_level_bits
+        ), "grinding bits must be non-negative and less than the security level"
 
         self.field = field
         self.security_level_bits = security_level_bits
-        self.folding_factor_log = folding_factor_log
-        self.folding_factor = 1 << folding_factor_log
+        self.grinding_bits = grinding_bits
+        self.soundness_regime = soundness_regime
         self.expansion_factor_log = expansion_factor_log
         self.expansion_factor = 1 << expansion_factor_log
         self.initial_coefficients_length_log = initial_coefficients_length_log
@@ -96,67 +135,203 @@ class FriParameters:
             self.initial_evaluation_domain_length
         )
 
-        # WARNING: This call is position dependent.
-        # TODO: Refactor.
-        self.initial_evaluation_domain = FriParameters.get_initial_evaluation_domain(
-            self.field,
-            self.omega,
-            self.offset,
+        # INFO: The domain is only computed when needed, so that parameters
+        #       are cheap to construct when domains come from a FriPlan.
+        #       Verifiers never need it, see get_domain_points.
+        self._initial_evaluation_domain = None
+
+        if folding_schedule is None:
+            folding_schedule = self._get_uniform_folding_schedule(
+                self.initial_coefficients_length_log,
+                self.final_coefficients_length_log,
+                folding_factor_log,
+            )
+
+        self._check_folding_schedule(
+            folding_schedule,
+            self.initial_coefficients_length_log,
+            self.final_coefficients_length_log,
+        )
+
+        self.folding_factor_logs = list(folding_schedule)
+        self.folding_factors = [1 << log for log in self.folding_factor_logs]
+        self.folding_factor_log = self.folding_factor_logs[0]
+        self.folding_factor = self.folding_factors[0]
+
+        # INFO: The last fold gives the final polynomial, which is sent in
+        #       full, so it does not make a round.
+        self.number_of_rounds = len(self.folding_factors) - 1
+
+        # INFO: The proof-of-work adds grinding_bits of security, so queries
+        #       are only needed for the rest.
+        self.number_of_repetitions = get_number_of_queries(
+            self.soundness_regime,
+            self.security_level_bits,
+            self.expansion_factor_log,
+            self.grinding_bits,
+        )
+
+        # INFO: Query indices are distinct, so there cannot be more of them
+        #       than there are rows in the first round.
+        assert (
+            self.number_of_repetitions
+            <= self.initial_evaluation_domain_length // self.folding_factor
+        ), (
+            f"{self.number_of_repetitions} queries do not fit in "
+            + f"{self.initial_evaluation_domain_length // self.folding_factor} "
+            + "first round rows, increase the number of coefficients"
+        )
+
+        self.number_of_committed_rounds = self._get_number_of_committed_rounds()
+
+        self.soundness = get_soundness(
+            self.soundness_regime,
+            self.number_of_repetitions,
+            self.grinding_bits,
+            self.field.order,
+            self.expansion_factor_log,
             self.initial_evaluation_domain_length,
+            self.folding_factors,
         )
 
-        self.number_of_repetitions = self._get_number_of_repetitions(
-            self.security_level_bits, self.expansion_factor_log
+        # INFO: Queries only add to the query phase, so a commit phase below
+        #       the security level is a matter of the field size and the
+        #       domain length, and the parameters are rejected.
+        assert self.soundness.bits >= self.security_level_bits, (
+            f"achieved security is {self.soundness.bits:.1f} bits, "
+            + f"which is less than {self.security_level_bits} bits, "
+            + "use a larger field or a smaller domain"
         )
 
-        self.number_of_rounds = self._get_number_of_rounds(
-            self.initial_coefficients_length,
-            self.final_coefficients_length,
-            self.folding_factor,
+    @property
+    def initial_evaluation_domain(self) -> galois.FieldArray:
+        """Initial evaluation domain."""
+
+        if self._initial_evaluation_domain is None:
+            self._initial_evaluation_domain = (
+                FriParameters.get_initial_evaluation_domain(
+                    self.field,
+                    self.omega,
+                    self.offset,
+                    self.initial_evaluation_domain_length,
+                )
+            )
+
+        return self._initial_evaluation_domain
+
+    def get_domain_scale(self, i: int) -> int:
+        """Get the power the initial evaluation domain is raised to in round
+        ``i``: the product of the folding factors of the previous folds."""
+
+        return 1 << sum(self.folding_factor_logs[:i])
+
+    def get_domain_length(self, i: int) -> int:
+        """Get the length of the evaluation domain of round ``i``."""
+
+        return self.initial_evaluation_domain_length // self.get_domain_scale(i)
+
+    def get_domain_points(
+        self,
+        indices: numpy.ndarray,
+        i: int = 0,
+    ) -> galois.FieldArray:
+        """Get points of the evaluation domain of round ``i`` without computing
+        the domain. The point at index ``j`` is ``offset^s * omega^(j * s)``,
+        where ``s`` is the domain scale of the round, see :meth:`get_domain_scale`.
+
+        :param indices: Indices of the points. Any shape.
+        :type indices: numpy.ndarray[int]
+        :param i: Round, defaults to 0.
+        :type i: int, optional
+        :return: Domain points of the same shape as ``indices``.
+        :rtype: galois.FieldArray
+        """
+
+        scale = self.get_domain_scale(i)
+        exponents = (numpy.asarray(indices, dtype=numpy.int64) * scale) % (
+            self.initial_evaluation_domain_length
         )
 
+        return self.offset**scale * self.omega**exponents
+
+    def is_in_domain(self, x: galois.FieldArray, i: int = 0) -> bool:
+        """Check that ``x`` is a point of the evaluation domain of round ``i``."""
+
+        scale = self.get_domain_scale(i)
+        return bool((x / self.offset**scale) ** self.get_domain_length(i) == 1)
+
+    def is_committed(self, i: int) -> bool:
+        """Check that round ``i`` is committed with a Merkle tree rather than
+        sent in full."""
+
+        return i < self.number_of_committed_rounds
+
+    def _get_number_of_committed_rounds(self) -> int:
+        """Commit rounds until the first one cheaper to send in full than to
+        open at the expected number of distinct queries. The first round is
+        always committed, since it is the commitment to the polynomial."""
+
+        element_size = math.ceil(self.field.order.bit_length() / 8)
+        for i in range(1, self.number_of_rounds + 1):
+            k = self.folding_factors[i]
+            number_of_rows = self.get_domain_length(i) // k
+
+            # INFO: Queries are uniform, so some of them fall on the same row.
+            opened_rows = number_of_rows * (
+                1 - (1 - 1 / number_of_rows) ** self.number_of_repetitions
+            )
+            opening_size = MERKLE_HASH_SIZE + opened_rows * (
+                k * element_size + math.log2(number_of_rows) * MERKLE_HASH_SIZE
+            )
+            if number_of_rows * k * element_size <= opening_size:
+                return i
+
+        return self.number_of_rounds + 1
+
     @staticmethod
-    def _get_number_of_repetitions(
-        security_level_bits: int,
-        expansion_factor_log: int,
-    ) -> int:
-        quotient = security_level_bits / expansion_factor_log
-        return math.ceil(quotient)
+    def _get_uniform_folding_schedule(
+        initial_coefficients_length_log: int,
+        final_coefficients_length_log: int,
+        folding_factor_log: int,
+    ) -> typing.List[int]:
+        """Fold with the same factor until the final coefficients length is reached."""
+
+        current_coefficients_length_log = initial_coefficients_length_log
+        schedule: typing.List[int] = []
+        while final_coefficients_length_log < current_coefficients_length_log:
+            current_coefficients_length_log -= folding_factor_log
+            schedule.append(folding_factor_log)
+
+        return schedule
 
     @staticmethod
-    def _get_number_of_rounds(
-        initial_coefficients_length,
-        final_coefficients_length,
-        folding_factor,
-    ) -> int:
-        assert is_pow2(
-            initial_coefficients_length
-        ), "initial coefficients length must be a power of two"
-        assert is_pow2(
-            final_coefficients_length
-        ), "final coefficients length must be a power of two"
-        assert is_pow2(folding_factor), "folding factor must be a power of two"
-
-        current_coefficients_length = initial_coefficients_length
-        accumulator: int = 0
-        while final_coefficients_length < current_coefficients_length:
-            current_coefficients_length //= folding_factor
-            accumulator += 1
-
-        # This is done in the STIR codebase. Not sure, why exactly.
-        # Probably this is needed there because the initial round is out of the "rounds loop".
-        # Or maybe because the last round does not need the proof. This is my use-case.
-        accumulator -= 1
-
-        return accumulator
+    def _check_folding_schedule(
+        folding_schedule: typing.Sequence[int],
+        initial_coefficients_length_log: int,
+        final_coefficients_length_log: int,
+    ) -> None:
+        assert len(folding_schedule) > 0, (
+            "initial coefficients length must be greater than the final one"
+        )
+        assert all(
+            log > 0 for log in folding_schedule
+        ), "folding factor logs must be at least 1"
+
+        # INFO: Every fold but the last one must leave more coefficients than
+        #       the final polynomial has, so that no round is wasted.
+        folded_log = sum(folding_schedule[:-1])
+        assert (
+            initial_coefficients_length_log - folded_log
+            > final_coefficients_length_log
+            >= initial_coefficients_length_log - folded_log - folding_schedule[-1]
+        ), "folding schedule must reach the final coefficients length in its last fold"
 
     @logging_mark(logger)
     @staticmethod
-    # @njit(parallel=True)
     def get_initial_evaluation_domain(
         field: type[galois.FieldArray],
         omega: galois.FieldArray,
         offset: galois.FieldArray,
         length: int,
     ) -> galois.FieldArray:
-        return field([offset * (omega**i) for i in range(length)])
+        return offset * omega ** numpy.arange(length)
@@ -0,0 +1,333 @@
+"""FRI polynomial commitment scheme.
+
+Polynomials are committed once in a single Merkle tree, a leaf holding the
+stacked evaluations of every polynomial for the same row, as in batch FRI.
+An opening proves the values of all the committed polynomials at several
+points with a single FRI proof for the combined quotient
+
+    sum_(i, j) alpha^(i * p + j) (f_i(x) - f_i(z_j)) / (x - z_j),
+
+where ``p`` is the number of points. The quotient is of low degree only if
+every value is correct, and its opened rows are checked against the opened
+rows of the commitment. The committed polynomials may be opened any number
+of times, every opening costs one FRI proof however many values it proves.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import pickle
+import typing
+
+import galois
+import numpy
+import pymerkle
+
+from vc.fri.fold import extend_indices, stack
+from vc.fri.parameters import FriParameters
+from vc.fri.plan import FriPlan
+from vc.fri.proof import FriProof
+from vc.fri.prover import FriProver
+from vc.fri.verifier import FriVerifier
+from vc.logging import logging_mark
+from vc.merkle import MerkleTree
+from vc.sponge import Sponge
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(slots=True)
+class PcsCommitment:
+    merkle_root: bytes
+    number_of_polynomials: int
+
+
+@dataclasses.dataclass(slots=True)
+class PcsCommittedPolynomials:
+    """Prover data of a commitment. Kept by the prover between openings."""
+
+    commitment: PcsCommitment
+    """Commitment to be sent to the verifier."""
+    polynomials: typing.List[galois.Poly]
+    stacked_evaluations: galois.FieldArray
+    """Stacked evaluations of all the polynomials one after another."""
+    merkle_tree: MerkleTree
+
+
+@dataclasses.dataclass(slots=True)
+class PcsOpeningProof:
+    fri_proof: FriProof
+    """Proof for the combined quotient."""
+    stacked_evaluations: galois.FieldArray
+    """Rows of the commitment at the first round FRI queries."""
+    merkle_proofs: typing.List[pymerkle.MerkleProof]
+
+    def serialize(self) -> bytes:
+        return pickle.dumps(self)
+
+
+def _squeeze_weights(
+    sponge: Sponge,
+    commitment: PcsCommitment,
+    points: galois.FieldArray,
+    values: galois.FieldArray,
+) -> galois.FieldArray:
+    """Absorb the opening claim and squeeze the weights of the combined
+    quotient. Weights are powers of a single randomness, so there is one
+    squeeze however many values are opened.
+
+    :return: Weight of every value, of the same shape as ``values``.
+    :rtype: galois.FieldArray
+    """
+
+    sponge.absorb(commitment.merkle_root)
+    sponge.absorb([points.tolist(), values.tolist()])
+    alpha = sponge.squeeze_field_element()
+
+    field = type(points)
+    weights = field.Ones(values.size)
+    weights[1:] = alpha
+    return numpy.multiply.accumulate(weights).reshape(values.shape)
+
+
+@dataclasses.dataclass(init=False, slots=True)
+class FriPcsProver:
+    """FRI PCS Prover."""
+
+    _parameters: FriParameters
+    _fri_prover: FriProver
+    """Prover for the combined quotients."""
+
+    def __init__(
+        self,
+        parameters: FriParameters,
+        plan: FriPlan | None = None,
+    ) -> None:
+        """Initialize new Prover.
+
+        :param parameters: FRI parameters. Committed polynomials have at
+            most the initial coefficients length coefficients.
+        :type parameters: FriParameters
+        :param plan: Plan built for the same parameters. A new plan is built
+            when None, defaults to None.
+        :type plan: FriPlan | None, optional
+        """
+
+        self._parameters = parameters
+        self._fri_prover = FriProver(parameters, plan)
+
+    @property
+    def plan(self) -> FriPlan:
+        return self._fri_prover.plan
+
+    @logging_mark(logger)
+    def commit(self, fs: typing.List[galois.Poly]) -> PcsCommittedPolynomials:
+        """Commit to polynomials.
+
+        :param fs: Polynomials to commit to.
+        :type fs: typing.List[galois.Poly]
+        :return: Prover data. Its commitment is to be sent to the verifier.
+        :rtype: PcsCommittedPolynomials
+        """
+
+        assert len(fs) > 0, "there must be at least one polynomial"
+        for f in fs:
+            assert (
+                f.degree < self._parameters.initial_coefficients_length
+            ), "polynomial has too many coefficients"
+
+        stacked_evaluations = numpy.concatenate(
+            [
+                stack(self.plan.evaluate(f, 0), self._parameters.folding_factor)
+                for f in fs
+            ],
+            axis=1,
+        )
+
+        merkle_tree = MerkleTree()
+        merkle_tree.append_bulk(stacked_evaluations)
+
+        return PcsCommittedPolynomials(
+            commitment=PcsCommitment(merkle_tree.get_root(), len(fs)),
+            polynomials=fs,
+            stacked_evaluations=stacked_evaluations,
+            merkle_tree=merkle_tree,
+        )
+
+    @logging_mark(logger)
+    def open(
+        self,
+        committed: PcsCommittedPolynomials,
+        points: galois.FieldArray,
+        sponge: Sponge | None = None,
+    ) -> typing.Tuple[galois.FieldArray, PcsOpeningProof]:
+        """Open every committed polynomial at every point.
+        The prover is not modified, so it can be used from multiple threads.
+
+        :param committed: Prover data from :meth:`commit`.
+        :type committed: PcsCommittedPolynomials
+        :param points: Points to open at. None of them may be a point of the
+            evaluation domain.
+        :type points: galois.FieldArray
+        :param sponge: Sponge with the transcript so far. A new sponge when
+            None, defaults to None.
+        :type sponge: Sponge | None, optional
+        :return: Values with a row per polynomial and a column per point,
+            and a proof for them.
+        :rtype: typing.Tuple[galois.FieldArray, PcsOpeningProof]
+        """
+
+        field = self._parameters.field
+        points = field(numpy.atleast_1d(points))
+        assert points.size > 0, "there must be at least one point"
+        assert not any(
+            self._parameters.is_in_domain(z) for z in points
+        ), "points must not be points of the evaluation domain"
+
+        sponge = Sponge(field) if sponge is None else sponge
+        values = field([f(points) for f in committed.polynomials])
+        weights = _squeeze_weights(sponge, committed.commitment, points, values)
+
+        # INFO: Quotients by the same point are summed before the division,
+        #       so there is a single division for every point.
+        x = galois.Poly.Identity(field=field)
+        quotient = galois.Poly.Zero(field=field)
+        for j, z in enumerate(points):
+            numerator = galois.Poly.Zero(field=field)
+            for i, f in enumerate(committed.polynomials):
+                numerator += (f - values[i, j]) * weights[i, j]
+
+            quotient += numerator // (x - z)
+
+        fri_proof = self._fri_prover.prove(quotient, sponge)
+        indices = fri_proof.round_proofs[0].indices
+
+        return values, PcsOpeningProof(
+            fri_proof=fri_proof,
+            stacked_evaluations=committed.stacked_evaluations[indices],
+            merkle_proofs=committed.merkle_tree.prove_bulk(indices),
+        )
+
+
+@dataclasses.dataclass(init=False, slots=True)
+class FriPcsVerifier:
+    """FRI PCS Verifier."""
+
+    _parameters: FriParameters
+    _fri_verifier: FriVerifier
+
+    def __init__(
+        self,
+        parameters: FriParameters,
+        plan: FriPlan | None = None,
+    ) -> None:
+        """Initialize new Verifier.
+
+        :param parameters: FRI parameters.
+        :type parameters: FriParameters
+        :param plan: Plan built for the same parameters, defaults to None.
+        :type plan: FriPlan | None, optional
+        """
+
+        self._parameters = parameters
+        self._fri_verifier = FriVerifier(parameters, plan)
+
+    @logging_mark(logger)
+    def verify_opening(
+        self,
+        commitment: PcsCommitment,
+        points: galois.FieldArray,
+        values: galois.FieldArray,
+        proof: PcsOpeningProof,
+        sponge: Sponge | None = None,
+    ) -> bool:
+        """Verify that the committed polynomials have the values at the points.
+        The verifier is not modified, so it can be used from multiple threads.
+
+        :param commitment: Commitment to the polynomials.
+        :type commitment: PcsCommitment
+        :param points: Points the polynomials are opened at.
+        :type points: galois.FieldArray
+        :param values: Values with a row per polynomial and a column per point.
+        :type values: galois.FieldArray
+        :param proof: Opening proof.
+        :type proof: PcsOpeningProof
+        :param sponge: Sponge with the transcript so far. A new sponge when
+            None, defaults to None.
+        :type sponge: Sponge | None, optional
+        :return: ``True`` if ``proof`` is valid. ``False`` otherwise.
+        :rtype: bool
+        """
+
+        parameters = self._parameters
+        field = parameters.field
+        points = field(numpy.atleast_1d(points))
+        k = parameters.folding_factor
+
+        if points.size == 0 or values.shape != (
+            commitment.number_of_polynomials,
+            points.size,
+        ):
+            logger.error(f"invalid number of values")
+            return False
+
+        if any(parameters.is_in_domain(z) for z in points):
+            logger.error(f"points of the evaluation domain cannot be opened")
+            return False
+
+        # INFO: The correction multiplies the quotient by a polynomial of
+        #       as many coefficients, so the quotient has at most the initial
+        #       coefficients length less this number. The quotients by the
+        #       points have one coefficient less than the polynomials, so
+        #       this bounds the polynomials by the initial coefficients length.
+        if proof.fri_proof.degree_correction_length < 2:
+            logger.error(f"invalid degree correction length")
+            return False
+
+        sponge = Sponge(field) if sponge is None else sponge
+        weights = _squeeze_weights(sponge, commitment, points, values)
+
+        if not self._fri_verifier.verify(proof.fri_proof, sponge):
+            logger.error(f"invalid combined quotient proof")
+            return False
+
+        # INFO: The FRI verifier checked these are the query indices it
+        #       squeezed, so the rows are opened where the prover cannot choose.
+        indices = proof.fri_proof.round_proofs[0].indices
+        if (
+            proof.stacked_evaluations.shape
+            != (indices.size, commitment.number_of_polynomials * k)
+            or len(proof.merkle_proofs) != indices.size
+            or not MerkleTree.verify_bulk(
+                proof.stacked_evaluations,
+                commitment.merkle_root,
+                proof.merkle_proofs,
+                indices,
+                parameters.initial_evaluation_domain_length // k,
+            )
+        ):
+            logger.error(f"invalid merkle tree proofs")
+            return False
+
+        xs = parameters.get_domain_points(
+            extend_indices(indices, parameters.initial_evaluation_domain_length, k)
+        )
+
+        quotient = field.Zeros(xs.shape)
+        for j, z in enumerate(points):
+            numerator = field.Zeros(xs.shape)
+            for i in range(commitment.number_of_polynomials):
+                rows = proof.stacked_evaluations[:, i * k : (i + 1) * k]
+                numerator += (rows - values[i, j]) * weights[i, j]
+
+            quotient += numerator / (xs - z)
+
+        if not numpy.all(
+            quotient == proof.fri_proof.round_proofs[0].stacked_evaluations
+        ):
+            logger.error(f"combined quotient check failed")
+            return False
+
+        return True
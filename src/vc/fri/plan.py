@@ -0,0 +1,271 @@
+"""Reusable FRI plan.
+
+A plan holds everything FRI computes from the parameters alone: evaluation
+domains of all the rounds, NTT twiddles and folding constants. It is built
+once per parameter set and shared by all the proofs with these parameters.
+
+Plans can be saved to a directory of ``.npy`` files and loaded back
+memory-mapped, so that worker processes share a single copy of the plan.
+Arrays are mapped without copying when galois stores the field elements as
+machine integers. Fields galois computes over in pure Python (like
+Goldilocks) store the elements as Python integers, so their arrays are
+converted on load.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import os
+import typing
+
+import galois
+import numpy
+
+from vc.fri.fold import get_folding_matrix
+from vc.fri.parameters import FriParameters
+from vc.logging import logging_mark
+from vc.ntt import evaluate_many_on_coset, evaluate_on_coset, get_twiddles
+
+
+logger = logging.getLogger(__name__)
+
+PARAMETERS_FILE_NAME = "parameters.json"
+
+
+def _freeze(array: galois.FieldArray) -> galois.FieldArray:
+    array.flags.writeable = False
+    return array
+
+
+def _save_array(path: str, array: galois.FieldArray) -> None:
+    data = array.view(numpy.ndarray)
+    if data.dtype == numpy.object_:
+        # INFO: Python integers cannot be memory-mapped.
+        data = data.astype(numpy.uint64)
+
+    numpy.save(path, data)
+
+
+def _load_array(
+    path: str,
+    field: type[galois.FieldArray],
+    mmap: bool,
+) -> galois.FieldArray:
+    data = numpy.load(path, mmap_mode="r" if mmap else None)
+    if data.dtype in field.dtypes:
+        return _freeze(data.view(field))
+
+    return _freeze(field(data.astype(numpy.object_)))
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class FriPlan:
+    """Precomputed FRI data. Arrays are read-only."""
+
+    parameters: FriParameters
+    """Parameters the plan is built for."""
+    domains: typing.List[galois.FieldArray]
+    """Evaluation domains of every round and of the final polynomial."""
+    coset_inverses: typing.List[galois.FieldArray]
+    """Inverses of the coset offsets of every round.
+    Row ``i`` of stacked evaluations are evaluations over the coset
+    ``domain[i] * <zeta>``, where ``zeta`` is a primitive root of unity
+    of order equal to the folding factor."""
+    twiddles: galois.FieldArray
+    """NTT twiddles of the initial evaluation domain."""
+    inverse_twiddles: galois.FieldArray
+    """Inverse NTT twiddles of the initial evaluation domain."""
+    folding_matrices: typing.List[galois.FieldArray]
+    """Scaled inverse DFT matrix of the cosets of every fold:
+    ``zeta^(-i * j) / folding factor``. Folds with the same folding factor
+    share the matrix."""
+
+    def is_built_for(self, parameters: FriParameters) -> bool:
+        """Check that the plan is built for parameters with the same field,
+        evaluation domains and folding schedule as ``parameters``. Security
+        parameters do not change the plan, so they may differ.
+
+        :param parameters: FRI parameters.
+        :type parameters: FriParameters
+        :return: ``True`` if the plan can be used with ``parameters``.
+            ``False`` otherwise.
+        :rtype: bool
+        """
+
+        n = parameters.initial_evaluation_domain_length
+        return (
+            self.parameters.field.order == parameters.field.order
+            and self.parameters.initial_evaluation_domain_length == n
+            and self.parameters.folding_factor_logs == parameters.folding_factor_logs
+            and int(self.parameters.offset) == int(parameters.offset)
+            and int(self.parameters.omega) == int(parameters.omega)
+            and len(self.domains) == parameters.number_of_rounds + 2
+            and self.domains[0].size == n
+            and int(self.domains[0][0]) == int(parameters.offset)
+        )
+
+    @property
+    def folding_matrix(self) -> galois.FieldArray:
+        """Folding matrix of the first fold."""
+
+        return self.folding_matrices[0]
+
+    @staticmethod
+    @logging_mark(logger)
+    def from_parameters(parameters: FriParameters) -> FriPlan:
+        """Build a plan.
+
+        :param parameters: FRI parameters.
+        :type parameters: FriParameters
+        :return: Plan for the parameters.
+        :rtype: FriPlan
+        """
+
+        folding_factors = parameters.folding_factors
+
+        domains = [parameters.initial_evaluation_domain]
+        for folding_factor in folding_factors:
+            previous = domains[-1]
+            domains.append(previous[: previous.size // folding_factor] ** folding_factor)
+
+        coset_inverses = [
+            numpy.reciprocal(domain[: domain.size // folding_factor])
+            for domain, folding_factor in zip(domains[:-1], folding_factors)
+        ]
+
+        n = parameters.initial_evaluation_domain_length
+        matrices = {
+            folding_factor: _freeze(
+                get_folding_matrix(parameters.omega, n, folding_factor)
+            )
+            for folding_factor in set(folding_factors)
+        }
+
+        return FriPlan(
+            parameters=parameters,
+            domains=[_freeze(domain.copy()) for domain in domains],
+            coset_inverses=[_freeze(ci) for ci in coset_inverses],
+            twiddles=_freeze(get_twiddles(parameters.omega, n)),
+            inverse_twiddles=_freeze(
+                get_twiddles(numpy.reciprocal(parameters.omega), n),
+            ),
+            folding_matrices=[
+                matrices[folding_factor] for folding_factor in folding_factors
+            ],
+        )
+
+    def get_twiddles(self, i: int) -> galois.FieldArray:
+        """Get NTT twiddles of the evaluation domain of round ``i``."""
+
+        return self.twiddles[:: self.parameters.get_domain_scale(i)]
+
+    def get_inverse_twiddles(self, i: int) -> galois.FieldArray:
+        """Get inverse NTT twiddles of the evaluation domain of round ``i``."""
+
+        return self.inverse_twiddles[:: self.parameters.get_domain_scale(i)]
+
+    def evaluate(self, g: galois.Poly, i: int) -> galois.FieldArray:
+        """Evaluate a polynomial over the evaluation domain of round ``i``.
+
+        :param g: Polynomial of degree less than the domain length.
+        :type g: galois.Poly
+        :param i: Round.
+        :type i: int
+        :return: Evaluations in the order of the domain.
+        :rtype: galois.FieldArray
+        """
+
+        domain = self.domains[i]
+        return evaluate_on_coset(g, domain[0], self.get_twiddles(i), domain.size)
+
+    def evaluate_many(
+        self,
+        gs: typing.Sequence[galois.Poly],
+        i: int,
+    ) -> galois.FieldArray:
+        """Evaluate polynomials over the evaluation domain of round ``i``.
+
+        :param gs: Polynomials of degree less than the domain length.
+        :type gs: typing.Sequence[galois.Poly]
+        :param i: Round.
+        :type i: int
+        :return: Evaluations of polynomial ``gs[j]`` in row ``j``.
+        :rtype: galois.FieldArray
+        """
+
+        domain = self.domains[i]
+        return evaluate_many_on_coset(gs, domain[0], self.get_twiddles(i), domain.size)
+
+    def save(self, directory: str) -> None:
+        """Save the plan as a directory of ``.npy`` files.
+
+        :param directory: Directory to save the plan to. Created if missing.
+        :type directory: str
+        """
+
+        os.makedirs(directory, exist_ok=True)
+
+        parameters = {
+            "folding_factor_log": self.parameters.folding_factor_log,
+            "expansion_factor_log": self.parameters.expansion_factor_log,
+            "security_level_bits": self.parameters.security_level_bits,
+            "grinding_bits": self.parameters.grinding_bits,
+            "soundness_regime": self.parameters.soundness_regime,
+            "initial_coefficients_length_log": self.parameters.initial_coefficients_length_log,
+            "final_coefficients_length_log": self.parameters.final_coefficients_length_log,
+            "folding_schedule": self.parameters.folding_factor_logs,
+            "field_order": self.parameters.field.order,
+        }
+        with open(os.path.join(directory, PARAMETERS_FILE_NAME), "w") as file:
+            json.dump(parameters, file)
+
+        for i, domain in enumerate(self.domains):
+            _save_array(os.path.join(directory, f"domain_{i}.npy"), domain)
+        for i, coset_inverses in enumerate(self.coset_inverses):
+            _save_array(os.path.join(directory, f"coset_inverses_{i}.npy"), coset_inverses)
+
+        _save_array(os.path.join(directory, "twiddles.npy"), self.twiddles)
+        _save_array(os.path.join(directory, "inverse_twiddles.npy"), self.inverse_twiddles)
+        for i, folding_matrix in enumerate(self.folding_matrices):
+            _save_array(os.path.join(directory, f"folding_matrix_{i}.npy"), folding_matrix)
+
+    @staticmethod
+    @logging_mark(logger)
+    def load(directory: str, mmap: bool = True) -> FriPlan:
+        """Load a plan saved with :meth:`save`.
+
+        :param directory: Directory the plan was saved to.
+        :type directory: str
+        :param mmap: Memory-map the arrays instead of reading them, defaults to True.
+        :type mmap: bool, optional
+        :return: Loaded plan.
+        :rtype: FriPlan
+        """
+
+        with open(os.path.join(directory, PARAMETERS_FILE_NAME), "r") as file:
+            saved = json.load(file)
+
+        field = galois.GF(saved.pop("field_order"))
+        parameters = FriParameters(field=field, **saved)
+
+        def load(name: str) -> galois.FieldArray:
+            return _load_array(os.path.join(directory, name), field, mmap)
+
+        return FriPlan(
+            parameters=parameters,
+            domains=[
+                load(f"domain_{i}.npy") for i in range(parameters.number_of_rounds + 2)
+            ],
+            coset_inverses=[
+                load(f"coset_inverses_{i}.npy")
+                for i in range(parameters.number_of_rounds + 1)
+            ],
+            twiddles=load("twiddles.npy"),
+            inverse_twiddles=load("inverse_twiddles.npy"),
+            folding_matrices=[
+                load(f"folding_matrix_{i}.npy")
+                for i in range(parameters.number_of_rounds + 1)
+            ],
+        )
@@ -25,7 +25,12 @@ class FriProof:
     round_proofs: typing.List[RoundProof]
     merkle_roots: typing.List[bytes]
     final_polynomial: galois.Poly
-    degree_correction_polynomial: galois.Poly
+    degree_correction_length: int
+    """Number of coefficients of the degree correction polynomial. Its
+    randomness is derived from the transcript."""
+    proof_of_work_nonce: int = 0
+    """Nonce absorbed before the query indices are squeezed. Zero when there
+    is no grinding."""
 
     def serialize(self) -> bytes:
         return pickle.dumps(self)
@@ -6,14 +6,17 @@ from time import time, time_ns
 import typing
 
 import galois
+import numpy
 
-from vc.fri.fold import fold_domain, fold_indices, fold_polynomial, stack
+from vc.fri.fold import fold_evaluations, fold_indices, fold_polynomial, stack
 from vc.fri.proof import FriProof, RoundProof
 from vc.logging import current_value, logging_mark
-from vc.polynomial import expand_ext
+from vc.polynomial import evaluate_degree_correction, expand_ext
 from vc.sponge import Sponge
-from vc.merkle import MerkleTree
+from vc.merkle import MerkleTree, hash_rows
+from vc.ntt import interpolate_many_on_coset
 from vc.fri.parameters import FriParameters
+from vc.fri.plan import FriPlan
 
 
 logger = logging.getLogger(__name__)
@@ -25,16 +28,10 @@ class FriProver:
 
     @dataclasses.dataclass(init=False, slots=True)
     class State:
-        """Current prover state."""
-
-        evaluation_domain: galois.FieldArray
-        """Current evaluation domain."""
-        omega: galois.FieldArray
-        """Current domain generator. This is a root of unity."""
-        offset: galois.FieldArray
-        """Domain offset. This is typically F* generator."""
-        polynomial: galois.Poly
-        """Current polynomial."""
+        """State of a single proof. Created by every call to :meth:`FriProver.prove`."""
+
+        polynomial: galois.Poly | None
+        """Current polynomial. Not used when folding evaluations."""
         sponge: Sponge
         """Proof stream to be filled."""
         merkle_trees: typing.List[MerkleTree]
@@ -43,10 +40,12 @@ class FriProver:
         """Evaluations of the current polynomial over current domain."""
         merkle_roots: typing.List[bytes]
         """Merkle root of current evaluations."""
+        proof_of_work_nonce: int
+        """Nonce found before the query phase."""
 
         def __init__(
             self,
-            f: galois.Poly,
+            f: galois.Poly | None,
             options: FriParameters,
             sponge: Sponge | None = None,
         ) -> None:
@@ -56,93 +55,373 @@ class FriProver:
             # ), "number of coefficients in polynomial must be a power of two"
 
             self.polynomial = f
-            field: type[galois.FieldArray] = f.field
+            field: type[galois.FieldArray] = options.field
 
-            self.omega = options.omega
-            self.offset = options.offset
-            self.evaluation_domain = options.initial_evaluation_domain
             self.sponge = Sponge(field) if sponge is None else sponge
             self.merkle_trees = []
             self.merkle_roots = []
             self.evaluations = []
+            self.proof_of_work_nonce = 0
 
     _parameters: FriParameters
     """Public Prover options."""
-    _state: FriProver.State | None
-    """Internal Prover state."""
-
-    def __init__(self, parameters: FriParameters) -> None:
+    _plan: FriPlan
+    """Precomputed domains and constants."""
+    _evaluation_form: bool
+    """Fold evaluations instead of polynomial coefficients."""
+
+    def __init__(
+        self,
+        parameters: FriParameters,
+        plan: FriPlan | None = None,
+        evaluation_form: bool = True,
+    ) -> None:
         """Initialize new Prover.
 
         :param options: Public prover options.
+        :param plan: Plan built for the same parameters. A new plan is built
+            when None, defaults to None.
+        :type plan: FriPlan | None, optional
+        :param evaluation_form: Fold the evaluations of every round directly,
+            O(N) per round. Otherwise fold polynomial coefficients and
+            evaluate the folded polynomial anew every round. Both produce
+            the same proofs, defaults to True.
+        :type evaluation_form: bool, optional
         """
 
         assert parameters is not None, "options cannot be None"
+        assert plan is None or plan.is_built_for(
+            parameters
+        ), "plan must be built for the same parameters"
 
         self._parameters = parameters
-        self._state = None
+        self._plan = plan if plan is not None else FriPlan.from_parameters(parameters)
+        self._evaluation_form = evaluation_form
+
+    @property
+    def plan(self) -> FriPlan:
+        return self._plan
 
     @logging_mark(logger)
     def prove(self, f: galois.Poly, sponge: Sponge | None = None) -> FriProof:
         """Prover that polynomial f is close to RS-code.
+        The prover is not modified, so it can be used from multiple threads.
 
         :param f: Polynomial to be proven.
         """
 
-        self._state = FriProver.State(f, self._parameters, sponge)
+        if self._evaluation_form:
+            return self.prove_many([f], [sponge])[0]
+
+        state = FriProver.State(f, self._parameters, sponge)
 
         logger.debug(f"begin initial domain evaluation")
         begin = time_ns()
-        initial_round_evaluations: galois.FieldArray = self._state.polynomial(
-            self._state.evaluation_domain
+        initial_round_evaluations = self._plan.evaluate(state.polynomial, 0)
+        end = time_ns()
+        logger.debug(
+            f"end initial domain evaluation. elapsed: {(end - begin) // 1_000_000} ms"
         )
+
+        # This is an initial commitment basically.
+        self.commit(
+            state,
+            stack(initial_round_evaluations, self._parameters.folding_factor),
+        )
+
+        # Transform f to g that has pow2 coefficients.
+        randomness = state.sponge.squeeze_field_element()
+        logger.debug(current_value("randomness", randomness))
+
+        g, _ = expand_ext(
+            f,
+            randomness,
+            self._parameters.initial_coefficients_length,
+        )
+
+        final_polynomial = self._commit_phase_coefficients(state, g)
+
+        return FriProof(
+            self.query_phase(state),
+            state.merkle_roots,
+            final_polynomial,
+            self._get_degree_correction_length(f),
+            state.proof_of_work_nonce,
+        )
+
+    @logging_mark(logger)
+    def prove_many(
+        self,
+        fs: typing.List[galois.Poly],
+        sponges: typing.List[Sponge | None] | None = None,
+    ) -> typing.List[FriProof]:
+        """Prove many polynomials in lockstep. Every round is done for all
+        the polynomials at once over 2D arrays, which amortizes the Python
+        overhead of the rounds. Every proof has its own transcript and is
+        the same as the proof made by :meth:`prove`.
+
+        :param fs: Polynomials to be proven.
+        :type fs: typing.List[galois.Poly]
+        :param sponges: Sponge for every proof. New sponges when None,
+            defaults to None.
+        :type sponges: typing.List[Sponge | None] | None, optional
+        :return: Proof for every polynomial.
+        :rtype: typing.List[FriProof]
+        """
+
+        if sponges is None:
+            sponges = [None] * len(fs)
+
+        assert len(sponges) == len(fs), "there must be a sponge for every polynomial"
+
+        if not self._evaluation_form:
+            return [self.prove(f, sponge) for f, sponge in zip(fs, sponges)]
+
+        states = [
+            FriProver.State(f, self._parameters, sponge)
+            for f, sponge in zip(fs, sponges)
+        ]
+
+        logger.debug(f"begin initial domain evaluation")
+        begin = time_ns()
+        initial_round_evaluations = self._plan.evaluate_many(fs, 0)
         end = time_ns()
         logger.debug(
             f"end initial domain evaluation. elapsed: {(end - begin) // 1_000_000} ms"
         )
 
+        # This is an initial commitment basically.
         stacked_evaluations = stack(
             initial_round_evaluations,
             self._parameters.folding_factor,
         )
-        self._state.evaluations.append(stacked_evaluations)
+        for state, se in zip(states, stacked_evaluations):
+            self.commit(state, se)
+
+        # INFO: The verifier derives the randomness from the transcript, so
+        #       only the length of the degree correction polynomial is sent.
+        degree_correction_lengths = [self._get_degree_correction_length(f) for f in fs]
+
+        # Transform f to g that has pow2 coefficients.
+        corrections = self._parameters.field.Zeros(initial_round_evaluations.shape)
+        for state, correction, degree_correction_length in zip(
+            states,
+            corrections,
+            degree_correction_lengths,
+        ):
+            randomness = state.sponge.squeeze_field_element()
+            logger.debug(current_value("randomness", randomness))
+
+            correction[:] = evaluate_degree_correction(
+                randomness,
+                degree_correction_length,
+                self._plan.domains[0],
+            )
+
+        final_polynomials = self._commit_phase_many(
+            states,
+            stack(
+                initial_round_evaluations * corrections,
+                self._parameters.folding_factor,
+            ),
+        )
+
+        return [
+            FriProof(
+                self.query_phase(state),
+                state.merkle_roots,
+                final_polynomial,
+                degree_correction_length,
+                state.proof_of_work_nonce,
+            )
+            for state, final_polynomial, degree_correction_length in zip(
+                states,
+                final_polynomials,
+                degree_correction_lengths,
+            )
+        ]
+
+    def _get_degree_correction_length(self, f: galois.Poly) -> int:
+        degree_correction_length = (
+            self._parameters.initial_coefficients_length - f.degree
+        )
+        assert degree_correction_length > 0, "polynomial has too many coefficients"
+
+        return degree_correction_length
+
+    def commit(
+        self,
+        state: FriProver.State,
+        stacked_evaluations: galois.FieldArray,
+    ) -> None:
+        """Commit to the stacked evaluations of a round. Together with
+        :meth:`commit_phase` and :meth:`query_phase` this makes a proof for
+        protocols which commit to their own first round, such as
+        :class:`vc.fri.batch.BatchFriProver`.
+
+        :param state: Proof state.
+        :type state: FriProver.State
+        :param stacked_evaluations: Stacked evaluations of the round.
+        :type stacked_evaluations: galois.FieldArray
+        """
+
+        state.evaluations.append(stacked_evaluations)
 
-        # This is an initial commitment basically.
         merkle_tree = MerkleTree()
         merkle_tree.append_bulk(stacked_evaluations)
         merkle_root = merkle_tree.get_root()
 
-        self._state.sponge.absorb(merkle_root)
-        self._state.merkle_roots.append(merkle_root)
-        self._state.merkle_trees.append(merkle_tree)
+        state.sponge.absorb(merkle_root)
+        state.merkle_roots.append(merkle_root)
+        state.merkle_trees.append(merkle_tree)
+
+    def _send(
+        self,
+        state: FriProver.State,
+        stacked_evaluations: galois.FieldArray,
+    ) -> None:
+        """Send the stacked evaluations of a round in full."""
+
+        state.evaluations.append(stacked_evaluations)
+
+        # INFO: The hash of the whole round takes the place of the Merkle root.
+        state.sponge.absorb(hash_rows(stacked_evaluations))
+
+    def _commit_or_send(
+        self,
+        state: FriProver.State,
+        stacked_evaluations: galois.FieldArray,
+        i: int,
+    ) -> None:
+        """Commit to the stacked evaluations of round ``i``, or send them in
+        full if the round is not committed."""
+
+        if self._parameters.is_committed(i):
+            self.commit(state, stacked_evaluations)
+        else:
+            self._send(state, stacked_evaluations)
+
+    def _fold(
+        self,
+        stacked_evaluations: galois.FieldArray,
+        randomness: galois.FieldArray,
+        i: int,
+    ) -> galois.FieldArray:
+        """Fold stacked evaluations over the domain of round ``i``."""
+
+        return fold_evaluations(
+            stacked_evaluations,
+            randomness,
+            self._plan.coset_inverses[i],
+            self._plan.folding_matrices[i],
+        )
 
-        # Transform f to g that has pow2 coefficients.
-        randomness = self._state.sponge.squeeze_field_element()
-        logger.debug(current_value("randomness", randomness))
+    def commit_phase(
+        self,
+        state: FriProver.State,
+        stacked_evaluations: galois.FieldArray,
+    ) -> galois.Poly:
+        """Fold and commit the rounds in evaluation form. The first round
+        must already be committed, see :meth:`commit`.
+
+        :param state: Proof state.
+        :type state: FriProver.State
+        :param stacked_evaluations: Stacked evaluations of the degree-corrected
+            polynomial over the initial evaluation domain.
+        :type stacked_evaluations: galois.FieldArray
+        :return: Final polynomial.
+        :rtype: galois.Poly
+        """
 
-        g, degree_correction_polynomial = expand_ext(
-            f,
-            randomness,
-            self._parameters.initial_coefficients_length,
+        return self._commit_phase_many(
+            [state],
+            stacked_evaluations[numpy.newaxis],
+        )[0]
+
+    def _commit_phase_many(
+        self,
+        states: typing.List[FriProver.State],
+        stacked_evaluations: galois.FieldArray,
+    ) -> typing.List[galois.Poly]:
+        """Fold and commit the rounds of many proofs in lockstep.
+
+        :param states: State of every proof.
+        :type states: typing.List[FriProver.State]
+        :param stacked_evaluations: Stacked evaluations of the degree-corrected
+            polynomial of every proof over the initial evaluation domain.
+        :type stacked_evaluations: galois.FieldArray
+        :return: Final polynomial of every proof.
+        :rtype: typing.List[galois.Poly]
+        """
+
+        field = self._parameters.field
+
+        for i in range(self._parameters.number_of_rounds):
+            verifier_randomness = field(
+                [state.sponge.squeeze_field_element() for state in states]
+            )
+            stacked_evaluations = stack(
+                self._fold(stacked_evaluations, verifier_randomness, i),
+                self._parameters.folding_factors[i + 1],
+            )
+            for state, se in zip(states, stacked_evaluations):
+                self._commit_or_send(state, se, i + 1)
+
+        # INFO: This is moved here so that Verifier and Prover
+        #       both access the Sponge in the same order.
+        final_randomness = field(
+            [state.sponge.squeeze_field_element() for state in states]
+        )
+
+        # INFO: The final domain is larger than the final polynomial, so the
+        #       polynomial is recovered exactly by interpolation.
+        i = self._parameters.number_of_rounds + 1
+        final_evaluations = self._fold(stacked_evaluations, final_randomness, i - 1)
+
+        return interpolate_many_on_coset(
+            final_evaluations,
+            self._plan.domains[i][0],
+            self._plan.get_inverse_twiddles(i),
         )
 
-        # INFO: These are too much noise.
-        # logger.debug(current_value("degree corrected polynomial", g))
-        # logger.debug(
-        #     current_value(
-        #         "degree correction polynomial",
-        #         degree_correction_polynomial,
-        #     )
-        # )
+    def _commit_phase_coefficients(
+        self,
+        state: FriProver.State,
+        g: galois.Poly,
+    ) -> galois.Poly:
+        """Fold the polynomial and evaluate it anew every round.
+
+        :param g: Degree-corrected polynomial.
+        :type g: galois.Poly
+        :return: Final polynomial.
+        :rtype: galois.Poly
+        """
 
-        self._state.polynomial = g
+        state.polynomial = g
 
         for i in range(self._parameters.number_of_rounds):
-            self._round()
+            self._round(state, i + 1)
 
         # INFO: This is moved here so that Verifier and Prover
         #       both access the Sponge in the same order.
-        final_randomness = self._state.sponge.squeeze_field_element()
+        final_randomness = state.sponge.squeeze_field_element()
+
+        # The final polynomial does not need any proofs.
+        return fold_polynomial(
+            state.polynomial,
+            final_randomness,
+            self._parameters.folding_factors[-1],
+        )
+
+    def query_phase(self, state: FriProver.State) -> typing.List[RoundProof]:
+        """Open the committed rounds at the query indices. The rounds must
+        already be committed, see :meth:`commit_phase`.
+
+        :param state: Proof state.
+        :type state: FriProver.State
+        :return: Proof of every round.
+        :rtype: typing.List[RoundProof]
+        """
 
         round_proofs: typing.List[RoundProof] = []
 
@@ -151,72 +430,54 @@ class FriProver:
             // self._parameters.folding_factor
         )
 
+        # INFO: Grinding makes the prover pay for every attempt to get other
+        #       query indices.
+        if self._parameters.grinding_bits > 0:
+            state.proof_of_work_nonce = state.sponge.grind(
+                self._parameters.grinding_bits
+            )
+
         # INFO: This are the indices we need for STARK verification.
-        query_indices = self._state.sponge.squeeze_indices(
+        query_indices = state.sponge.squeeze_indices(
             self._parameters.number_of_repetitions,
             query_indices_range,
         )
-        query_evaluations = self._state.evaluations[0][query_indices]
+        query_evaluations = state.evaluations[0][query_indices]
 
-        merkle_proofs = self._state.merkle_trees[0].prove_bulk(query_indices)
+        merkle_proofs = state.merkle_trees[0].prove_bulk(query_indices)
         round_proofs.append(RoundProof(query_evaluations, merkle_proofs, query_indices))
 
         for i in range(self._parameters.number_of_rounds):
-            query_indices_range //= self._parameters.folding_factor
+            if not self._parameters.is_committed(i + 1):
+                layer = state.evaluations[i + 1]
+                round_proofs.append(
+                    RoundProof(layer, [], numpy.arange(layer.shape[0]))
+                )
+                continue
+
+            query_indices_range //= self._parameters.folding_factors[i + 1]
             query_indices = fold_indices(query_indices, query_indices_range)
-            query_evaluations = self._state.evaluations[i + 1][query_indices]
+            query_evaluations = state.evaluations[i + 1][query_indices]
 
-            merkle_proofs = self._state.merkle_trees[i + 1].prove_bulk(query_indices)
+            merkle_proofs = state.merkle_trees[i + 1].prove_bulk(query_indices)
             round_proofs.append(
                 RoundProof(query_evaluations, merkle_proofs, query_indices)
             )
 
-        # The final polynomial does not need any proofs.
-        final_polynomial = fold_polynomial(
-            self._state.polynomial,
-            final_randomness,
-            self._parameters.folding_factor,
-        )
-
-        result = FriProof(
-            round_proofs,
-            self._state.merkle_roots,
-            final_polynomial,
-            degree_correction_polynomial,
-        )
-
-        return result
+        return round_proofs
 
-    def _round(self) -> None:
-        assert (
-            self._state is not None
-        ), "self._state must be initialized when calling self._round"
-
-        verifier_randomness = self._state.sponge.squeeze_field_element()
+    def _round(self, state: FriProver.State, i: int) -> None:
+        verifier_randomness = state.sponge.squeeze_field_element()
         new_polynomial = fold_polynomial(
-            self._state.polynomial,
+            state.polynomial,
             verifier_randomness,
-            self._parameters.folding_factor,
-        )
-        new_evaluation_domain = fold_domain(
-            self._state.evaluation_domain,
-            self._parameters.folding_factor,
+            self._parameters.folding_factors[i - 1],
         )
-
-        new_round_evaluations: galois.FieldArray = new_polynomial(new_evaluation_domain)
-        stacked_evaluations = stack(
-            new_round_evaluations,
-            self._parameters.folding_factor,
+        new_round_evaluations = self._plan.evaluate(new_polynomial, i)
+        self._commit_or_send(
+            state,
+            stack(new_round_evaluations, self._parameters.folding_factors[i]),
+            i,
         )
-        self._state.evaluations.append(stacked_evaluations)
-
-        merkle_tree = MerkleTree()
-        merkle_tree.append_bulk(stacked_evaluations)
-        merkle_root = merkle_tree.get_root()
-
-        self._state.sponge.absorb(merkle_root)
-        self._state.merkle_roots.append(merkle_root)
-        self._state.merkle_trees.append(merkle_tree)
 
-        self._state.polynomial = new_polynomial
-        self._state.evaluation_domain = new_evaluation_domain
+        state.polynomial = new_polynomial
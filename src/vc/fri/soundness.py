@@ -0,0 +1,244 @@
+"""FRI soundness.
+
+Number of queries needed for a security level, and the security achieved by
+given parameters, in two regimes:
+
+- ``conjectured``: ethSTARK Conjecture 1. Every query gives ``log2(1/rate)``
+  bits, and the commit phase error is about the domain length over the field
+  size.
+- ``proven``: ethSTARK Theorem 3, which follows from BCIKS20 Theorem 8.3. The
+  proximity parameter is taken up to the Johnson bound, so every query gives
+  about half the bits of the conjectured regime, and the commit phase error
+  grows with the square of the domain length over the field size.
+- ``unique``: the proximity parameter is taken up to the unique decoding
+  radius ``(1 - rate) / 2``, so every query gives less than a bit. A STARK
+  without out-of-domain sampling is only sound in this regime, since the
+  committed polynomials may be close to many codewords. Out-of-domain
+  sampling picks one of them, which is what lets STARK use the regimes
+  above.
+
+Grinding adds its bits to the query phase in both regimes. The combination
+randomness of batch FRI and of STARK is not accounted for.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import math
+import typing
+
+
+CONJECTURED = "conjectured"
+PROVEN = "proven"
+UNIQUE = "unique"
+REGIMES = (CONJECTURED, PROVEN, UNIQUE)
+
+JOHNSON_MULTIPLICITY = 3
+"""Multiplicity parameter ``m`` of the proven regime. The proximity parameter
+is ``1 - sqrt(rate) * (1 + 1 / (2m))``."""
+
+
+@dataclasses.dataclass(slots=True)
+class Soundness:
+    """Security of FRI parameters."""
+
+    regime: str
+    """Soundness regime."""
+    number_of_queries: int
+    """Number of queries."""
+    bits_per_query: float
+    """Security bits every query gives."""
+    grinding_bits: int
+    """Security bits from the proof-of-work."""
+    commit_phase_bits: float
+    """Security bits of the commit phase. Bounded by the field size."""
+
+    @property
+    def query_phase_bits(self) -> float:
+        """Security bits of the query phase, including grinding."""
+
+        return self.number_of_queries * self.bits_per_query + self.grinding_bits
+
+    @property
+    def bits(self) -> float:
+        """Achieved security bits. The weaker phase bounds the security, up to
+        one bit lost to the sum of the errors of both phases."""
+
+        return max(0.0, min(self.query_phase_bits, self.commit_phase_bits))
+
+    def __repr__(self) -> str:
+        return f"""
+        regime = {self.regime}
+        query phase = {self.query_phase_bits:.1f} bits ({self.number_of_queries} queries, {self.bits_per_query:.2f} bits each, {self.grinding_bits} grinding bits)
+        commit phase = {self.commit_phase_bits:.1f} bits
+        achieved = {self.bits:.1f} bits"""
+
+
+def get_bits_per_query(regime: str, expansion_factor_log: int) -> float:
+    """Get security bits every query gives.
+
+    :param regime: Soundness regime.
+    :type regime: str
+    :param expansion_factor_log: Expansion factor logarithm.
+    :type expansion_factor_log: int
+    :return: Security bits per query.
+    :rtype: float
+    """
+
+    assert regime in REGIMES, f"unknown soundness regime {regime}"
+
+    if regime == CONJECTURED:
+        return float(expansion_factor_log)
+
+    if regime == UNIQUE:
+        # INFO: A query fails to catch a cheating prover with probability
+        #       1 - (1 - rate) / 2 = (1 + rate) / 2.
+        return 1 - math.log2(1 + 2.0**-expansion_factor_log)
+
+    # INFO: A query fails to catch a cheating prover with probability
+    #       1 - proximity = sqrt(rate) * (1 + 1 / (2m)).
+    return expansion_factor_log / 2 - math.log2(1 + 1 / (2 * JOHNSON_MULTIPLICITY))
+
+
+def get_commit_phase_bits(
+    regime: str,
+    field_order: int,
+    expansion_factor_log: int,
+    initial_evaluation_domain_length: int,
+    folding_factors: typing.Sequence[int],
+) -> float:
+    """Get security bits of the commit phase.
+
+    :param regime: Soundness regime.
+    :type regime: str
+    :param field_order: Field order.
+    :type field_order: int
+    :param expansion_factor_log: Expansion factor logarithm.
+    :type expansion_factor_log: int
+    :param initial_evaluation_domain_length: Initial evaluation domain length.
+    :type initial_evaluation_domain_length: int
+    :param folding_factors: Folding factor of every fold, including the final one.
+    :type folding_factors: typing.Sequence[int]
+    :return: Security bits of the commit phase.
+    :rtype: float
+    """
+
+    assert regime in REGIMES, f"unknown soundness regime {regime}"
+
+    field_bits = math.log2(field_order)
+    n = initial_evaluation_domain_length
+
+    if regime == CONJECTURED:
+        return field_bits - math.log2(n)
+
+    if regime == UNIQUE:
+        # INFO: Every fold errs with about the domain length over the field
+        #       size for every polynomial it combines.
+        return field_bits - math.log2(n * sum(k - 1 for k in folding_factors))
+
+    m = JOHNSON_MULTIPLICITY
+    rate = 2.0**-expansion_factor_log
+
+    # INFO: The first term bounds the error of the first fold, the second one
+    #       sums the errors of every fold over its folding factor.
+    error = (m + 0.5) ** 7 / (3 * rate**1.5) * n**2 + (2 * m + 1) * (
+        n + 1
+    ) / math.sqrt(rate) * sum(k - 1 for k in folding_factors)
+
+    return field_bits - math.log2(error)
+
+
+def get_number_of_queries(
+    regime: str,
+    security_level_bits: int,
+    expansion_factor_log: int,
+    grinding_bits: int = 0,
+) -> int:
+    """Get the number of queries for the query phase to reach the security
+    level. The commit phase may still bound the achieved security below it,
+    which :class:`vc.fri.parameters.FriParameters` rejects.
+
+    :param regime: Soundness regime.
+    :type regime: str
+    :param security_level_bits: Security level in bits.
+    :type security_level_bits: int
+    :param expansion_factor_log: Expansion factor logarithm.
+    :type expansion_factor_log: int
+    :param grinding_bits: Security bits from the proof-of-work, defaults to 0.
+    :type grinding_bits: int, optional
+    :return: Number of queries.
+    :rtype: int
+    """
+
+    bits_per_query = get_bits_per_query(regime, expansion_factor_log)
+    return max(1, math.ceil((security_level_bits - grinding_bits) / bits_per_query))
+
+
+def get_number_of_ood_samples(
+    security_level_bits: int,
+    field_order: int,
+    degree: int,
+) -> int:
+    """Get the number of out-of-domain samples for the security level. Two
+    distinct polynomials of degree less than ``degree`` agree at a random
+    point with probability at most ``degree`` over the field size, so every
+    sample gives the bits of the field size over the degree.
+
+    :param security_level_bits: Security level in bits.
+    :type security_level_bits: int
+    :param field_order: Field order.
+    :type field_order: int
+    :param degree: Bound on the degree of the sampled polynomials.
+    :type degree: int
+    :return: Number of out-of-domain samples.
+    :rtype: int
+    """
+
+    bits_per_sample = math.log2(field_order) - math.log2(degree)
+    assert bits_per_sample > 0, "field is too small for the degree"
+
+    return max(1, math.ceil(security_level_bits / bits_per_sample))
+
+
+def get_soundness(
+    regime: str,
+    number_of_queries: int,
+    grinding_bits: int,
+    field_order: int,
+    expansion_factor_log: int,
+    initial_evaluation_domain_length: int,
+    folding_factors: typing.Sequence[int],
+) -> Soundness:
+    """Get the security achieved by FRI parameters.
+
+    :param regime: Soundness regime.
+    :type regime: str
+    :param number_of_queries: Number of queries.
+    :type number_of_queries: int
+    :param grinding_bits: Security bits from the proof-of-work.
+    :type grinding_bits: int
+    :param field_order: Field order.
+    :type field_order: int
+    :param expansion_factor_log: Expansion factor logarithm.
+    :type expansion_factor_log: int
+    :param initial_evaluation_domain_length: Initial evaluation domain length.
+    :type initial_evaluation_domain_length: int
+    :param folding_factors: Folding factor of every fold, including the final one.
+    :type folding_factors: typing.Sequence[int]
+    :return: Soundness breakdown.
+    :rtype: Soundness
+    """
+
+    return Soundness(
+        regime=regime,
+        number_of_queries=number_of_queries,
+        bits_per_query=get_bits_per_query(regime, expansion_factor_log),
+        grinding_bits=grinding_bits,
+        commit_phase_bits=get_commit_phase_bits(
+            regime,
+            field_order,
+            expansion_factor_log,
+            initial_evaluation_domain_length,
+            folding_factors,
+        ),
+    )
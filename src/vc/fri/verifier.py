@@ -7,10 +7,17 @@ import typing
 import galois
 import numpy
 
-from vc.fri.fold import extend_indices, fold_domain, fold_sort_generate
+from vc.fri.fold import (
+    extend_indices,
+    fold_evaluations,
+    fold_sort_generate,
+    get_folding_matrix,
+)
 from vc.logging import current_value, logging_mark
-from vc.merkle import MerkleTree
+from vc.merkle import MerkleTree, hash_rows
 from vc.fri.parameters import FriParameters
+from vc.fri.plan import FriPlan
+from vc.polynomial import evaluate_degree_correction
 from vc.fri.proof import FriProof
 from vc.sponge import Sponge
 
@@ -24,30 +31,152 @@ class FriVerifier:
 
     @dataclasses.dataclass(slots=True, init=False)
     class State:
-        """FRI Verifier state."""
+        """State of a single verification. Created by every call to :meth:`FriVerifier.verify`."""
 
         sponge: Sponge
         """Sponge."""
-        initial_evaluation_domain: galois.Array
-        """Initial evaluation domain."""
 
         def __init__(
             self,
             fri_parameters: FriParameters,
             sponge: Sponge | None = None,
         ) -> None:
-            self.initial_evaluation_domain = fri_parameters.initial_evaluation_domain
             self.sponge = sponge if sponge is not None else Sponge(fri_parameters.field)
 
     _fri_parameters: FriParameters
-    _state: FriVerifier.State
+    _plan: FriPlan | None
+    _folding_matrices: typing.List[galois.FieldArray]
+
+    def __init__(
+        self,
+        parameters: FriParameters,
+        plan: FriPlan | None = None,
+    ) -> None:
+        """Initialize new Verifier.
+
+        :param parameters: FRI parameters.
+        :type parameters: FriParameters
+        :param plan: Plan built for the same parameters. Domain points are
+            taken from the plan instead of being computed, defaults to None.
+        :type plan: FriPlan | None, optional
+        """
+
+        assert plan is None or plan.is_built_for(
+            parameters
+        ), "plan must be built for the same parameters"
 
-    def __init__(self, parameters: FriParameters) -> None:
         self._fri_parameters = parameters
+        self._plan = plan
+        if plan is not None:
+            self._folding_matrices = plan.folding_matrices
+        else:
+            matrices = {
+                folding_factor: get_folding_matrix(
+                    parameters.omega,
+                    parameters.initial_evaluation_domain_length,
+                    folding_factor,
+                )
+                for folding_factor in set(parameters.folding_factors)
+            }
+            self._folding_matrices = [
+                matrices[folding_factor] for folding_factor in parameters.folding_factors
+            ]
+
+    def _fold(
+        self,
+        stacked_evaluations: galois.FieldArray,
+        randomness: galois.FieldArray,
+        query_indices: numpy.ndarray,
+        i: int,
+    ) -> galois.FieldArray:
+        """Fold the queried rows of round ``i`` all at once.
+
+        Row ``j`` holds evaluations over the coset of the domain point at
+        ``query_indices[j]``, so the queries are folded with the same matrix
+        as in the prover. Rows may come from different proofs, so there is
+        randomness for every row.
+        """
+
+        if self._plan is not None:
+            coset_inverses = self._plan.coset_inverses[i][query_indices]
+        else:
+            coset_inverses = self._get_domain_points(query_indices, i, inverse=True)
+
+        # INFO: Folding depends on the randomness and the coset offset only
+        #       through their ratio, so the ratio of every row is passed as
+        #       its coset inverse.
+        field = self._fri_parameters.field
+        return fold_evaluations(
+            stacked_evaluations,
+            field(1),
+            randomness * coset_inverses,
+            self._folding_matrices[i],
+        )
+
+    @staticmethod
+    def _check(
+        stacked_evaluations: galois.FieldArray,
+        check_indices: numpy.ndarray,
+        folded_values: galois.FieldArray,
+    ) -> bool:
+        """Check folded values against the next round evaluations."""
+
+        rows = numpy.arange(check_indices.size)
+        return bool(numpy.all(folded_values == stacked_evaluations[rows, check_indices]))
+
+    def _get_opened_rows(
+        self,
+        proof: FriProof,
+        i: int,
+        query_indices: numpy.ndarray,
+    ) -> galois.FieldArray:
+        """Get the rows of round ``i`` at the query indices, which are either
+        opened in the proof or taken from the round sent in full."""
+
+        stacked_evaluations = proof.round_proofs[i].stacked_evaluations
+        if self._fri_parameters.is_committed(i):
+            return stacked_evaluations
+
+        return stacked_evaluations[query_indices]
+
+    def _get_domain_points(
+        self,
+        indices: numpy.ndarray,
+        i: int,
+        inverse: bool = False,
+    ) -> galois.FieldArray:
+        """Get points of the evaluation domain of round ``i``, or their
+        inverses when ``inverse`` is set."""
+
+        if self._plan is not None:
+            points = self._plan.domains[i][indices]
+            return numpy.reciprocal(points) if inverse else points
+
+        length = self._fri_parameters.get_domain_length(i)
+
+        # INFO: Every point costs a power. When there are at least as many
+        #       points as the domain has, as when verifying many proofs at
+        #       once, the domain is cheaper to get by repeated multiplication.
+        if indices.size < length:
+            points = self._fri_parameters.get_domain_points(indices, i)
+            return numpy.reciprocal(points) if inverse else points
+
+        field = self._fri_parameters.field
+        scale = self._fri_parameters.get_domain_scale(i)
+        offset = self._fri_parameters.offset**scale
+        generator = self._fri_parameters.omega**scale
+        if inverse:
+            offset, generator = offset**-1, generator**-1
+
+        domain = field.Ones(length)
+        domain[0] = offset
+        domain[1:] = generator
+        return numpy.multiply.accumulate(domain)[indices]
 
     @logging_mark(logger)
     def verify(self, proof: FriProof, sponge: Sponge | None = None) -> bool:
         """Verify proof.
+        The verifier is not modified, so it can be used from multiple threads.
 
         :param proof: Proof for some polynomial.
         :type proof: Proof
@@ -55,147 +184,315 @@ class FriVerifier:
         :rtype: bool
         """
 
-        self._state = FriVerifier.State(
-            self._fri_parameters,
-            sponge=sponge,
-        )
+        return self.verify_batch([proof], [sponge])[0]
 
-        if (
-            proof.final_polynomial.degree + 1
-            > self._fri_parameters.final_coefficients_length
+    @logging_mark(logger)
+    def verify_batch(
+        self,
+        proofs: typing.List[FriProof],
+        sponges: typing.List[Sponge | None] | None = None,
+    ) -> typing.List[bool]:
+        """Verify many proofs at once. Every proof has its own transcript,
+        but the queries of all the proofs are folded and checked together
+        every round, which amortizes the Python overhead of the rounds.
+
+        :param proofs: Proofs for some polynomials.
+        :type proofs: typing.List[FriProof]
+        :param sponges: Sponge for every proof. New sponges when None,
+            defaults to None.
+        :type sponges: typing.List[Sponge | None] | None, optional
+        :return: ``True`` for every valid proof. ``False`` otherwise.
+        :rtype: typing.List[bool]
+        """
+
+        if sponges is None:
+            sponges = [None] * len(proofs)
+
+        assert len(sponges) == len(proofs), "there must be a sponge for every proof"
+
+        states = [
+            FriVerifier.State(self._fri_parameters, sponge=sponge)
+            for sponge in sponges
+        ]
+        corrections = [
+            self._begin(proof, state) for proof, state in zip(proofs, states)
+        ]
+
+        return self._verify_rounds_many(proofs, states, corrections)
+
+    def _begin(
+        self,
+        proof: FriProof,
+        state: FriVerifier.State,
+    ) -> typing.Callable | None:
+        """Check the structure of the proof, absorb the first commitment and
+        get the degree correction.
+
+        :return: Degree correction of the first round rows. None if the
+            proof is invalid.
+        :rtype: typing.Callable | None
+        """
+
+        if not (
+            0 < proof.degree_correction_length
+            <= self._fri_parameters.initial_coefficients_length
         ):
+            logger.error(f"invalid degree correction length")
+            return None
+
+        # INFO: The transcript is replayed from the proof, so its structure
+        #       is checked first.
+        if not self.check_structure(proof):
+            return None
+
+        state.sponge.absorb(proof.merkle_roots[0])
+
+        # Degree correction randomness.
+        r = state.sponge.squeeze_field_element()
+        logger.debug(current_value("r", r))
+
+        def correct(
+            stacked_evaluations: galois.FieldArray,
+            xs: galois.FieldArray,
+        ) -> galois.FieldArray:
+            return stacked_evaluations * evaluate_degree_correction(
+                r,
+                proof.degree_correction_length,
+                xs,
+            )
+
+        return correct
+
+    def verify_rounds(
+        self,
+        proof: FriProof,
+        state: FriVerifier.State,
+        correct: typing.Callable[
+            [galois.FieldArray, galois.FieldArray],
+            galois.FieldArray,
+        ],
+    ) -> bool:
+        """Verify the rounds of a proof. The structure of the proof must
+        already be checked with :meth:`check_structure`, and the first Merkle
+        root absorbed, along with the randomness derived from it. This is the
+        hook for protocols which commit to their own first round, such as
+        :class:`vc.fri.batch.BatchFriVerifier`.
+
+        :param proof: Proof for some polynomial.
+        :type proof: FriProof
+        :param state: Verification state.
+        :type state: FriVerifier.State
+        :param correct: Function mapping the opened first round rows and
+            their domain points to the stacked evaluations of the
+            degree-corrected polynomial.
+        :type correct: typing.Callable
+        :return: ``True`` if ``proof`` is valid. ``False`` otherwise.
+        :rtype: bool
+        """
+
+        return self._verify_rounds_many([proof], [state], [correct])[0]
+
+    def check_structure(self, proof: FriProof) -> bool:
+        """Check the number of rounds, the final polynomial degree, the
+        rounds sent in full and the Merkle proofs.
+
+        :param proof: Proof for some polynomial.
+        :type proof: FriProof
+        :return: ``True`` if the structure is valid. ``False`` otherwise.
+        :rtype: bool
+        """
+
+        parameters = self._fri_parameters
+        if proof.final_polynomial.degree + 1 > parameters.final_coefficients_length:
             logger.error(f"invalid final polynomial degree")
             return False
 
-        for merkle_root, round_proof in zip(proof.merkle_roots, proof.round_proofs):
+        if (
+            len(proof.round_proofs) != parameters.number_of_rounds + 1
+            or len(proof.merkle_roots) != parameters.number_of_committed_rounds
+        ):
+            logger.error(f"invalid number of rounds")
+            return False
+
+        for i in range(
+            parameters.number_of_committed_rounds,
+            parameters.number_of_rounds + 1,
+        ):
+            k = parameters.folding_factors[i]
+            if proof.round_proofs[i].stacked_evaluations.shape != (
+                parameters.get_domain_length(i) // k,
+                k,
+            ):
+                logger.error(f"invalid layer shape in round {i}")
+                return False
+
+        for i, (merkle_root, round_proof) in enumerate(
+            zip(proof.merkle_roots, proof.round_proofs)
+        ):
+            # INFO: The proofs are bound to the indices the prover sent, which
+            #       are checked against the query indices in the rounds.
             if not MerkleTree.verify_bulk(
                 round_proof.stacked_evaluations,
                 merkle_root,
                 round_proof.proofs,
+                round_proof.indices,
+                parameters.get_domain_length(i) // parameters.folding_factors[i],
             ):
                 logger.error(f"invalid merkle tree proofs")
                 return False
 
-        folding_randomness_array: typing.List[galois.Array] = []
-        for i in range(self._fri_parameters.number_of_rounds + 1):
-            self._state.sponge.absorb(proof.merkle_roots[i])
-            if i == 0:
-                # This is done only for synchronization between the Prover and the Verifier.
-                r = self._state.sponge.squeeze_field_element()
-                logger.debug(current_value("r", r))
+        return True
+
+    def _verify_rounds_many(
+        self,
+        proofs: typing.List[FriProof],
+        states: typing.List[FriVerifier.State],
+        corrections: typing.List[typing.Callable | None],
+    ) -> typing.List[bool]:
+        """Verify the rounds of many proofs in lockstep. See :meth:`verify_rounds`.
+
+        :param corrections: Degree correction of every proof. None for
+            proofs already found invalid, including the ones of invalid
+            structure.
+        :type corrections: typing.List[typing.Callable | None]
+        :return: ``True`` for every valid proof. ``False`` otherwise.
+        :rtype: typing.List[bool]
+        """
 
-            folding_randomness_array.append(self._state.sponge.squeeze_field_element())
+        field = self._fri_parameters.field
+        folding_factors = self._fri_parameters.folding_factors
+        number_of_rounds = self._fri_parameters.number_of_rounds
 
-        evaluation_domain = self._fri_parameters.initial_evaluation_domain
-        evaluation_domain_length = self._fri_parameters.initial_evaluation_domain_length
+        results = [correct is not None for correct in corrections]
 
         query_indices_range = (
-            self._fri_parameters.initial_evaluation_domain_length
-            // self._fri_parameters.folding_factor
-        )
-        query_indices = self._state.sponge.squeeze_indices(
-            self._fri_parameters.number_of_repetitions,
-            query_indices_range,
-        )
-        extended_indices = extend_indices(
-            query_indices,
-            evaluation_domain_length,
-            self._fri_parameters.folding_factor,
+            self._fri_parameters.initial_evaluation_domain_length // folding_factors[0]
         )
 
-        # BEGIN FIRST CHECK --------------------
-        unordered_folded_values = []
-
-        for indices, ys in zip(
-            extended_indices,
-            proof.round_proofs[0].stacked_evaluations,
-        ):
-            xs = evaluation_domain[indices]
-            ys_degree_corrected = ys * proof.degree_correction_polynomial(xs)
-            folded_polynomial = galois.lagrange_poly(xs, ys_degree_corrected)
-            unordered_folded_values.append(
-                folded_polynomial(folding_randomness_array[0]),
-            )
-
-        query_indices_range //= self._fri_parameters.folding_factor
-        query_indices, check_indices, folded_values = fold_sort_generate(
-            query_indices,
-            query_indices_range,
-            unordered_folded_values,
-        )
-
-        evaluation_domain_length //= self._fri_parameters.folding_factor
-        evaluation_domain = fold_domain(
-            evaluation_domain,
-            self._fri_parameters.folding_factor,
-        )
-
-        extended_indices = extend_indices(
-            query_indices,
-            evaluation_domain_length,
-            self._fri_parameters.folding_factor,
-        )
-
-        for j, se in enumerate(proof.round_proofs[1].stacked_evaluations):
-            temp_result = folded_values[j] == se[check_indices[j]]
-            if not temp_result:
-                logger.error(f"first consistency check failed")
-                return False
-        # END   FIRST CHECK --------------------
-
-        # unordered_folded_values = None
-        # check_indices = None
-        # folded_values = None
-        for i in range(1, self._fri_parameters.number_of_rounds + 1):
-            if check_indices is not None:
-                assert folded_values is not None
-
-                for j, se in enumerate(proof.round_proofs[i].stacked_evaluations):
-                    temp_result = folded_values[j] == se[check_indices[j]]
-                    if not temp_result:
-                        logger.error(f"second consistency check failed")
-                        return False
-
-            unordered_folded_values = []
-            for indices, ys in zip(
-                extended_indices,
-                proof.round_proofs[i].stacked_evaluations,
+        grinding_bits = self._fri_parameters.grinding_bits
+        folding_randomness: typing.List[galois.FieldArray | None] = []
+        query_indices: typing.List[numpy.ndarray | None] = []
+        for j, (proof, state, result) in enumerate(zip(proofs, states, results)):
+            if not result:
+                folding_randomness.append(None)
+                query_indices.append(None)
+                continue
+
+            folding_randomness_array: typing.List[galois.Array] = []
+            for i in range(number_of_rounds + 1):
+                if i > 0 and self._fri_parameters.is_committed(i):
+                    state.sponge.absorb(proof.merkle_roots[i])
+                elif i > 0:
+                    state.sponge.absorb(
+                        hash_rows(proof.round_proofs[i].stacked_evaluations)
+                    )
+
+                folding_randomness_array.append(state.sponge.squeeze_field_element())
+
+            folding_randomness.append(field(folding_randomness_array))
+
+            if grinding_bits > 0 and not state.sponge.check_grinding(
+                proof.proof_of_work_nonce,
+                grinding_bits,
             ):
-                xs = evaluation_domain[indices]
-                folded_polynomial = galois.lagrange_poly(xs, ys)
-                unordered_folded_values.append(
-                    folded_polynomial(folding_randomness_array[i]),
+                logger.error(f"invalid proof of work")
+                results[j] = False
+                query_indices.append(None)
+                continue
+
+            query_indices.append(
+                state.sponge.squeeze_indices(
+                    self._fri_parameters.number_of_repetitions,
+                    query_indices_range,
                 )
-
-            query_indices_range //= self._fri_parameters.folding_factor
-            query_indices, check_indices, folded_values = fold_sort_generate(
-                query_indices,
-                query_indices_range,
-                unordered_folded_values,
             )
 
-            evaluation_domain_length //= self._fri_parameters.folding_factor
-            evaluation_domain = fold_domain(
-                evaluation_domain,
-                self._fri_parameters.folding_factor,
+        for i in range(number_of_rounds + 1):
+            if self._fri_parameters.is_committed(i):
+                for j, result in enumerate(results):
+                    if result and not numpy.array_equal(
+                        proofs[j].round_proofs[i].indices,
+                        query_indices[j],
+                    ):
+                        logger.error(f"invalid query indices in round {i}")
+                        results[j] = False
+
+            active = [j for j, result in enumerate(results) if result]
+            if len(active) == 0:
+                break
+
+            sizes = [query_indices[j].size for j in active]
+            splits = numpy.cumsum(sizes)[:-1]
+            all_query_indices = numpy.concatenate([query_indices[j] for j in active])
+
+            stacked_evaluations = [
+                self._get_opened_rows(proofs[j], i, query_indices[j]) for j in active
+            ]
+            if i == 0:
+                xs = self._get_domain_points(
+                    extend_indices(
+                        all_query_indices,
+                        self._fri_parameters.initial_evaluation_domain_length,
+                        folding_factors[0],
+                    ),
+                    0,
+                )
+                stacked_evaluations = [
+                    corrections[j](se, current_xs)
+                    for j, se, current_xs in zip(
+                        active,
+                        stacked_evaluations,
+                        numpy.split(xs, splits),
+                    )
+                ]
+
+            randomness = numpy.repeat(
+                field([folding_randomness[j][i] for j in active]),
+                sizes,
             )
-
-            extended_indices = extend_indices(
-                query_indices,
-                evaluation_domain_length,
-                self._fri_parameters.folding_factor,
+            unordered_folded_values = self._fold(
+                numpy.concatenate(stacked_evaluations),
+                randomness,
+                all_query_indices,
+                i,
             )
 
-        # TODO: Refactor without Numpy.
-        query_indices = numpy.array(query_indices)
-        check_indices = numpy.array(check_indices)
-
-        final_polynomial_answers = proof.final_polynomial(
-            evaluation_domain[list(query_indices + query_indices_range * check_indices)]
-        )
-        final_check = all(folded_values == final_polynomial_answers)
+            # INFO: Folded values are checked against the rows of the next
+            #       round, which is stacked with its own folding factor. The
+            #       final polynomial is evaluated at the folded points as is.
+            if i < number_of_rounds:
+                query_indices_range //= folding_factors[i + 1]
+            else:
+                query_indices_range = self._fri_parameters.get_domain_length(i + 1)
+            for j, current_unordered_folded_values in zip(
+                active,
+                numpy.split(unordered_folded_values, splits),
+            ):
+                query_indices[j], check_indices, folded_values = fold_sort_generate(
+                    query_indices[j],
+                    query_indices_range,
+                    current_unordered_folded_values,
+                )
 
-        if not final_check:
-            logger.error(f"final check failed")
+                if i < number_of_rounds:
+                    if not self._check(
+                        self._get_opened_rows(proofs[j], i + 1, query_indices[j]),
+                        check_indices,
+                        folded_values,
+                    ):
+                        logger.error(f"consistency check failed in round {i}")
+                        results[j] = False
+
+                    continue
+
+                final_polynomial_answers = proofs[j].final_polynomial(
+                    self._get_domain_points(
+                        query_indices[j] + query_indices_range * check_indices,
+                        number_of_rounds + 1,
+                    )
+                )
+                if not numpy.all(folded_values == final_polynomial_answers):
+                    logger.error(f"final check failed")
+                    results[j] = False
 
-        return final_check
+        return results
@@ -1,3 +1,5 @@
+import contextlib
+import logging
 import timeit
 import typing
 
@@ -38,6 +40,12 @@ def parameter_received(name: str, value: typing.Any) -> str:
 def logging_mark(logger):
     def wrapper1(function):
         def wrapper(*args, **kwargs):
+            # INFO: Formatting the result may cost more than the function,
+            #       for example for proofs, so it is skipped without debug
+            #       logging.
+            if not logger.isEnabledFor(logging.DEBUG):
+                return function(*args, **kwargs)
+
             logger.debug(function_begin(function.__name__))
             debug_begin = timeit.default_timer()
 
@@ -57,3 +65,31 @@ def logging_mark(logger):
         return wrapper
 
     return wrapper1
+
+
+@contextlib.contextmanager
+def phase(
+    logger,
+    name: str,
+    timings: typing.Dict[str, float] | None = None,
+):
+    """Log and optionally record the time spent in a protocol phase.
+
+    :param logger: Logger to write begin and end messages to.
+    :param name: Phase name.
+    :type name: str
+    :param timings: Dictionary to add the elapsed time in seconds to under
+        ``name``, defaults to None.
+    :type timings: typing.Dict[str, float] | None, optional
+    """
+
+    logger.debug(f"begin {name}")
+    begin = timeit.default_timer()
+
+    yield
+
+    elapsed = timeit.default_timer() - begin
+    logger.debug(f"end {name}" + _elapsed(elapsed))
+
+    if timings is not None:
+        timings[name] = timings.get(name, 0.0) + elapsed
@@ -17,6 +17,65 @@ logger = logging.getLogger(__name__)
 hash_buff = pymerkle.InmemoryTree(MEKRLE_HASH_ALGORITHM).hash_buff
 
 
+def _serialize_rows(stack: galois.FieldArray) -> typing.List[bytes]:
+    """Serialize every row of stacked evaluations as :meth:`MerkleTree.append` does.
+
+    Pickling a field array pickles its field class too, which is slow. Rows
+    of the same shape and integer dtype pickle to the same bytes around
+    their data, so only the first row is pickled and the data of the other
+    rows is put in its place.
+    """
+
+    if stack.dtype == numpy.object_ or stack.shape[0] == 0:
+        return [pickle.dumps(row) for row in stack]
+
+    template = pickle.dumps(stack[0])
+    data = stack[0].tobytes()
+
+    # INFO: The data must be found exactly once to be replaced.
+    if template.count(data) != 1:
+        return [pickle.dumps(row) for row in stack]
+
+    prefix, _, suffix = template.partition(data)
+    return [prefix + row.tobytes() + suffix for row in stack]
+
+
+def hash_rows(stack: galois.FieldArray) -> bytes:
+    """Hash stacked evaluations as a whole, without building a Merkle tree.
+
+    :param stack: Multiple stacked evaluations.
+    :type stack: galois.FieldArray
+    :return: Hash of the serialized rows.
+    :rtype: bytes
+    """
+
+    # INFO: Pickling the rows one by one pickles the field class every time
+    #       for fields with Python integer elements, so the elements are
+    #       pickled all at once as nested lists.
+    return hash_buff(pickle.dumps(stack.view(numpy.ndarray).tolist()))
+
+
+def _get_inclusion_rule(index: int, number_of_leaves: int) -> typing.List[int]:
+    """Get the hashing directions of the inclusion proof of the leaf at
+    ``index``, as ``pymerkle`` builds it. The directions of a proof which
+    resolves to the root tell which leaf it is for."""
+
+    start, limit, bit = 0, number_of_leaves, 0
+    directions = []
+    while limit > start + 1:
+        k = 1 << ((limit - start).bit_length() - 1)
+        if k == limit - start:
+            k >>= 1
+
+        directions.append(bit)
+        if index < start + k:
+            limit, bit = start + k, 0
+        else:
+            start, bit = start + k, 1
+
+    return [bit] + directions[::-1]
+
+
 # TODO: Rewrite to custom implementation deriving from the pymerkle.BaseMerkleTree.
 @dataclasses.dataclass(
     init=False,
@@ -62,8 +121,9 @@ class MerkleTree:
         :type stack: galois.FieldArray
         """
 
-        for row in stack:
-            self.append(row)
+        for field_elements_bytes in _serialize_rows(stack):
+            # Ignore the returned index as we don't need it.
+            _ = self._tree.append_entry(field_elements_bytes)
 
     @staticmethod
     def verify(
@@ -83,7 +143,14 @@ class MerkleTree:
         :rtype: bool
         """
 
-        field_elements_bytes = pickle.dumps(field_elements)
+        return MerkleTree._verify_bytes(pickle.dumps(field_elements), root, proof)
+
+    @staticmethod
+    def _verify_bytes(
+        field_elements_bytes: bytes,
+        root: bytes,
+        proof: pymerkle.MerkleProof,
+    ) -> bool:
         base = hash_buff(field_elements_bytes)
 
         try:
@@ -99,6 +166,8 @@ class MerkleTree:
         stacked_evaluations: galois.FieldArray,
         root: bytes,
         proofs: typing.List[pymerkle.MerkleProof],
+        indices: numpy.ndarray | None = None,
+        number_of_leaves: int | None = None,
     ) -> bool:
         """Verify multiple evaluations given a Merkle tree root and corresponding proofs.
 
@@ -108,13 +177,36 @@ class MerkleTree:
         :type root: bytes
         :param proofs: List of corresponding Merkle proofs.
         :type proofs: typing.List[pymerkle.MerkleProof]
+        :param indices: Indices the evaluations must be at. A proof resolves
+            to the root for the leaf at any index, so the index is only
+            checked when given, defaults to None.
+        :type indices: numpy.ndarray[int] | None, optional
+        :param number_of_leaves: Number of leaves of the tree. Required with
+            ``indices``, defaults to None.
+        :type number_of_leaves: int | None, optional
         :return: ``True`` if the all the checks were successful. ``False`` otherwise.
         :rtype: bool
         """
 
+        if len(proofs) != len(stacked_evaluations):
+            return False
+
+        if indices is not None:
+            assert number_of_leaves is not None, "number of leaves must be given"
+
+            if len(indices) != len(proofs) or not all(
+                proof.size == number_of_leaves
+                and list(proof.rule) == _get_inclusion_rule(int(index), number_of_leaves)
+                for index, proof in zip(indices, proofs)
+            ):
+                return False
+
         return all(
-            MerkleTree.verify(field_elements, root, proof)
-            for field_elements, proof in zip(stacked_evaluations, proofs)
+            MerkleTree._verify_bytes(field_elements_bytes, root, proof)
+            for field_elements_bytes, proof in zip(
+                _serialize_rows(stacked_evaluations),
+                proofs,
+            )
         )
 
     def get_root(self) -> bytes:
@@ -0,0 +1,207 @@
+"""Number theoretic transform (NTT).
+
+The transforms are iterative radix-2 and vectorized over numpy arrays: every
+butterfly layer is a handful of array operations, which is much faster than
+evaluating polynomials point by point, in particular for fields galois
+computes over in pure Python.
+
+Twiddles for a domain of length ``n`` with generator ``omega`` are
+``omega^i`` for ``i < n / 2``. Twiddles for a subgroup of length ``n / m``
+are every ``m``-th of them, so a single twiddles array serves all the
+domains of the FRI rounds.
+
+Transforms are over the last axis. Leading axes are transformed
+independently, so many polynomials are transformed at once.
+"""
+
+import functools
+import typing
+
+import galois
+import numpy
+
+from vc.base import is_pow2
+
+
+def get_twiddles(omega: galois.FieldArray, n: int) -> galois.FieldArray:
+    """Get NTT twiddles.
+
+    :param omega: Primitive root of unity of order ``n``.
+    :type omega: galois.FieldArray
+    :param n: Transform length.
+    :type n: int
+    :return: Twiddles ``omega^i`` for ``i < n / 2``.
+    :rtype: galois.FieldArray
+    """
+
+    assert is_pow2(n), "transform length must be a power of two"
+    return omega ** numpy.arange(n // 2)
+
+
+@functools.lru_cache(maxsize=None)
+def _bit_reversal_permutation(n: int) -> numpy.ndarray:
+    bits = n.bit_length() - 1
+    indices = numpy.arange(n)
+    permutation = numpy.zeros(n, dtype=numpy.int64)
+    for bit in range(bits):
+        permutation |= ((indices >> bit) & 1) << (bits - 1 - bit)
+
+    permutation.flags.writeable = False
+
+    return permutation
+
+
+def ntt(values: galois.FieldArray, twiddles: galois.FieldArray) -> galois.FieldArray:
+    """Forward NTT: evaluate a polynomial given by coefficients over a subgroup.
+
+    :param values: Coefficients in ascending order, one polynomial per
+        last axis. The length must be a power of two.
+    :type values: galois.FieldArray
+    :param twiddles: Twiddles of the subgroup of length ``values.size``.
+    :type twiddles: galois.FieldArray
+    :return: Evaluations ``sum_j values[j] * omega^(i * j)`` for every ``i``.
+    :rtype: galois.FieldArray
+    """
+
+    batch_shape, n = values.shape[:-1], values.shape[-1]
+    assert is_pow2(n), "transform length must be a power of two"
+    assert twiddles.size == n // 2, "twiddles do not match the transform length"
+
+    result = values[..., _bit_reversal_permutation(n)]
+
+    m = 1
+    while m < n:
+        result = result.reshape(batch_shape + (-1, 2 * m))
+        u = result[..., :m]
+        v = result[..., m:] * twiddles[:: n // (2 * m)]
+        result = numpy.concatenate([u + v, u - v], axis=-1)
+        m *= 2
+
+    return result.reshape(batch_shape + (n,))
+
+
+def intt(
+    values: galois.FieldArray,
+    inverse_twiddles: galois.FieldArray,
+) -> galois.FieldArray:
+    """Inverse NTT: interpolate evaluations over a subgroup into coefficients.
+
+    :param values: Evaluations over the subgroup.
+    :type values: galois.FieldArray
+    :param inverse_twiddles: Twiddles of the inverse subgroup generator.
+    :type inverse_twiddles: galois.FieldArray
+    :return: Coefficients in ascending order.
+    :rtype: galois.FieldArray
+    """
+
+    field = type(values)
+    n = values.shape[-1]
+    return ntt(values, inverse_twiddles) / field(n % field.order)
+
+
+def evaluate_on_coset(
+    g: galois.Poly,
+    offset: galois.FieldArray,
+    twiddles: galois.FieldArray,
+    n: int,
+) -> galois.FieldArray:
+    """Evaluate a polynomial over a coset ``offset * <omega>`` of length ``n``.
+
+    :param g: Polynomial of degree less than ``n``.
+    :type g: galois.Poly
+    :param offset: Coset offset.
+    :type offset: galois.FieldArray
+    :param twiddles: Twiddles of the subgroup of length ``n``.
+    :type twiddles: galois.FieldArray
+    :param n: Coset length.
+    :type n: int
+    :return: Evaluations ``g(offset * omega^i)`` for ``i < n``.
+    :rtype: galois.FieldArray
+    """
+
+    return evaluate_many_on_coset([g], offset, twiddles, n)[0]
+
+
+def evaluate_many_on_coset(
+    gs: typing.Sequence[galois.Poly],
+    offset: galois.FieldArray,
+    twiddles: galois.FieldArray,
+    n: int,
+) -> galois.FieldArray:
+    """Evaluate polynomials over a coset ``offset * <omega>`` of length ``n``
+    with a single batched transform.
+
+    :param gs: Polynomials of degree less than ``n``.
+    :type gs: typing.Sequence[galois.Poly]
+    :param offset: Coset offset.
+    :type offset: galois.FieldArray
+    :param twiddles: Twiddles of the subgroup of length ``n``.
+    :type twiddles: galois.FieldArray
+    :param n: Coset length.
+    :type n: int
+    :return: Evaluations of polynomial ``gs[j]`` in row ``j``.
+    :rtype: galois.FieldArray
+    """
+
+    field = type(offset)
+    values = field.Zeros((len(gs), n))
+    for row, g in zip(values, gs):
+        coefficients = g.coefficients(order="asc")
+        assert (
+            coefficients.size <= n
+        ), "polynomial degree must be less than coset length"
+
+        row[: coefficients.size] = coefficients
+
+    values *= offset ** numpy.arange(n)
+
+    return ntt(values, twiddles)
+
+
+def interpolate_on_coset(
+    evaluations: galois.FieldArray,
+    offset: galois.FieldArray,
+    inverse_twiddles: galois.FieldArray,
+) -> galois.Poly:
+    """Interpolate evaluations over a coset ``offset * <omega>``.
+
+    :param evaluations: Evaluations ``g(offset * omega^i)``.
+    :type evaluations: galois.FieldArray
+    :param offset: Coset offset.
+    :type offset: galois.FieldArray
+    :param inverse_twiddles: Twiddles of ``omega^-1``.
+    :type inverse_twiddles: galois.FieldArray
+    :return: Polynomial ``g``.
+    :rtype: galois.Poly
+    """
+
+    return interpolate_many_on_coset(
+        evaluations[numpy.newaxis],
+        offset,
+        inverse_twiddles,
+    )[0]
+
+
+def interpolate_many_on_coset(
+    evaluations: galois.FieldArray,
+    offset: galois.FieldArray,
+    inverse_twiddles: galois.FieldArray,
+) -> typing.List[galois.Poly]:
+    """Interpolate rows of evaluations over a coset ``offset * <omega>``
+    with a single batched transform.
+
+    :param evaluations: Evaluations of a polynomial in every row.
+    :type evaluations: galois.FieldArray
+    :param offset: Coset offset.
+    :type offset: galois.FieldArray
+    :param inverse_twiddles: Twiddles of ``omega^-1``.
+    :type inverse_twiddles: galois.FieldArray
+    :return: Polynomial of every row.
+    :rtype: typing.List[galois.Poly]
+    """
+
+    field = type(evaluations)
+    coefficients = intt(evaluations, inverse_twiddles)
+    coefficients /= offset ** numpy.arange(evaluations.shape[-1])
+
+    return [galois.Poly(row, order="asc", field=field) for row in coefficients]
@@ -54,6 +54,41 @@ def _get_degree_correction_polynomial(
     return random_polynomial
 
 
+def evaluate_degree_correction(
+    randomness: galois.FieldArray,
+    length: int,
+    xs: galois.FieldArray,
+) -> galois.FieldArray:
+    """Evaluate the degree correction polynomial ``sum_{i < length} (randomness * x)^i``
+    in closed form ``((randomness * x)^length - 1) / (randomness * x - 1)``.
+
+    :param randomness: Randomness the polynomial was created with.
+    :type randomness: galois.FieldArray
+    :param length: Number of coefficients of the polynomial.
+    :type length: int
+    :param xs: Points to evaluate the polynomial at. Any shape.
+    :type xs: galois.FieldArray
+    :return: Evaluations of the same shape as ``xs``.
+    :rtype: galois.FieldArray
+    """
+
+    assert length > 0, "degree correction polynomial must have coefficients"
+
+    field = type(xs)
+    one = field(1)
+    rxs = randomness * xs
+
+    # INFO: The closed form does not hold where the ratio is one.
+    ones = rxs == one
+    denominators = rxs - one
+    denominators[ones] = one
+
+    result = (rxs**length - one) / denominators
+    result[ones] = field(length % field.characteristic)
+
+    return result
+
+
 def degree_correct(
     g: galois.Poly,
     randomness: galois.FieldArray,
@@ -194,11 +229,12 @@ class MPoly:
 
         assert point.size == self.n_coeffs, "Dimension mismatch"
 
+        # INFO: The product is taken over field elements, integer products
+        #       of the powers overflow in fields smaller than 64 bits.
+        point = self.field(point)
         result = self.field(0)
         for exp, coeff in self.terms.items():
-            term_value = coeff * self.field(
-                numpy.prod([p**e for p, e in zip(point, exp)])
-            )
+            term_value = coeff * numpy.multiply.reduce(point ** numpy.array(exp))
             result += term_value
 
         return result
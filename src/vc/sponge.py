@@ -14,6 +14,7 @@ from vc.logging import function_begin, function_end, parameter_received
 
 logger = logging.getLogger(__name__)
 BYTE_SIZE_BITS = 8
+GRINDING_NONCE_SIZE_BITS = 64
 
 
 @dataclasses.dataclass(init=False, slots=True)
@@ -157,13 +158,15 @@ class Sponge:
             return numpy.sort(numpy.array(range(upper_bound)))
 
         result = []
+        seen = set()
         i = 0
         result_length = 0
         while result_length < amount:
             random_number = self._squeeze_number(upper_bound, n, postfix=bytes(i))
-            if random_number not in result:
+            if random_number not in seen:
                 result_length += 1
                 result.append(random_number)
+                seen.add(random_number)
 
             i += 1
 
@@ -173,6 +176,74 @@ class Sponge:
 
         return result
 
+    def grind(self, bits: int) -> int:
+        """Find a nonce such that the hash of the current state and the nonce
+        starts with ``bits`` zero bits, and absorb it. This function is to be
+        called by the prover.
+
+        :param bits: Number of leading zero bits.
+        :type bits: int
+        :return: Nonce.
+        :rtype: int
+        """
+
+        logger.debug(function_begin(self.grind.__name__))
+        logger.debug(parameter_received("bits", bits))
+
+        prefix = self._get_grinding_prefix()
+
+        nonce = 0
+        while not Sponge._is_ground(prefix, nonce, bits):
+            nonce += 1
+
+        self.absorb(nonce)
+
+        logger.debug(function_end(self.grind.__name__, nonce))
+
+        return nonce
+
+    def check_grinding(self, nonce: int, bits: int) -> bool:
+        """Check a nonce found with :meth:`grind` using a single hash, and
+        absorb it if it is valid.
+
+        :param nonce: Nonce.
+        :type nonce: int
+        :param bits: Number of leading zero bits.
+        :type bits: int
+        :return: ``True`` if the nonce is valid. ``False`` otherwise.
+        :rtype: bool
+        """
+
+        logger.debug(function_begin(self.check_grinding.__name__))
+        logger.debug(parameter_received("nonce", nonce))
+        logger.debug(parameter_received("bits", bits))
+
+        result = 0 <= nonce < 1 << GRINDING_NONCE_SIZE_BITS and Sponge._is_ground(
+            self._get_grinding_prefix(), nonce, bits
+        )
+        if result:
+            self.absorb(nonce)
+
+        logger.debug(function_end(self.check_grinding.__name__, result))
+
+        return result
+
+    def _get_grinding_prefix(self) -> typing.Any:
+        """Get the hash of the current state to be extended by a nonce."""
+
+        return hashlib.sha3_256(
+            self._serialize() + self._additional_state.to_bytes(4) + b"grinding"
+        )
+
+    @staticmethod
+    def _is_ground(prefix: typing.Any, nonce: int, bits: int) -> bool:
+        """Check that the hash starts with ``bits`` zero bits."""
+
+        h = prefix.copy()
+        h.update(nonce.to_bytes(GRINDING_NONCE_SIZE_BITS // BYTE_SIZE_BITS))
+
+        return int.from_bytes(h.digest()) >> (256 - bits) == 0
+
     def _squeeze_field_element(self, n: int) -> galois.FieldArray:
         """Squeeze a field element.
 
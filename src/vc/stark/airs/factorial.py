@@ -3,7 +3,6 @@
 import typing
 
 import galois
-import numpy
 
 from vc.constants import FIELD_GOLDILOCKS
 from vc.polynomial import MPoly
@@ -31,12 +30,12 @@ def get_transition_constraints() -> typing.List[MPoly]:
 
 
 def get_aet(n: int) -> galois.FieldArray:
-    aet = numpy.empty((n + 1, 2), dtype=int)
-    aet[0] = [0, 1]
+    # INFO: Python integers reduced modulo the field order are used instead of
+    #       a numpy integer array, which overflows for n > 20.
+    aet = [[0, 1]]
 
     for i in range(1, n + 1):
-        aet[i, 0] = aet[i - 1, 0] + 1
-        aet[i, 1] = aet[i - 1, 1] * aet[i, 0]
+        aet.append([i, (aet[i - 1][1] * i) % FIELD_GOLDILOCKS.order])
 
     return FIELD_GOLDILOCKS(aet)
 
@@ -48,5 +47,9 @@ def get_boundary_constraints(n: int, result: int) -> typing.List[BoundaryConstra
         BoundaryConstraint(i=1, j=0, value=FIELD_GOLDILOCKS(1)),
         BoundaryConstraint(i=1, j=1, value=FIELD_GOLDILOCKS(1)),
         BoundaryConstraint(i=n, j=0, value=FIELD_GOLDILOCKS(n)),
-        BoundaryConstraint(i=n, j=1, value=FIELD_GOLDILOCKS(result)),
+        BoundaryConstraint(
+            i=n,
+            j=1,
+            value=FIELD_GOLDILOCKS(result % FIELD_GOLDILOCKS.order),
+        ),
     ]
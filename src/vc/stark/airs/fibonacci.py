@@ -3,7 +3,6 @@ Fibonacci sequence = {0, 1, 1, ...}, indexation is from 0.
 """
 
 import typing
-import numpy
 import galois
 
 from vc.constants import FIELD_GOLDILOCKS
@@ -46,12 +45,12 @@ def get_aet(n: int) -> galois.FieldArray:
 
     assert n > 0, "unable to create AIR for n < 1"
 
-    aet = numpy.empty((n, 2), dtype=int)
-    aet[0] = [0, 1]
+    # INFO: Python integers reduced modulo the field order are used instead of
+    #       a numpy integer array, which overflows for n > 92.
+    aet = [[0, 1]]
 
     for i in range(1, n):
-        aet[i, 0] = aet[i - 1, 1]
-        aet[i, 1] = aet[i - 1, 0] + aet[i - 1, 1]
+        aet.append([aet[i - 1][1], (aet[i - 1][0] + aet[i - 1][1]) % field.order])
 
     return field(aet)
 
@@ -63,7 +62,7 @@ def get_boundary_constraints(n: int, result: int) -> typing.List[BoundaryConstra
 
     bc = [
         BoundaryConstraint(i=0, j=0, value=field(0)),
-        BoundaryConstraint(i=n - 1, j=1, value=field(result)),
+        BoundaryConstraint(i=n - 1, j=1, value=field(result % field.order)),
     ]
 
     return bc
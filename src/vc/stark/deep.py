@@ -0,0 +1,70 @@
+"""DEEP related functions.
+
+After committing to the boundary quotients and to the composition of the
+transition quotients, the prover answers their values at out-of-domain
+samples, and the verifier checks the constraints there. The low-degree test
+then runs on the DEEP combination polynomial, which is a random combination
+of the quotients ``(p(x) - p(z)) / (x - z)`` of every committed polynomial
+``p`` by every point ``z`` it was answered at. It is of low degree only if
+the answers are correct.
+"""
+
+import galois
+
+from vc.fri.parameters import FriParameters
+from vc.sponge import Sponge
+from vc.stir.parameters import StirParameters
+
+
+def sample_ood_points(
+    sponge: Sponge,
+    parameters: FriParameters | StirParameters,
+    number_of_ood_samples: int,
+) -> galois.FieldArray:
+    """Squeeze the out-of-domain samples. Samples must be neither points of
+    the evaluation domain, where the DEEP quotients are evaluated, nor points
+    of the subgroup the trace is interpolated over, where the transition
+    zerofier vanishes, so they are squeezed again if they are.
+
+    :param sponge: Sponge.
+    :type sponge: Sponge
+    :param parameters: Low-degree test parameters.
+    :type parameters: FriParameters | StirParameters
+    :param number_of_ood_samples: Number of samples.
+    :type number_of_ood_samples: int
+    :return: Out-of-domain samples.
+    :rtype: galois.FieldArray
+    """
+
+    n = parameters.initial_evaluation_domain_length
+
+    points = []
+    while len(points) < number_of_ood_samples:
+        z = sponge.squeeze_field_element()
+        if z**n != 1 and (z / parameters.offset) ** n != 1:
+            points.append(z)
+
+    return parameters.field(points)
+
+
+def squeeze_deep_weights(
+    sponge: Sponge,
+    field: type[galois.FieldArray],
+    number_of_ood_samples: int,
+    n_registers: int,
+) -> galois.FieldArray:
+    """Squeeze the weights of the DEEP combination polynomial.
+
+    :return: Weights with a row per out-of-domain sample. A row holds the
+        weights of the boundary quotients at the sample, of the boundary
+        quotients at the next row of the sample, and of the composition
+        polynomial at the sample.
+    :rtype: galois.FieldArray
+    """
+
+    return field(
+        [
+            [sponge.squeeze_field_element() for _ in range(2 * n_registers + 1)]
+            for _ in range(number_of_ood_samples)
+        ]
+    )
@@ -6,3 +6,6 @@ import galois
 class StarkParameters:
     field: type[galois.FieldArray]
     omicron: galois.FieldArray
+    number_of_ood_samples: int = 1
+    """Number of out-of-domain samples the constraints are checked at. See
+    :func:`vc.fri.soundness.get_number_of_ood_samples`."""
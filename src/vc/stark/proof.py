@@ -5,6 +5,7 @@ import galois
 import pymerkle
 
 from vc.fri.proof import FriProof
+from vc.stir.proof import StirProof
 
 
 @dataclasses.dataclass(slots=True)
@@ -14,8 +15,28 @@ class BoundaryQuotientProof:
     stacked_evaluations: typing.List[galois.FieldArray]
 
 
+@dataclasses.dataclass(slots=True)
+class CompositionProof:
+    merkle_proofs: typing.List[pymerkle.MerkleProof]
+    merkle_root: bytes
+    stacked_evaluations: galois.FieldArray
+    """Opened rows of the composition of the transition quotients."""
+
+
+@dataclasses.dataclass(slots=True)
+class OutOfDomainProof:
+    current: galois.FieldArray
+    """Boundary quotients at the out-of-domain samples, a row per register."""
+    next: galois.FieldArray
+    """Boundary quotients at the next rows of the out-of-domain samples."""
+    composition: galois.FieldArray
+    """Composition polynomial at the out-of-domain samples."""
+
+
 @dataclasses.dataclass(slots=True)
 class StarkProof:
-    combination_polynomial_proof: FriProof
-    bq_current: BoundaryQuotientProof
-    bq_next: BoundaryQuotientProof
+    combination_polynomial_proof: FriProof | StirProof
+    """Low-degree proof of the DEEP combination polynomial."""
+    boundary_quotients: BoundaryQuotientProof
+    composition: CompositionProof
+    ood: OutOfDomainProof
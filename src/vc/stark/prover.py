@@ -11,22 +11,36 @@ from vc.fri.fold import stack
 from vc.sponge import Sponge
 from vc.polynomial import MPoly, scale
 from vc.stark.boundary import Boundaries, BoundaryConstraint
-from vc.stark.proof import BoundaryQuotientProof, StarkProof
+from vc.stark.deep import sample_ood_points, squeeze_deep_weights
+from vc.stark.proof import (
+    BoundaryQuotientProof,
+    CompositionProof,
+    OutOfDomainProof,
+    StarkProof,
+)
 from vc.stark.parameters import StarkParameters
 from vc.fri.prover import FriProver
+from vc.stir.parameters import StirParameters
+from vc.stir.prover import StirProver
 from vc.constants import FIELD_GOLDILOCKS
 from vc.merkle import MerkleTree
-from vc.logging import logging_mark
+from vc.logging import logging_mark, phase
 
 
 field = FIELD_GOLDILOCKS
 logger = logging.getLogger(__name__)
 
 
-@dataclasses.dataclass(slots=True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class StarkProver:
+    """STARK prover. Proving does not modify the prover, so a single
+    instance can be used from multiple threads."""
+
     @dataclasses.dataclass(slots=True, init=False)
     class StarkProverState:
+        """Data derived from the AET height. It is not modified after
+        construction and is shared by all the proofs."""
+
         omicron_domain: galois.FieldArray
 
         def __init__(
@@ -38,8 +52,9 @@ class StarkProver:
             self.omicron_domain = field([omicron**i for i in range(aet_height)])
 
     stark_parameters: StarkParameters
-    fri_parameters: FriParameters
-    fri_prover: FriProver
+    fri_parameters: FriParameters | StirParameters
+    fri_prover: FriProver | StirProver
+    """Low-degree test of the combination polynomial. Either FRI or STIR."""
     state: StarkProverState
 
     @logging_mark(logger)
@@ -48,131 +63,210 @@ class StarkProver:
         aet: galois.FieldArray,
         transition_constraints: typing.List[MPoly],
         boundary_constraints: typing.List[BoundaryConstraint],
+        timings: typing.Dict[str, float] | None = None,
     ) -> StarkProof:
+        """Prove that the AET satisfies the constraints.
+
+        :param timings: Dictionary to record the time spent in every phase
+            of the protocol to, defaults to None.
+        :type timings: typing.Dict[str, float] | None, optional
+        """
+
         sponge = Sponge(self.fri_parameters.field)
 
-        trace_polynomials = self.get_trace_polynomials(aet)
+        with phase(logger, "trace interpolation", timings):
+            trace_polynomials = self.get_trace_polynomials(aet)
 
         n_registers = len(trace_polynomials)
 
-        boundaries = self.get_boundaries(n_registers, boundary_constraints)
-        boundary_quotients = [
-            (tp - bp) // bz
-            for tp, bp, bz in zip(
-                trace_polynomials,
-                boundaries.polynomials,
-                boundaries.zerofiers,
-            )
-        ]
-
-        # TODO: These should all be in the same object.
-        bq_merkle_trees_current: typing.List[MerkleTree] = []
-        bq_merkle_roots_current: typing.List[bytes] = []
-        bq_stacked_evaluations_current: typing.List[galois.FieldArray] = []
-        for boundary_quotient in boundary_quotients:
-            evaluations = boundary_quotient(
-                self.fri_parameters.initial_evaluation_domain
+        with phase(logger, "boundary quotients", timings):
+            boundaries = self.get_boundaries(n_registers, boundary_constraints)
+            boundary_quotients = [
+                (tp - bp) // bz
+                for tp, bp, bz in zip(
+                    trace_polynomials,
+                    boundaries.polynomials,
+                    boundaries.zerofiers,
+                )
+            ]
+
+        with phase(logger, "boundary quotients commitment", timings):
+            # TODO: These should all be in the same object.
+            bq_merkle_trees: typing.List[MerkleTree] = []
+            bq_merkle_roots: typing.List[bytes] = []
+            bq_stacked_evaluations: typing.List[galois.FieldArray] = []
+            for boundary_quotient in boundary_quotients:
+                stacked_evaluations, merkle_tree = self._commit(boundary_quotient)
+                sponge.absorb(merkle_tree.get_root())
+
+                bq_merkle_trees.append(merkle_tree)
+                bq_merkle_roots.append(merkle_tree.get_root())
+                bq_stacked_evaluations.append(stacked_evaluations)
+
+        with phase(logger, "transition quotients", timings):
+            scaled_trace_polynomials = [
+                scale(tp, int(self.stark_parameters.omicron))
+                for tp in trace_polynomials
+            ]
+
+            transition_polynomials = [
+                tc.evals(trace_polynomials + scaled_trace_polynomials)
+                for tc in transition_constraints
+            ]
+
+            omicron_zerofier = self.get_transition_zerofier(aet.shape[0])
+
+            # INFO: Transition polynomials are expected to equal 0 at omicron
+            #       domain, so we only need to divide out the zerofier.
+            transition_quotients = [
+                tp // omicron_zerofier for tp in transition_polynomials
+            ]
+
+        with phase(logger, "composition polynomial", timings):
+            weights = [
+                sponge.squeeze_field_element() for _ in range(len(transition_quotients))
+            ]
+            composition_polynomial = functools.reduce(
+                lambda x, y: x + y,
+                (p * w for p, w in zip(transition_quotients, weights)),
+                galois.Poly.Zero(field=self.fri_parameters.field),
             )
-            stacked_evaluations = stack(
-                evaluations,
-                self.fri_parameters.folding_factor,
+
+            composition_stacked_evaluations, composition_merkle_tree = self._commit(
+                composition_polynomial
             )
+            sponge.absorb(composition_merkle_tree.get_root())
 
-            merkle_tree = MerkleTree()
-            merkle_tree.append_bulk(stacked_evaluations)
-            merkle_root = merkle_tree.get_root()
-            sponge.absorb(merkle_root)
-
-            bq_merkle_trees_current.append(merkle_tree)
-            bq_merkle_roots_current.append(merkle_root)
-            bq_stacked_evaluations_current.append(stacked_evaluations)
-
-        # TODO: Refactor, move out to a function.
-        # INFO: Next evaluations.
-        bq_merkle_trees_next: typing.List[MerkleTree] = []
-        bq_merkle_roots_next: typing.List[bytes] = []
-        bq_stacked_evaluations_next: typing.List[galois.FieldArray] = []
-        for boundary_quotient in boundary_quotients:
-            evaluations = boundary_quotient(
-                self.fri_parameters.initial_evaluation_domain
-                * self.stark_parameters.omicron
+        with phase(logger, "out-of-domain sampling", timings):
+            ood_points = sample_ood_points(
+                sponge,
+                self.fri_parameters,
+                self.stark_parameters.number_of_ood_samples,
             )
-            stacked_evaluations = stack(
-                evaluations,
-                self.fri_parameters.folding_factor,
+            ood_proof = OutOfDomainProof(
+                current=self.fri_parameters.field(
+                    [bq(ood_points) for bq in boundary_quotients]
+                ),
+                next=self.fri_parameters.field(
+                    [
+                        bq(ood_points * self.stark_parameters.omicron)
+                        for bq in boundary_quotients
+                    ]
+                ),
+                composition=composition_polynomial(ood_points),
+            )
+            sponge.absorb(
+                [
+                    ood_proof.current.tolist(),
+                    ood_proof.next.tolist(),
+                    ood_proof.composition.tolist(),
+                ]
             )
 
-            merkle_tree = MerkleTree()
-            merkle_tree.append_bulk(stacked_evaluations)
-            merkle_root = merkle_tree.get_root()
-            sponge.absorb(merkle_root)
-
-            bq_merkle_trees_next.append(merkle_tree)
-            bq_merkle_roots_next.append(merkle_root)
-            bq_stacked_evaluations_next.append(stacked_evaluations)
-
-        scaled_trace_polynomials = [
-            scale(tp, int(self.stark_parameters.omicron)) for tp in trace_polynomials
-        ]
-
-        transition_polynomials = [
-            tc.evals(trace_polynomials + scaled_trace_polynomials)
-            for tc in transition_constraints
-        ]
-
-        omicron_zerofier = self.get_transition_zerofier(aet.shape[0])
-
-        # INFO: Transition polynomials are expected to equal 0 at omicron
-        #       domain, so we only need to divide out the zerofier.
-        transition_quotients = [tp // omicron_zerofier for tp in transition_polynomials]
-
-        commited_polynomials = transition_quotients + boundary_quotients
-        n_weights = len(commited_polynomials)
-        weights = [sponge.squeeze_field_element() for _ in range(n_weights)]
-        combination_polynomial = functools.reduce(
-            lambda x, y: x + y,
-            (p * w for p, w in zip(commited_polynomials, weights)),
-            galois.Poly.Zero(field=self.fri_parameters.field),
-        )
-
-        fri_proof = self.fri_prover.prove(combination_polynomial, sponge)
-        indices_to_prove = fri_proof.round_proofs[0].indices
-
-        bq_merkle_proofs_chosen: typing.List[typing.List[pymerkle.MerkleProof]] = []
-        bq_stacked_evaluations_chosen: typing.List[galois.FieldArray] = []
-        for i, merkle_tree in enumerate(bq_merkle_trees_current):
-            proofs = merkle_tree.prove_bulk(indices_to_prove)
-            bq_merkle_proofs_chosen.append(proofs)
-            bq_stacked_evaluations_chosen.append(
-                bq_stacked_evaluations_current[i][indices_to_prove]
+        with phase(logger, "combination polynomial", timings):
+            deep_weights = squeeze_deep_weights(
+                sponge,
+                self.fri_parameters.field,
+                self.stark_parameters.number_of_ood_samples,
+                n_registers,
+            )
+            combination_polynomial = self.get_deep_polynomial(
+                boundary_quotients,
+                composition_polynomial,
+                ood_points,
+                ood_proof,
+                deep_weights,
             )
 
-        # TODO: Refactor, move out to a function.
-        bq_merkle_proofs_chosen_next: typing.List[typing.List[pymerkle.MerkleProof]] = (
-            []
-        )
-        bq_stacked_evaluations_chosen_next: typing.List[galois.FieldArray] = []
-        for i, merkle_tree in enumerate(bq_merkle_trees_next):
-            proofs = merkle_tree.prove_bulk(indices_to_prove)
-            bq_merkle_proofs_chosen_next.append(proofs)
-            bq_stacked_evaluations_chosen_next.append(
-                bq_stacked_evaluations_next[i][indices_to_prove]
+        with phase(logger, "fri", timings):
+            fri_proof = self.fri_prover.prove(combination_polynomial, sponge)
+
+        with phase(logger, "boundary quotients openings", timings):
+            indices_to_prove = fri_proof.round_proofs[0].indices
+
+            bq_merkle_proofs_chosen: typing.List[typing.List[pymerkle.MerkleProof]] = []
+            bq_stacked_evaluations_chosen: typing.List[galois.FieldArray] = []
+            for i, merkle_tree in enumerate(bq_merkle_trees):
+                proofs = merkle_tree.prove_bulk(indices_to_prove)
+                bq_merkle_proofs_chosen.append(proofs)
+                bq_stacked_evaluations_chosen.append(
+                    bq_stacked_evaluations[i][indices_to_prove]
+                )
+
+            composition_proof = CompositionProof(
+                merkle_proofs=composition_merkle_tree.prove_bulk(indices_to_prove),
+                merkle_root=composition_merkle_tree.get_root(),
+                stacked_evaluations=composition_stacked_evaluations[indices_to_prove],
             )
 
         return StarkProof(
             combination_polynomial_proof=fri_proof,
-            bq_current=BoundaryQuotientProof(
+            boundary_quotients=BoundaryQuotientProof(
                 merkle_proofs=bq_merkle_proofs_chosen,
-                merkle_roots=bq_merkle_roots_current,
+                merkle_roots=bq_merkle_roots,
                 stacked_evaluations=bq_stacked_evaluations_chosen,
             ),
-            bq_next=BoundaryQuotientProof(
-                merkle_proofs=bq_merkle_proofs_chosen_next,
-                merkle_roots=bq_merkle_roots_next,
-                stacked_evaluations=bq_stacked_evaluations_chosen_next,
-            ),
+            composition=composition_proof,
+            ood=ood_proof,
         )
 
+    def _commit(
+        self,
+        polynomial: galois.Poly,
+    ) -> typing.Tuple[galois.FieldArray, MerkleTree]:
+        """Commit to the evaluations of a polynomial over the evaluation
+        domain, stacked the same way as the first round of FRI."""
+
+        stacked_evaluations = stack(
+            self.fri_prover.plan.evaluate(polynomial, 0),
+            self.fri_parameters.folding_factor,
+        )
+
+        merkle_tree = MerkleTree()
+        merkle_tree.append_bulk(stacked_evaluations)
+
+        return stacked_evaluations, merkle_tree
+
+    def get_deep_polynomial(
+        self,
+        boundary_quotients: typing.List[galois.Poly],
+        composition_polynomial: galois.Poly,
+        ood_points: galois.FieldArray,
+        ood_proof: OutOfDomainProof,
+        deep_weights: galois.FieldArray,
+    ) -> galois.Poly:
+        """Get the DEEP combination polynomial. Quotients by the same point
+        are summed before the division, so there are two divisions for every
+        out-of-domain sample.
+
+        :param deep_weights: Weights from :func:`vc.stark.deep.squeeze_deep_weights`.
+        :type deep_weights: galois.FieldArray
+        :return: Random combination of the quotients of the boundary
+            quotients and the composition polynomial by their out-of-domain
+            samples.
+        :rtype: galois.Poly
+        """
+
+        field = self.fri_parameters.field
+        n_registers = len(boundary_quotients)
+        x = galois.Poly.Identity(field=field)
+
+        result = galois.Poly.Zero(field=field)
+        for k, z in enumerate(ood_points):
+            weights = deep_weights[k]
+
+            current = composition_polynomial - ood_proof.composition[k]
+            current *= weights[-1]
+            shifted = galois.Poly.Zero(field=field)
+            for j, bq in enumerate(boundary_quotients):
+                current += (bq - ood_proof.current[j, k]) * weights[j]
+                shifted += (bq - ood_proof.next[j, k]) * weights[n_registers + j]
+
+            result += current // (x - z)
+            result += shifted // (x - z * self.stark_parameters.omicron)
+
+        return result
+
     def get_boundaries(
         self,
         n_registers: int,
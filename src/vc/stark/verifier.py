@@ -11,22 +11,31 @@ from vc.merkle import MerkleTree
 from vc.polynomial import MPoly
 from vc.sponge import Sponge
 from vc.stark.boundary import Boundaries, BoundaryConstraint
+from vc.stark.deep import sample_ood_points, squeeze_deep_weights
 from vc.stark.proof import StarkProof
 from vc.fri.verifier import FriVerifier
 from vc.fri.parameters import FriParameters
-from vc.logging import logging_mark
+from vc.stir.parameters import StirParameters
+from vc.stir.verifier import StirVerifier
+from vc.logging import logging_mark, phase
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclasses.dataclass(slots=True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class StarkVerifier:
-    @dataclasses.dataclass(slots=True)
+    """STARK verifier. Verification does not modify the verifier, so a single
+    instance can be used from multiple threads."""
+
+    @dataclasses.dataclass(slots=True, frozen=True)
     class StarkVerifierState:
-        fri_verifier: FriVerifier
-        fri_parameters: FriParameters
+        fri_verifier: FriVerifier | StirVerifier
+        """Low-degree test of the combination polynomial. Either FRI or STIR."""
+        fri_parameters: FriParameters | StirParameters
         omicron: galois.FieldArray
+        number_of_ood_samples: int = 1
+        """Number of out-of-domain samples. Must be the same as in the prover."""
 
     state: StarkVerifierState
 
@@ -38,128 +47,353 @@ class StarkVerifier:
         boundary_constraints: typing.List[BoundaryConstraint],
         n_registers: int,
         n_rows: int,
+        timings: typing.Dict[str, float] | None = None,
     ) -> bool:
-        sponge = Sponge(self.state.fri_parameters.field)
+        """Verify the proof.
 
-        # TODO: Refactor, move out to a function.
-        # INFO: Verify boundary quotient openings.
-        for stacked_evaluations, merkle_proofs, merkle_root in zip(
-            proof.bq_current.stacked_evaluations,
-            proof.bq_current.merkle_proofs,
-            proof.bq_current.merkle_roots,
-        ):
-            merkle_verification_result = MerkleTree.verify_bulk(
-                stacked_evaluations,
-                merkle_root,
-                merkle_proofs,
+        :param timings: Dictionary to record the time spent in every phase
+            of the protocol to, defaults to None.
+        :type timings: typing.Dict[str, float] | None, optional
+        """
+
+        return self.verify_batch(
+            [proof],
+            transition_constraints,
+            boundary_constraints,
+            n_registers,
+            n_rows,
+            timings,
+        )[0]
+
+    @logging_mark(logger)
+    def verify_batch(
+        self,
+        proofs: typing.List[StarkProof],
+        transition_constraints: typing.List[MPoly],
+        boundary_constraints: typing.List[BoundaryConstraint],
+        n_registers: int,
+        n_rows: int,
+        timings: typing.Dict[str, float] | None = None,
+    ) -> typing.List[bool]:
+        """Verify many proofs for the same constraints. Boundary polynomials
+        and zerofiers are computed once, FRI proofs are verified with
+        :meth:`FriVerifier.verify_batch` and the domain points of the
+        combination checks of all the proofs are computed at once.
+
+        :param timings: Dictionary to record the time spent in every phase
+            of the protocol to, defaults to None.
+        :type timings: typing.Dict[str, float] | None, optional
+        :return: ``True`` for every valid proof. ``False`` otherwise.
+        :rtype: typing.List[bool]
+        """
+
+        sponges = [Sponge(self.state.fri_parameters.field) for _ in proofs]
+
+        with phase(logger, "boundary quotients openings", timings):
+            results = [
+                self._verify_openings(proof, sponge, n_registers)
+                for proof, sponge in zip(proofs, sponges)
+            ]
+
+        with phase(logger, "boundaries", timings):
+            # INFO: This also provides the number of boundary quotients.
+            boundaries = self.get_boundaries(
+                n_registers,
+                boundary_constraints,
+            )
+
+        weights = [
+            [sponge.squeeze_field_element() for _ in transition_constraints]
+            for sponge in sponges
+        ]
+
+        with phase(logger, "out-of-domain check", timings):
+            omicron_zerofier = self.get_transition_zerofier(n_rows)
+            ood_points: typing.List[galois.FieldArray | None] = []
+            deep_weights: typing.List[galois.FieldArray | None] = []
+            for j, (proof, sponge) in enumerate(zip(proofs, sponges)):
+                if not results[j]:
+                    ood_points.append(None)
+                    deep_weights.append(None)
+                    continue
+
+                sponge.absorb(proof.composition.merkle_root)
+                ood_points.append(
+                    sample_ood_points(
+                        sponge,
+                        self.state.fri_parameters,
+                        self.state.number_of_ood_samples,
+                    )
+                )
+                sponge.absorb(
+                    [
+                        proof.ood.current.tolist(),
+                        proof.ood.next.tolist(),
+                        proof.ood.composition.tolist(),
+                    ]
+                )
+                deep_weights.append(
+                    squeeze_deep_weights(
+                        sponge,
+                        self.state.fri_parameters.field,
+                        self.state.number_of_ood_samples,
+                        n_registers,
+                    )
+                )
+
+                if not self._check_ood(
+                    proof,
+                    ood_points[j],
+                    weights[j],
+                    transition_constraints,
+                    boundaries,
+                    omicron_zerofier,
+                ):
+                    logger.error("out-of-domain check failed")
+                    results[j] = False
+
+        with phase(logger, "fri", timings):
+            # INFO: Verify FRI proofs for the combination polynomials.
+            active = [j for j, result in enumerate(results) if result]
+            fri_results = self.state.fri_verifier.verify_batch(
+                [proofs[j].combination_polynomial_proof for j in active],
+                [sponges[j] for j in active],
             )
+            for j, fri_result in zip(active, fri_results):
+                if not fri_result:
+                    logger.error("invalid combination polynomial proof")
+                    results[j] = False
+
+        with phase(logger, "openings", timings):
+            # INFO: The query indices are only the ones squeezed from the
+            #       transcript once the combination polynomial proof is valid.
+            for j, result in enumerate(results):
+                if result and not self._verify_opened_rows(proofs[j]):
+                    results[j] = False
+
+        with phase(logger, "combination check", timings):
+            active = [j for j, result in enumerate(results) if result]
+            if len(active) > 0:
+                combination_results = self._check_combinations(
+                    [proofs[j] for j in active],
+                    [ood_points[j] for j in active],
+                    [deep_weights[j] for j in active],
+                )
+                for j, combination_result in zip(active, combination_results):
+                    results[j] = combination_result
+
+        return results
+
+    def _verify_openings(
+        self,
+        proof: StarkProof,
+        sponge: Sponge,
+        n_registers: int,
+    ) -> bool:
+        """Check the number of boundary quotient openings and the shape of
+        the out-of-domain answers, and absorb the boundary quotient
+        commitments. The opened rows are verified by
+        :meth:`_verify_opened_rows` once the query indices are known."""
+
+        result = True
+
+        bq = proof.boundary_quotients
+        for merkle_root in bq.merkle_roots:
             sponge.absorb(merkle_root)
-            if not merkle_verification_result:
-                logger.error("invalid merkle proof for boundary quotient")
-                return False
 
-        # TODO: Refactor, move out to a function.
-        # INFO: Verify boundary quotient openings.
-        for stacked_evaluations, merkle_proofs, merkle_root in zip(
-            proof.bq_next.stacked_evaluations,
-            proof.bq_next.merkle_proofs,
-            proof.bq_next.merkle_roots,
+        if (
+            len(bq.merkle_roots) != n_registers
+            or len(bq.stacked_evaluations) != n_registers
+            or len(bq.merkle_proofs) != n_registers
+        ):
+            logger.error("invalid number of boundary quotient openings")
+            result = False
+
+        shape = (n_registers, self.state.number_of_ood_samples)
+        if (
+            proof.ood.current.shape != shape
+            or proof.ood.next.shape != shape
+            or proof.ood.composition.shape != shape[1:]
         ):
-            merkle_verification_result = MerkleTree.verify_bulk(
-                stacked_evaluations,
-                merkle_root,
-                merkle_proofs,
+            logger.error("invalid number of out-of-domain answers")
+            result = False
+
+        return result
+
+    def _verify_opened_rows(self, proof: StarkProof) -> bool:
+        """Verify the boundary quotient and composition openings at the
+        query indices of the combination polynomial proof. The proof must
+        already be verified, so that these are the squeezed indices."""
+
+        parameters = self.state.fri_parameters
+        k = parameters.folding_factor
+        indices = proof.combination_polynomial_proof.round_proofs[0].indices
+        number_of_leaves = parameters.initial_evaluation_domain_length // k
+
+        def verify(
+            stacked_evaluations: galois.FieldArray,
+            merkle_root: bytes,
+            merkle_proofs: typing.List,
+        ) -> bool:
+            return (
+                stacked_evaluations.shape == (indices.size, k)
+                and len(merkle_proofs) == indices.size
+                and MerkleTree.verify_bulk(
+                    stacked_evaluations,
+                    merkle_root,
+                    merkle_proofs,
+                    indices,
+                    number_of_leaves,
+                )
             )
-            sponge.absorb(merkle_root)
-            if not merkle_verification_result:
+
+        bq = proof.boundary_quotients
+        for stacked_evaluations, merkle_proofs, merkle_root in zip(
+            bq.stacked_evaluations,
+            bq.merkle_proofs,
+            bq.merkle_roots,
+        ):
+            if not verify(stacked_evaluations, merkle_root, merkle_proofs):
                 logger.error("invalid merkle proof for boundary quotient")
                 return False
 
-        # INFO: This also provides the number of boundary quotients.
-        boundaries = self.get_boundaries(
-            n_registers,
-            boundary_constraints,
-        )
-
-        n_weights = len(transition_constraints) + len(boundaries.zerofiers)
-        weights = [sponge.squeeze_field_element() for _ in range(n_weights)]
-
-        # INFO: Verify FRI proof for the combination polynomial.
-        if not self.state.fri_verifier.verify(
-            proof.combination_polynomial_proof,
-            sponge,
+        if not verify(
+            proof.composition.stacked_evaluations,
+            proof.composition.merkle_root,
+            proof.composition.merkle_proofs,
         ):
-            logger.error("invalid combination polynomial proof")
+            logger.error("invalid merkle proof for composition polynomial")
             return False
 
-        extended_indices = extend_indices(
-            proof.combination_polynomial_proof.round_proofs[0].indices,
-            self.state.fri_parameters.initial_evaluation_domain_length,
-            self.state.fri_parameters.folding_factor,
-        )
+        return True
 
-        extended_xs_current = self.state.fri_parameters.field(
-            self.state.fri_parameters.initial_evaluation_domain[extended_indices],
-        )
-        extended_xs_next = extended_xs_current * self.state.omicron
-
-        tracep_se_current = self.state.fri_parameters.field(
-            numpy.stack(
-                [
-                    bq * bz(extended_xs_current) + bp(extended_xs_current)
-                    for bq, bz, bp in zip(
-                        proof.bq_current.stacked_evaluations,
-                        boundaries.zerofiers,
-                        boundaries.polynomials,
-                    )
-                ],
-                axis=0,
-            )
-        )
+    def _check_ood(
+        self,
+        proof: StarkProof,
+        ood_points: galois.FieldArray,
+        weights: typing.List[galois.FieldArray],
+        transition_constraints: typing.List[MPoly],
+        boundaries: Boundaries,
+        omicron_zerofier: galois.Poly,
+    ) -> bool:
+        """Check the transition constraints at the out-of-domain samples
+        against the answered composition polynomial. Trace values are
+        recovered from the answered boundary quotients."""
 
-        tracep_se_next = self.state.fri_parameters.field(
-            numpy.stack(
-                [
-                    bq * bz(extended_xs_next) + bp(extended_xs_next)
-                    for bq, bz, bp in zip(
-                        proof.bq_next.stacked_evaluations,
-                        boundaries.zerofiers,
-                        boundaries.polynomials,
-                    )
-                ],
-                axis=0,
+        field = self.state.fri_parameters.field
+        ood_points_next = ood_points * self.state.omicron
+
+        trace_current = [
+            bq * bz(ood_points) + bp(ood_points)
+            for bq, bz, bp in zip(
+                proof.ood.current,
+                boundaries.zerofiers,
+                boundaries.polynomials,
             )
-        )
+        ]
+        trace_next = [
+            bq * bz(ood_points_next) + bp(ood_points_next)
+            for bq, bz, bp in zip(
+                proof.ood.next,
+                boundaries.zerofiers,
+                boundaries.polynomials,
+            )
+        ]
+        points = field(numpy.stack(trace_current + trace_next, axis=0))
 
-        points = self.state.fri_parameters.field(
-            numpy.concatenate([tracep_se_current, tracep_se_next], axis=0)
+        composition = functools.reduce(
+            lambda x, y: x + y,
+            (tc.evalv2(points) * w for tc, w in zip(transition_constraints, weights)),
+            field.Zeros(ood_points.size),
         )
 
-        omicron_zerofier = self.get_transition_zerofier(n_rows)
-        omicron_zerofier_evaluations = omicron_zerofier(extended_xs_current)
-        tq_ses = [
-            tc.evalv2(points) // omicron_zerofier_evaluations
-            for tc in transition_constraints
-        ]
+        return bool(
+            numpy.all(composition == proof.ood.composition * omicron_zerofier(ood_points))
+        )
 
-        commited_evaluations = [tq for tq in tq_ses] + [
-            bq for bq in proof.bq_current.stacked_evaluations
+    def _check_combinations(
+        self,
+        proofs: typing.List[StarkProof],
+        ood_points: typing.List[galois.FieldArray],
+        deep_weights: typing.List[galois.FieldArray],
+    ) -> typing.List[bool]:
+        """Check the opened combination polynomial evaluations of many
+        proofs against the DEEP combination of the opened boundary quotients
+        and composition polynomials. Domain points of all the proofs are
+        computed together."""
+
+        query_indices = [
+            proof.combination_polynomial_proof.round_proofs[0].indices
+            for proof in proofs
         ]
+        sizes = [indices.size for indices in query_indices]
+        splits = numpy.cumsum(sizes)[:-1]
 
-        combination_evaluations = functools.reduce(
-            lambda x, y: x + y,
-            (p * w for p, w in zip(commited_evaluations, weights)),
-            self.state.fri_parameters.field(0),
+        extended_indices = extend_indices(
+            numpy.concatenate(query_indices),
+            self.state.fri_parameters.initial_evaluation_domain_length,
+            self.state.fri_parameters.folding_factor,
+        )
+        extended_xs = numpy.split(
+            self.state.fri_parameters.get_domain_points(extended_indices),
+            splits,
         )
 
-        return bool(
-            numpy.all(
-                combination_evaluations
-                == proof.combination_polynomial_proof.round_proofs[
-                    0
-                ].stacked_evaluations
+        results = []
+        for proof, xs, points, weights in zip(
+            proofs,
+            extended_xs,
+            ood_points,
+            deep_weights,
+        ):
+            combination_evaluations = self.get_deep_evaluations(
+                proof,
+                xs,
+                points,
+                weights,
             )
-        )
+            expected = proof.combination_polynomial_proof.round_proofs[
+                0
+            ].stacked_evaluations
+            results.append(bool(numpy.all(combination_evaluations == expected)))
+
+        return results
+
+    def get_deep_evaluations(
+        self,
+        proof: StarkProof,
+        xs: galois.FieldArray,
+        ood_points: galois.FieldArray,
+        deep_weights: galois.FieldArray,
+    ) -> galois.FieldArray:
+        """Evaluate the DEEP combination polynomial from the opened rows.
+        See :meth:`vc.stark.prover.StarkProver.get_deep_polynomial`.
+
+        :param xs: Domain points of the opened rows.
+        :type xs: galois.FieldArray
+        :return: Evaluations of the DEEP combination polynomial at ``xs``.
+        :rtype: galois.FieldArray
+        """
+
+        bqs = proof.boundary_quotients.stacked_evaluations
+        n_registers = len(bqs)
+
+        result = self.state.fri_parameters.field.Zeros(xs.shape)
+        for k, z in enumerate(ood_points):
+            weights = deep_weights[k]
+
+            current = (
+                proof.composition.stacked_evaluations - proof.ood.composition[k]
+            ) * weights[-1]
+            shifted = self.state.fri_parameters.field.Zeros(xs.shape)
+            for j, bq in enumerate(bqs):
+                current += (bq - proof.ood.current[j, k]) * weights[j]
+                shifted += (bq - proof.ood.next[j, k]) * weights[n_registers + j]
+
+            result += current / (xs - z)
+            result += shifted / (xs - z * self.state.omicron)
+
+        return result
 
     @logging_mark(logger)
     def get_boundary_zerofiers(
@@ -0,0 +1,230 @@
+import dataclasses
+import logging
+import math
+import typing
+
+import galois
+import numpy
+
+from vc.fri.soundness import (
+    CONJECTURED,
+    get_bits_per_query,
+    get_number_of_ood_samples,
+    get_number_of_queries,
+)
+from vc.logging import logging_mark
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(init=False, slots=True, repr=False)
+class StirParameters:
+    """STIR parameters.
+
+    The evaluation domain of round ``i`` is ``offset * <omega^(2^i)>``. Every
+    round folds the polynomial by the folding factor, but halves the domain
+    only, so the rate of round ``i`` is the initial rate times
+    ``(2 / k)^i``. Lower rates need fewer queries, which is what makes STIR
+    proofs smaller than FRI proofs.
+    """
+
+    folding_factor_log: int
+    """Folding factor logarithm."""
+    folding_factor: int
+    """Folding factor."""
+    expansion_factor_log: int
+    """Expansion factor logarithm of the initial round."""
+    expansion_factor: int
+    """Expansion factor of the initial round."""
+    initial_coefficients_length_log: int
+    """Number of coefficients in initial polynomial logarithm."""
+    initial_coefficients_length: int
+    """Number of coefficients in initial polynomial."""
+    final_coefficients_length_log: int
+    """Number of coefficients in final polynomial logarithm. Larger than
+    requested when the last rounds would have more constraints than
+    coefficients, see :meth:`_get_number_of_rounds`."""
+    final_coefficients_length: int
+    """Number of coefficients in final polynomial."""
+    initial_evaluation_domain_length: int
+    """Length of the initial evaluation domain."""
+    security_level_bits: int
+    """Security level in bits."""
+    soundness_regime: str
+    """Soundness regime the number of queries is computed for."""
+    number_of_rounds: int
+    """Number of STIR rounds. Every round commits to a new polynomial."""
+    number_of_queries: typing.List[int]
+    """Number of shift queries of every round and of the final check."""
+    number_of_ood_samples: int
+    """Number of out-of-domain samples of every round."""
+    field: type[galois.FieldArray]
+    """Field."""
+    omega: galois.FieldArray
+    """Root of unity for initial domain generation."""
+    offset: galois.FieldArray
+    """Multiplicative group generator. Offset of every evaluation domain."""
+
+    def __repr__(self) -> str:
+        return f"""
+    expansion factor = {self.expansion_factor} (2^{self.expansion_factor_log})
+    folding factor = {self.folding_factor} (2^{self.folding_factor_log})
+    initial coefficients length = {self.initial_coefficients_length} (2^{self.initial_coefficients_length_log})
+    final coefficients length = {self.final_coefficients_length} (2^{self.final_coefficients_length_log})
+    initial evaluation domain length = {self.initial_evaluation_domain_length} (2^{math.log2(self.initial_evaluation_domain_length):.0f})
+
+    security level = {self.security_level_bits} bits
+    soundness regime = {self.soundness_regime}
+    number of rounds = {self.number_of_rounds}
+    number of queries = {self.number_of_queries}
+    number of out-of-domain samples = {self.number_of_ood_samples}
+"""
+
+    @logging_mark(logger)
+    def __init__(
+        self,
+        folding_factor_log: int,
+        expansion_factor_log: int,
+        security_level_bits: int,
+        initial_coefficients_length_log: int,
+        final_coefficients_length_log: int,
+        field: type[galois.FieldArray],
+        soundness_regime: str = CONJECTURED,
+    ) -> None:
+        assert folding_factor_log > 0, "folding factor log must be at least 1"
+        assert expansion_factor_log > 0, "expansion factor log must be at least 1"
+        assert (
+            initial_coefficients_length_log > final_coefficients_length_log
+        ), "initial coefficients length must be greater than the final one"
+
+        self.field = field
+        self.security_level_bits = security_level_bits
+        self.soundness_regime = soundness_regime
+        self.folding_factor_log = folding_factor_log
+        self.folding_factor = 1 << folding_factor_log
+        self.expansion_factor_log = expansion_factor_log
+        self.expansion_factor = 1 << expansion_factor_log
+        self.initial_coefficients_length_log = initial_coefficients_length_log
+        self.initial_coefficients_length = 1 << initial_coefficients_length_log
+
+        self.initial_evaluation_domain_length = (
+            self.initial_coefficients_length * self.expansion_factor
+        )
+
+        self.offset = field.primitive_element
+        self.omega = field.primitive_root_of_unity(
+            self.initial_evaluation_domain_length
+        )
+
+        # INFO: Shift queries of round i are points of the folded domain
+        #       offset^k * <omega^(2^i k)>, which must not be points of the
+        #       next domain offset * <omega^(2^(i + 1))>, where the quotient
+        #       by these points is evaluated.
+        assert (
+            self.offset ** ((self.folding_factor - 1) * self.get_domain_length(1))
+            != 1
+        ), "folded domains intersect the next evaluation domains"
+
+        # INFO: Out-of-domain answers are conjectured to give the bits of the
+        #       field size over the domain length each.
+        self.number_of_ood_samples = get_number_of_ood_samples(
+            security_level_bits,
+            field.order,
+            self.initial_evaluation_domain_length,
+        )
+
+        number_of_folds = math.ceil(
+            (initial_coefficients_length_log - final_coefficients_length_log)
+            / folding_factor_log
+        )
+        self.number_of_queries = [
+            min(
+                get_number_of_queries(
+                    soundness_regime,
+                    security_level_bits,
+                    self.get_rate_log(i),
+                ),
+                self.get_domain_length(i) // self.folding_factor,
+            )
+            for i in range(number_of_folds)
+        ]
+
+        self.number_of_rounds = self._get_number_of_rounds(number_of_folds - 1)
+        del self.number_of_queries[self.number_of_rounds + 1 :]
+
+        self.final_coefficients_length_log = max(
+            0,
+            initial_coefficients_length_log
+            - folding_factor_log * (self.number_of_rounds + 1),
+        )
+        self.final_coefficients_length = 1 << self.final_coefficients_length_log
+
+    def _get_number_of_rounds(self, maximum: int) -> int:
+        """Get the number of rounds, at most ``maximum``.
+
+        Round ``i`` divides the polynomial of the next round by a polynomial
+        vanishing at the out-of-domain samples and the shift queries, so the
+        next polynomial must have more coefficients than there are points.
+        Rounds stop earlier otherwise, and the final polynomial is larger.
+        """
+
+        number_of_rounds = 0
+        while (
+            number_of_rounds < maximum
+            and self.get_coefficients_length(number_of_rounds + 1)
+            > self.number_of_ood_samples + self.number_of_queries[number_of_rounds]
+        ):
+            number_of_rounds += 1
+
+        return number_of_rounds
+
+    def get_rate_log(self, i: int) -> int:
+        """Get the logarithm of the inverse rate of round ``i``."""
+
+        return self.expansion_factor_log + i * (self.folding_factor_log - 1)
+
+    def get_bits_per_query(self, i: int) -> float:
+        """Get security bits every shift query of round ``i`` gives."""
+
+        return get_bits_per_query(self.soundness_regime, self.get_rate_log(i))
+
+    def get_coefficients_length(self, i: int) -> int:
+        """Get the number of coefficients of the polynomial of round ``i``."""
+
+        return max(
+            1,
+            self.initial_coefficients_length >> (self.folding_factor_log * i),
+        )
+
+    def get_domain_length(self, i: int) -> int:
+        """Get the length of the evaluation domain of round ``i``."""
+
+        return self.initial_evaluation_domain_length >> i
+
+    def get_domain_points(
+        self,
+        indices: numpy.ndarray,
+        i: int = 0,
+    ) -> galois.FieldArray:
+        """Get points of the evaluation domain of round ``i`` without computing
+        the domain. The point at index ``j`` is ``offset * omega^(j * 2^i)``.
+
+        :param indices: Indices of the points. Any shape.
+        :type indices: numpy.ndarray[int]
+        :param i: Round, defaults to 0.
+        :type i: int, optional
+        :return: Domain points of the same shape as ``indices``.
+        :rtype: galois.FieldArray
+        """
+
+        exponents = (numpy.asarray(indices, dtype=numpy.int64) << i) % (
+            self.initial_evaluation_domain_length
+        )
+
+        return self.offset * self.omega**exponents
+
+    def is_in_domain(self, x: galois.FieldArray, i: int) -> bool:
+        """Check that ``x`` is a point of the evaluation domain of round ``i``."""
+
+        return bool((x / self.offset) ** self.get_domain_length(i) == 1)
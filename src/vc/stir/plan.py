@@ -0,0 +1,78 @@
+"""Reusable STIR plan.
+
+Holds what STIR computes from the parameters alone: NTT twiddles of the
+initial evaluation domain, which give the twiddles of every round, and the
+folding matrix, which is the same in every round.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+
+import galois
+
+from vc.fri.fold import get_folding_matrix
+from vc.logging import logging_mark
+from vc.ntt import evaluate_on_coset, get_twiddles
+from vc.stir.parameters import StirParameters
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class StirPlan:
+    """Precomputed STIR data."""
+
+    parameters: StirParameters
+    """Parameters the plan is built for."""
+    twiddles: galois.FieldArray
+    """NTT twiddles of the initial evaluation domain."""
+    folding_matrix: galois.FieldArray
+    """Scaled inverse DFT matrix of the cosets: ``zeta^(-i * j) / folding factor``."""
+
+    @staticmethod
+    @logging_mark(logger)
+    def from_parameters(parameters: StirParameters) -> StirPlan:
+        """Build a plan.
+
+        :param parameters: STIR parameters.
+        :type parameters: StirParameters
+        :return: Plan for the parameters.
+        :rtype: StirPlan
+        """
+
+        n = parameters.initial_evaluation_domain_length
+        return StirPlan(
+            parameters=parameters,
+            twiddles=get_twiddles(parameters.omega, n),
+            folding_matrix=get_folding_matrix(
+                parameters.omega,
+                n,
+                parameters.folding_factor,
+            ),
+        )
+
+    def get_twiddles(self, i: int) -> galois.FieldArray:
+        """Get NTT twiddles of the evaluation domain of round ``i``."""
+
+        return self.twiddles[:: 1 << i]
+
+    def evaluate(self, g: galois.Poly, i: int) -> galois.FieldArray:
+        """Evaluate a polynomial over the evaluation domain of round ``i``.
+
+        :param g: Polynomial of degree less than the domain length.
+        :type g: galois.Poly
+        :param i: Round.
+        :type i: int
+        :return: Evaluations in the order of the domain.
+        :rtype: galois.FieldArray
+        """
+
+        return evaluate_on_coset(
+            g,
+            self.parameters.offset,
+            self.get_twiddles(i),
+            self.parameters.get_domain_length(i),
+        )
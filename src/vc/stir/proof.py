@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import dataclasses
+import pickle
+import typing
+
+import galois
+
+from vc.fri.proof import RoundProof
+
+
+@dataclasses.dataclass(slots=True)
+class StirProof:
+    round_proofs: typing.List[RoundProof]
+    """Openings of the committed polynomial of every round at its shift
+    queries. The first one opens the initial polynomial, as in FRI."""
+    merkle_roots: typing.List[bytes]
+    ood_answers: typing.List[galois.FieldArray]
+    """Evaluations of the polynomial committed in every round at the
+    out-of-domain samples."""
+    final_polynomial: galois.Poly
+    degree_correction_length: int
+    """Number of coefficients of the degree correction polynomial. Its
+    randomness is derived from the transcript."""
+
+    def serialize(self) -> bytes:
+        return pickle.dumps(self)
+
+    def __repr__(self) -> str:
+        return f"""
+    final polynomial: {self.final_polynomial}
+    proof size: {len(self.serialize()) // 1024} KB
+"""
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+import typing
+
+import galois
+import numpy
+
+from vc.fri.fold import stack
+from vc.fri.proof import RoundProof
+from vc.logging import current_value, logging_mark
+from vc.merkle import MerkleTree
+from vc.polynomial import expand_ext
+from vc.sponge import Sponge
+from vc.stir.parameters import StirParameters
+from vc.stir.plan import StirPlan
+from vc.stir.proof import StirProof
+from vc.stir.quotient import get_constraints, get_quotient_polynomial, sample_ood_points
+
+
+logger = logging.getLogger(__name__)
+
+
+def fold(
+    g: galois.Poly,
+    randomness: galois.FieldArray,
+    folding_factor: int,
+    coefficients_length: int,
+) -> galois.Poly:
+    """Fold a polynomial of at most ``coefficients_length`` coefficients.
+    Same as :func:`vc.fri.fold.fold_polynomial`, but the polynomial may have
+    less coefficients, as quotients may."""
+
+    size = max(coefficients_length, folding_factor)
+    weights = g.field([randomness**power for power in range(folding_factor)])
+    fold_matrix = g.coefficients(size, order="asc").reshape((-1, folding_factor))
+
+    return galois.Poly(numpy.dot(fold_matrix, weights), order="asc", field=g.field)
+
+
+@dataclasses.dataclass(init=False, slots=True)
+class StirProver:
+    """STIR Prover. Proves the same statement as :class:`vc.fri.prover.FriProver`
+    and commits to the initial polynomial the same way, so it can take the
+    place of the FRI prover in STARK."""
+
+    @dataclasses.dataclass(init=False, slots=True)
+    class State:
+        """State of a single proof. Created by every call to :meth:`StirProver.prove`."""
+
+        sponge: Sponge
+        """Proof stream to be filled."""
+        merkle_trees: typing.List[MerkleTree]
+        """Merkle trees of the committed polynomials."""
+        evaluations: typing.List[galois.FieldArray]
+        """Stacked evaluations of the committed polynomials."""
+        merkle_roots: typing.List[bytes]
+        """Merkle roots of the committed polynomials."""
+        query_indices: typing.List[numpy.ndarray]
+        """Shift query indices of every round."""
+        ood_answers: typing.List[galois.FieldArray]
+        """Answers at the out-of-domain samples of every round."""
+
+        def __init__(
+            self,
+            parameters: StirParameters,
+            sponge: Sponge | None = None,
+        ) -> None:
+            self.sponge = Sponge(parameters.field) if sponge is None else sponge
+            self.merkle_trees = []
+            self.evaluations = []
+            self.merkle_roots = []
+            self.query_indices = []
+            self.ood_answers = []
+
+    _parameters: StirParameters
+    """Public parameters."""
+    _plan: StirPlan
+    """Precomputed twiddles and folding matrix."""
+
+    def __init__(
+        self,
+        parameters: StirParameters,
+        plan: StirPlan | None = None,
+    ) -> None:
+        """Initialize new Prover.
+
+        :param parameters: STIR parameters.
+        :type parameters: StirParameters
+        :param plan: Plan built for the same parameters. A new plan is built
+            when None, defaults to None.
+        :type plan: StirPlan | None, optional
+        """
+
+        self._parameters = parameters
+        self._plan = plan if plan is not None else StirPlan.from_parameters(parameters)
+
+    @property
+    def plan(self) -> StirPlan:
+        return self._plan
+
+    def _commit(
+        self,
+        state: StirProver.State,
+        evaluations: galois.FieldArray,
+    ) -> None:
+        """Commit to the evaluations of a round, stacked for folding."""
+
+        stacked_evaluations = stack(evaluations, self._parameters.folding_factor)
+        state.evaluations.append(stacked_evaluations)
+
+        merkle_tree = MerkleTree()
+        merkle_tree.append_bulk(stacked_evaluations)
+        merkle_root = merkle_tree.get_root()
+
+        state.sponge.absorb(merkle_root)
+        state.merkle_roots.append(merkle_root)
+        state.merkle_trees.append(merkle_tree)
+
+    @logging_mark(logger)
+    def prove(self, f: galois.Poly, sponge: Sponge | None = None) -> StirProof:
+        """Prove that polynomial f is close to RS-code.
+        The prover is not modified, so it can be used from multiple threads.
+
+        :param f: Polynomial to be proven.
+        :type f: galois.Poly
+        :param sponge: Sponge with the transcript so far. A new sponge when
+            None, defaults to None.
+        :type sponge: Sponge | None, optional
+        :return: Proof.
+        :rtype: StirProof
+        """
+
+        parameters = self._parameters
+        k = parameters.folding_factor
+        state = StirProver.State(parameters, sponge)
+
+        self._commit(state, self._plan.evaluate(f, 0))
+
+        degree_correction_length = parameters.initial_coefficients_length - f.degree
+        assert degree_correction_length > 0, "polynomial has too many coefficients"
+
+        randomness = state.sponge.squeeze_field_element()
+        logger.debug(current_value("randomness", randomness))
+        g, _ = expand_ext(f, randomness, parameters.initial_coefficients_length)
+
+        for i in range(parameters.number_of_rounds):
+            folding_randomness = state.sponge.squeeze_field_element()
+            folded = fold(
+                g,
+                folding_randomness,
+                k,
+                parameters.get_coefficients_length(i),
+            )
+            self._commit(state, self._plan.evaluate(folded, i + 1))
+
+            ood_points = sample_ood_points(state.sponge, parameters, i)
+            ood_answers = folded(ood_points)
+            state.sponge.absorb(ood_answers.tolist())
+            state.ood_answers.append(ood_answers)
+
+            query_indices = state.sponge.squeeze_indices(
+                parameters.number_of_queries[i],
+                parameters.get_domain_length(i) // k,
+            )
+            state.query_indices.append(query_indices)
+
+            # INFO: Shift queries are answered by the folded polynomial.
+            #       The verifier gets the answers by folding the opened rows.
+            shift_points = parameters.get_domain_points(query_indices, i) ** k
+            points, answers = get_constraints(
+                ood_points,
+                ood_answers,
+                shift_points,
+                folded(shift_points),
+            )
+
+            combination_randomness = state.sponge.squeeze_field_element()
+            g = get_quotient_polynomial(
+                folded,
+                points,
+                answers,
+                combination_randomness,
+            )
+
+        i = parameters.number_of_rounds
+        final_randomness = state.sponge.squeeze_field_element()
+        final_polynomial = fold(
+            g,
+            final_randomness,
+            k,
+            parameters.get_coefficients_length(i),
+        )
+        state.sponge.absorb(final_polynomial.coefficients(order="asc").tolist())
+
+        state.query_indices.append(
+            state.sponge.squeeze_indices(
+                parameters.number_of_queries[i],
+                parameters.get_domain_length(i) // k,
+            )
+        )
+
+        return StirProof(
+            self._query_phase(state),
+            state.merkle_roots,
+            state.ood_answers,
+            final_polynomial,
+            degree_correction_length,
+        )
+
+    def _query_phase(self, state: StirProver.State) -> typing.List[RoundProof]:
+        """Open the committed polynomials at the shift queries of their rounds."""
+
+        return [
+            RoundProof(
+                evaluations[query_indices],
+                merkle_tree.prove_bulk(query_indices),
+                query_indices,
+            )
+            for evaluations, merkle_tree, query_indices in zip(
+                state.evaluations,
+                state.merkle_trees,
+                state.query_indices,
+            )
+        ]
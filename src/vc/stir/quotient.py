@@ -0,0 +1,156 @@
+"""Quotient related functions.
+
+Every STIR round constrains the next polynomial at a set of points: the
+out-of-domain samples and the shift queries. The polynomial of the next
+round is the quotient of the committed polynomial by these constraints,
+degree-corrected back to the expected number of coefficients.
+"""
+
+import typing
+
+import galois
+import numpy
+
+from vc.polynomial import evaluate_degree_correction
+from vc.sponge import Sponge
+from vc.stir.parameters import StirParameters
+
+
+def sample_ood_points(
+    sponge: Sponge,
+    parameters: StirParameters,
+    i: int,
+) -> galois.FieldArray:
+    """Squeeze the out-of-domain samples of round ``i``. Samples must not be
+    points of the next evaluation domain, so they are squeezed again if they
+    are.
+
+    :param sponge: Sponge.
+    :type sponge: Sponge
+    :param parameters: STIR parameters.
+    :type parameters: StirParameters
+    :param i: Round.
+    :type i: int
+    :return: Out-of-domain samples.
+    :rtype: galois.FieldArray
+    """
+
+    points = []
+    while len(points) < parameters.number_of_ood_samples:
+        x = sponge.squeeze_field_element()
+        if not parameters.is_in_domain(x, i + 1):
+            points.append(x)
+
+    return parameters.field(points)
+
+
+def get_constraints(
+    ood_points: galois.FieldArray,
+    ood_answers: galois.FieldArray,
+    shift_points: galois.FieldArray,
+    shift_answers: galois.FieldArray,
+) -> typing.Tuple[galois.FieldArray, galois.FieldArray]:
+    """Join the constraints at the out-of-domain samples and the shift
+    queries. Repeated points are kept once, with their first answer.
+
+    :return: Distinct points and answers at them.
+    :rtype: typing.Tuple[galois.FieldArray, galois.FieldArray]
+    """
+
+    points = numpy.concatenate([ood_points, shift_points])
+    answers = numpy.concatenate([ood_answers, shift_answers])
+
+    _, first = numpy.unique(points.view(numpy.ndarray), return_index=True)
+    first = numpy.sort(first)
+
+    return points[first], answers[first]
+
+
+def get_quotient_polynomial(
+    g: galois.Poly,
+    points: galois.FieldArray,
+    answers: galois.FieldArray,
+    randomness: galois.FieldArray,
+) -> galois.Poly:
+    """Get the degree-corrected quotient of ``g`` by the constraints.
+
+    :param g: Polynomial committed in the round.
+    :type g: galois.Poly
+    :param points: Distinct constrained points.
+    :type points: galois.FieldArray
+    :param answers: Values ``g`` is expected to have at the points.
+    :type answers: galois.FieldArray
+    :param randomness: Degree correction randomness.
+    :type randomness: galois.FieldArray
+    :return: Polynomial ``(g - answers) / vanishing * correction``, where
+        the correction has one coefficient more than there are points.
+    :rtype: galois.Poly
+    """
+
+    field = type(points)
+    quotient = (g - galois.lagrange_poly(points, answers)) // galois.Poly.Roots(
+        points,
+        field=field,
+    )
+    correction = galois.Poly(
+        [randomness**power for power in range(points.size + 1)],
+        field=field,
+        order="asc",
+    )
+
+    return quotient * correction
+
+
+def evaluate_quotient(
+    evaluations: galois.FieldArray,
+    xs: galois.FieldArray,
+    points: galois.FieldArray,
+    answers: galois.FieldArray,
+    randomness: galois.FieldArray,
+) -> galois.FieldArray:
+    """Evaluate the degree-corrected quotient from the evaluations of the
+    committed polynomial. See :func:`get_quotient_polynomial`.
+
+    :param evaluations: Evaluations of the committed polynomial at ``xs``.
+    :type evaluations: galois.FieldArray
+    :param xs: Points none of which is constrained. Any shape.
+    :type xs: galois.FieldArray
+    :param points: Distinct constrained points.
+    :type points: galois.FieldArray
+    :param answers: Values expected at the points.
+    :type answers: galois.FieldArray
+    :param randomness: Degree correction randomness.
+    :type randomness: galois.FieldArray
+    :return: Evaluations of the quotient at ``xs``.
+    :rtype: galois.FieldArray
+    """
+
+    field = type(points)
+
+    # INFO: The answer polynomial at x is sum_j c_j prod_(m != j) (x - p_m),
+    #       where c_j is the answer at p_j over prod_(m != j) (p_j - p_m).
+    #       Products without one factor are products of prefixes and
+    #       suffixes, so there is a single inverse for every point.
+    differences = points[:, numpy.newaxis] - points
+    differences[numpy.diag_indices(points.size)] = 1
+    weights = answers / numpy.prod(differences, axis=-1)
+
+    differences = xs[..., numpy.newaxis] - points
+    ones = field.Ones(xs.shape + (1,))
+    prefixes = numpy.multiply.accumulate(
+        numpy.concatenate([ones, differences[..., :-1]], axis=-1),
+        axis=-1,
+    )
+    suffixes = numpy.multiply.accumulate(
+        numpy.concatenate([ones, differences[..., :0:-1]], axis=-1),
+        axis=-1,
+    )[..., ::-1]
+
+    vanishing = prefixes[..., -1] * differences[..., -1]
+    answer_evaluations = numpy.sum(prefixes * suffixes * weights, axis=-1)
+
+    return (
+        (evaluations - answer_evaluations)
+        / vanishing
+        * evaluate_degree_correction(randomness, points.size + 1, xs)
+    )
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+import typing
+
+import galois
+import numpy
+
+from vc.fri.fold import fold_evaluations, get_folding_matrix
+from vc.logging import current_value, logging_mark
+from vc.merkle import MerkleTree
+from vc.polynomial import evaluate_degree_correction
+from vc.sponge import Sponge
+from vc.stir.parameters import StirParameters
+from vc.stir.proof import StirProof
+from vc.stir.quotient import evaluate_quotient, get_constraints, sample_ood_points
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(init=False, slots=True)
+class StirVerifier:
+    """STIR Verifier."""
+
+    @dataclasses.dataclass(slots=True, init=False)
+    class State:
+        """State of a single verification. Created by every call to :meth:`StirVerifier.verify`."""
+
+        sponge: Sponge
+        """Sponge."""
+        degree_correction_randomness: galois.FieldArray
+        """Degree correction randomness of the initial polynomial."""
+        folding_randomness: typing.List[galois.FieldArray]
+        """Folding randomness of every round and of the final fold."""
+        ood_points: typing.List[galois.FieldArray]
+        """Out-of-domain samples of every round."""
+        query_indices: typing.List[numpy.ndarray]
+        """Shift query indices of every round and of the final check."""
+        combination_randomness: typing.List[galois.FieldArray]
+        """Degree correction randomness of the quotient of every round."""
+
+        def __init__(
+            self,
+            parameters: StirParameters,
+            sponge: Sponge | None = None,
+        ) -> None:
+            self.sponge = sponge if sponge is not None else Sponge(parameters.field)
+            self.folding_randomness = []
+            self.ood_points = []
+            self.query_indices = []
+            self.combination_randomness = []
+
+    _parameters: StirParameters
+    _folding_matrix: galois.FieldArray
+    _coset_powers: galois.FieldArray
+    """Powers of the generator of the cosets the rows are evaluations over."""
+
+    def __init__(self, parameters: StirParameters) -> None:
+        """Initialize new Verifier.
+
+        :param parameters: STIR parameters.
+        :type parameters: StirParameters
+        """
+
+        self._parameters = parameters
+        self._folding_matrix = get_folding_matrix(
+            parameters.omega,
+            parameters.initial_evaluation_domain_length,
+            parameters.folding_factor,
+        )
+
+        n = parameters.initial_evaluation_domain_length
+        self._coset_powers = parameters.omega ** (
+            numpy.arange(parameters.folding_factor) * (n // parameters.folding_factor)
+        )
+
+    @logging_mark(logger)
+    def verify(self, proof: StirProof, sponge: Sponge | None = None) -> bool:
+        """Verify proof.
+        The verifier is not modified, so it can be used from multiple threads.
+
+        :param proof: Proof for some polynomial.
+        :type proof: StirProof
+        :param sponge: Sponge with the transcript so far. A new sponge when
+            None, defaults to None.
+        :type sponge: Sponge | None, optional
+        :return: ``True`` if ``proof`` is valid. ``False`` otherwise.
+        :rtype: bool
+        """
+
+        if not self._check_structure(proof):
+            return False
+
+        state = StirVerifier.State(self._parameters, sponge)
+        self._replay(proof, state)
+
+        for i, round_proof in enumerate(proof.round_proofs):
+            if not numpy.array_equal(round_proof.indices, state.query_indices[i]):
+                logger.error(f"invalid query indices in round {i}")
+                return False
+
+        return self._verify_rounds(proof, state)
+
+    @logging_mark(logger)
+    def verify_batch(
+        self,
+        proofs: typing.List[StirProof],
+        sponges: typing.List[Sponge | None] | None = None,
+    ) -> typing.List[bool]:
+        """Verify many proofs. Same as :meth:`vc.fri.verifier.FriVerifier.verify_batch`,
+        but the proofs are verified one by one.
+
+        :param proofs: Proofs for some polynomials.
+        :type proofs: typing.List[StirProof]
+        :param sponges: Sponge for every proof. New sponges when None,
+            defaults to None.
+        :type sponges: typing.List[Sponge | None] | None, optional
+        :return: ``True`` for every valid proof. ``False`` otherwise.
+        :rtype: typing.List[bool]
+        """
+
+        if sponges is None:
+            sponges = [None] * len(proofs)
+
+        assert len(sponges) == len(proofs), "there must be a sponge for every proof"
+
+        return [self.verify(proof, sponge) for proof, sponge in zip(proofs, sponges)]
+
+    def _check_structure(self, proof: StirProof) -> bool:
+        """Check the number of rounds, the out-of-domain answers, the final
+        polynomial degree and the Merkle proofs."""
+
+        parameters = self._parameters
+        if not (
+            0 < proof.degree_correction_length <= parameters.initial_coefficients_length
+        ):
+            logger.error(f"invalid degree correction length")
+            return False
+
+        if proof.final_polynomial.degree + 1 > parameters.final_coefficients_length:
+            logger.error(f"invalid final polynomial degree")
+            return False
+
+        if (
+            len(proof.round_proofs) != parameters.number_of_rounds + 1
+            or len(proof.merkle_roots) != parameters.number_of_rounds + 1
+            or len(proof.ood_answers) != parameters.number_of_rounds
+        ):
+            logger.error(f"invalid number of rounds")
+            return False
+
+        for ood_answers in proof.ood_answers:
+            if ood_answers.shape != (parameters.number_of_ood_samples,):
+                logger.error(f"invalid number of out-of-domain answers")
+                return False
+
+        # INFO: The proofs are bound to the indices the prover sent, which
+        #       are checked against the shift queries in the rounds.
+        for i, (merkle_root, round_proof) in enumerate(
+            zip(proof.merkle_roots, proof.round_proofs)
+        ):
+            if round_proof.stacked_evaluations.shape != (
+                round_proof.indices.size,
+                parameters.folding_factor,
+            ) or not MerkleTree.verify_bulk(
+                round_proof.stacked_evaluations,
+                merkle_root,
+                round_proof.proofs,
+                round_proof.indices,
+                parameters.get_domain_length(i) // parameters.folding_factor,
+            ):
+                logger.error(f"invalid merkle tree proofs")
+                return False
+
+        return True
+
+    def _replay(self, proof: StirProof, state: StirVerifier.State) -> None:
+        """Derive the verifier's randomness from the transcript."""
+
+        parameters = self._parameters
+        k = parameters.folding_factor
+
+        state.sponge.absorb(proof.merkle_roots[0])
+        state.degree_correction_randomness = state.sponge.squeeze_field_element()
+        logger.debug(
+            current_value("randomness", state.degree_correction_randomness)
+        )
+
+        for i in range(parameters.number_of_rounds):
+            state.folding_randomness.append(state.sponge.squeeze_field_element())
+            state.sponge.absorb(proof.merkle_roots[i + 1])
+
+            state.ood_points.append(sample_ood_points(state.sponge, parameters, i))
+            state.sponge.absorb(proof.ood_answers[i].tolist())
+
+            state.query_indices.append(
+                state.sponge.squeeze_indices(
+                    parameters.number_of_queries[i],
+                    parameters.get_domain_length(i) // k,
+                )
+            )
+            state.combination_randomness.append(state.sponge.squeeze_field_element())
+
+        i = parameters.number_of_rounds
+        state.folding_randomness.append(state.sponge.squeeze_field_element())
+        state.sponge.absorb(proof.final_polynomial.coefficients(order="asc").tolist())
+        state.query_indices.append(
+            state.sponge.squeeze_indices(
+                parameters.number_of_queries[i],
+                parameters.get_domain_length(i) // k,
+            )
+        )
+
+    def _verify_rounds(self, proof: StirProof, state: StirVerifier.State) -> bool:
+        """Fold the opened rows of every round to get the answers at its
+        shift queries. The answers constrain the polynomial of the next round,
+        and the answers of the final round are checked against the final
+        polynomial."""
+
+        parameters = self._parameters
+        field = parameters.field
+        k = parameters.folding_factor
+
+        points = None
+        answers = None
+        for i, round_proof in enumerate(proof.round_proofs):
+            # INFO: Row points are the coset offsets times the powers of the
+            #       coset generator, which saves a power for most of them.
+            offsets = parameters.get_domain_points(round_proof.indices, i)
+            xs = offsets[:, numpy.newaxis] * self._coset_powers
+
+            # INFO: Rows of the initial round are evaluations of the initial
+            #       polynomial, which is degree-corrected as in FRI. Rows of
+            #       the next rounds are evaluations of the committed
+            #       polynomials, which are turned into the quotients.
+            if i == 0:
+                rows = round_proof.stacked_evaluations * evaluate_degree_correction(
+                    state.degree_correction_randomness,
+                    proof.degree_correction_length,
+                    xs,
+                )
+            else:
+                rows = evaluate_quotient(
+                    round_proof.stacked_evaluations,
+                    xs,
+                    points,
+                    answers,
+                    state.combination_randomness[i - 1],
+                )
+
+            folded_values = fold_evaluations(
+                rows,
+                field(1),
+                state.folding_randomness[i] * numpy.reciprocal(offsets),
+                self._folding_matrix,
+            )
+            shift_points = offsets**k
+
+            if i == parameters.number_of_rounds:
+                if not numpy.all(folded_values == proof.final_polynomial(shift_points)):
+                    logger.error(f"final check failed")
+                    return False
+
+                continue
+
+            points, answers = get_constraints(
+                state.ood_points[i],
+                proof.ood_answers[i],
+                shift_points,
+                folded_values,
+            )
+
+        return True
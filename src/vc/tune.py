@@ -0,0 +1,520 @@
+"""FRI parameter tuning.
+
+Prover time and proof size move in opposite directions across the folding
+factor, the expansion factor and the final polynomial length. :func:`tune`
+goes over all the parameters reaching a security level and picks the best
+ones for an objective: a weighted mix of the predicted prover time, verifier
+time and proof size.
+
+The predictions come from a :class:`CostModel`, whose per-operation costs are
+measured with microbenchmarks on the local machine by
+:meth:`CostModel.calibrate`. The model follows the evaluation form prover:
+
+- the initial evaluation is an NTT over the initial domain,
+- the degree correction is evaluated at every point of the initial domain,
+- every round is folded with a ``k x k`` matrix per row and committed to
+  with a Merkle tree of ``k`` elements per leaf,
+- every query opens a row and a Merkle path in every round,
+- the proof-of-work tries ``2^grinding_bits`` nonces on average.
+
+The verifier checks every path and folds every opened row. The proof size
+is computed from the field element size and the Merkle path lengths, scaled
+by the serialization overhead measured on a real proof.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import math
+import timeit
+import typing
+
+import galois
+import numpy
+
+from vc.constants import MERKLE_HASH_SIZE
+from vc.fri.fold import fold_evaluations, get_folding_matrix, stack
+from vc.fri.parameters import FriParameters
+from vc.fri.prover import FriProver
+from vc.fri.soundness import CONJECTURED
+from vc.merkle import MerkleTree
+from vc.ntt import evaluate_on_coset, get_twiddles
+from vc.polynomial import evaluate_degree_correction
+from vc.sponge import Sponge
+
+
+logger = logging.getLogger(__name__)
+
+PROVER_TIME = "prover"
+VERIFIER_TIME = "verifier"
+PROOF_SIZE = "size"
+OBJECTIVES = (PROVER_TIME, VERIFIER_TIME, PROOF_SIZE)
+
+MAX_FOLDING_FACTOR_LOG = 4
+MAX_EXPANSION_FACTOR_LOG = 4
+
+CALIBRATION_SIZE_LOG = 10
+"""Size of the microbenchmarks."""
+CALIBRATION_REPEATS = 3
+"""Number of runs of every microbenchmark. The fastest one is taken."""
+CALIBRATION_GRINDING_BITS = 10
+"""Grinding bits of the proof-of-work microbenchmark."""
+
+
+def _measure(function: typing.Callable[[], typing.Any]) -> float:
+    """Get the fastest time of a function in nanoseconds."""
+
+    timings = []
+    for _ in range(CALIBRATION_REPEATS):
+        begin = timeit.default_timer()
+        function()
+        timings.append(timeit.default_timer() - begin)
+
+    return min(timings) * 1_000_000_000
+
+
+def _get_two_adicity(field: type[galois.FieldArray]) -> int:
+    """Get the logarithm of the largest power of two subgroup of the field."""
+
+    order = field.order - 1
+    return (order & -order).bit_length() - 1
+
+
+@dataclasses.dataclass(slots=True)
+class CostModel:
+    """Costs of the operations FRI is built from, in nanoseconds."""
+
+    field: type[galois.FieldArray]
+    """Field the costs were measured for."""
+    ntt_ns: float
+    """NTT cost per element and butterfly layer."""
+    pointwise_ns: float
+    """Degree correction cost per point."""
+    fold_ns: float
+    """Folding cost per element and folding factor."""
+    leaf_ns: float
+    """Merkle leaf cost, apart from its elements."""
+    leaf_element_ns: float
+    """Merkle leaf cost per element."""
+    open_ns: float
+    """Merkle path cost per level when proving."""
+    verify_ns: float
+    """Merkle path cost per level when verifying."""
+    evaluate_ns: float
+    """Polynomial evaluation cost per point and coefficient."""
+    grinding_ns: float
+    """Proof-of-work cost per nonce tried."""
+    proof_size_overhead: float
+    """Ratio of the serialized proof size to the computed one."""
+
+    @staticmethod
+    def calibrate(field: type[galois.FieldArray]) -> CostModel:
+        """Measure the costs on the local machine.
+
+        :param field: Field to measure the costs for.
+        :type field: type[galois.FieldArray]
+        :return: Measured costs.
+        :rtype: CostModel
+        """
+
+        n_log = CALIBRATION_SIZE_LOG
+        n = 1 << n_log
+        omega = field.primitive_root_of_unity(n)
+        offset = field.primitive_element
+
+        g = galois.Poly.Random(n - 1, field=field, seed=1)
+        twiddles = get_twiddles(omega, n)
+        ntt_ns = _measure(lambda: evaluate_on_coset(g, offset, twiddles, n)) / (
+            n * n_log
+        )
+
+        xs = field.Random(n, seed=2)
+        randomness = field.Random(seed=3)
+        pointwise_ns = (
+            _measure(lambda: evaluate_degree_correction(randomness, n // 2, xs)) / n
+        )
+
+        folding_factor = 4
+        stacked_evaluations = stack(xs, folding_factor)
+        folding_matrix = get_folding_matrix(omega, n, folding_factor)
+        coset_inverses = field.Random(n // folding_factor, low=1, seed=4)
+        fold_ns = _measure(
+            lambda: fold_evaluations(
+                stacked_evaluations,
+                randomness,
+                coset_inverses,
+                folding_matrix,
+            )
+        ) / (n * folding_factor)
+
+        # INFO: The leaf cost is linear in the number of elements, so it is
+        #       measured for two leaf lengths.
+        number_of_leaves = n // 16
+        narrow_ns, wide_ns = (
+            _measure(lambda: MerkleTree().append_bulk(xs[: number_of_leaves * k].reshape(-1, k)))
+            / number_of_leaves
+            for k in (2, 16)
+        )
+        leaf_element_ns = max(0.0, (wide_ns - narrow_ns) / 14)
+        leaf_ns = max(0.0, narrow_ns - 2 * leaf_element_ns)
+
+        leaves = stack(xs, 2)
+        merkle_tree = MerkleTree()
+        merkle_tree.append_bulk(leaves)
+        root = merkle_tree.get_root()
+        indices = numpy.arange(0, leaves.shape[0], 8)
+        levels = indices.size * (n_log - 1)
+        open_ns = _measure(lambda: merkle_tree.prove_bulk(indices)) / levels
+
+        proofs = merkle_tree.prove_bulk(indices)
+        verify_ns = (
+            _measure(lambda: MerkleTree.verify_bulk(leaves[indices], root, proofs))
+            / levels
+        )
+
+        points = xs[indices]
+        h = galois.Poly.Random(n // 16 - 1, field=field, seed=6)
+        evaluate_ns = _measure(lambda: h(points)) / (points.size * n // 16)
+
+        # INFO: The transcript is the same every run, so every run tries the
+        #       same number of nonces.
+        def grind() -> int:
+            sponge = Sponge(field)
+            sponge.absorb(b"calibration")
+            return sponge.grind(CALIBRATION_GRINDING_BITS)
+
+        grinding_ns = _measure(grind) / (grind() + 1)
+
+        cost_model = CostModel(
+            field=field,
+            ntt_ns=ntt_ns,
+            pointwise_ns=pointwise_ns,
+            fold_ns=fold_ns,
+            leaf_ns=leaf_ns,
+            leaf_element_ns=leaf_element_ns,
+            open_ns=open_ns,
+            verify_ns=verify_ns,
+            evaluate_ns=evaluate_ns,
+            grinding_ns=grinding_ns,
+            proof_size_overhead=1.0,
+        )
+        cost_model.proof_size_overhead = cost_model._measure_proof_size_overhead()
+
+        return cost_model
+
+    def _measure_proof_size_overhead(self) -> float:
+        # INFO: The security level only sets the number of queries, it is low
+        #       enough for the commit phase of 32 bit fields.
+        parameters = FriParameters(
+            folding_factor_log=2,
+            expansion_factor_log=2,
+            security_level_bits=16,
+            initial_coefficients_length_log=CALIBRATION_SIZE_LOG - 2,
+            final_coefficients_length_log=1,
+            field=self.field,
+        )
+        g = galois.Poly.Random(
+            parameters.initial_coefficients_length - 1,
+            field=self.field,
+            seed=5,
+        )
+        proof = FriProver(parameters).prove(g)
+
+        return len(proof.serialize()) / CostModel.compute_proof_size(parameters)
+
+    @staticmethod
+    def compute_proof_size(parameters: FriParameters) -> float:
+        """Compute the size of the opened rows, Merkle paths and roots, the
+        rounds sent in full and the final polynomial in bytes, without
+        serialization overhead.
+
+        :param parameters: FRI parameters.
+        :type parameters: FriParameters
+        :return: Proof size in bytes.
+        :rtype: float
+        """
+
+        element_size = math.ceil(parameters.field.order.bit_length() / 8)
+
+        size = parameters.final_coefficients_length * element_size
+        for i, (n, k) in enumerate(CostModel._get_domain_lengths(parameters)):
+            if not parameters.is_committed(i):
+                size += n * element_size
+                continue
+
+            number_of_leaves = n // k
+            queries = min(parameters.number_of_repetitions, number_of_leaves)
+            size += MERKLE_HASH_SIZE + queries * (
+                k * element_size + math.log2(number_of_leaves) * MERKLE_HASH_SIZE
+            )
+
+        return size
+
+    @staticmethod
+    def _get_domain_lengths(
+        parameters: FriParameters,
+    ) -> typing.List[typing.Tuple[int, int]]:
+        """Get the domain lengths of the rounds together with their folding
+        factors."""
+
+        return [
+            (parameters.get_domain_length(i), parameters.folding_factors[i])
+            for i in range(parameters.number_of_rounds + 1)
+        ]
+
+    def predict_prover_ns(self, parameters: FriParameters) -> float:
+        """Predict the prover time in nanoseconds.
+
+        :param parameters: FRI parameters.
+        :type parameters: FriParameters
+        :return: Prover time.
+        :rtype: float
+        """
+
+        n = parameters.initial_evaluation_domain_length
+
+        result = self.ntt_ns * n * math.log2(n) + self.pointwise_ns * n
+        if parameters.grinding_bits > 0:
+            result += self.grinding_ns * (1 << parameters.grinding_bits)
+        for i, (n, k) in enumerate(CostModel._get_domain_lengths(parameters)):
+            number_of_leaves = n // k
+            queries = min(parameters.number_of_repetitions, number_of_leaves)
+            result += self.fold_ns * n * k
+            if parameters.is_committed(i):
+                result += (
+                    self.leaf_ns + self.leaf_element_ns * k
+                ) * number_of_leaves + self.open_ns * queries * math.log2(
+                    number_of_leaves
+                )
+
+        return result
+
+    def predict_verifier_ns(self, parameters: FriParameters) -> float:
+        """Predict the verifier time in nanoseconds.
+
+        :param parameters: FRI parameters.
+        :type parameters: FriParameters
+        :return: Verifier time.
+        :rtype: float
+        """
+
+        # INFO: The proof-of-work is checked with a single hash.
+        result = self.grinding_ns if parameters.grinding_bits > 0 else 0.0
+        for i, (n, k) in enumerate(CostModel._get_domain_lengths(parameters)):
+            number_of_leaves = n // k
+            queries = min(parameters.number_of_repetitions, number_of_leaves)
+
+            # INFO: Every query needs a coset offset, which costs about as
+            #       much as a point of the degree correction.
+            result += queries * (self.fold_ns * k * k + self.pointwise_ns)
+            if parameters.is_committed(i):
+                result += queries * (
+                    self.verify_ns * math.log2(number_of_leaves)
+                    + self.leaf_ns
+                    + self.leaf_element_ns * k
+                )
+
+            # INFO: The degree correction is evaluated at the opened points.
+            if i == 0:
+                result += 2 * self.pointwise_ns * queries * k
+
+        # INFO: The final polynomial is evaluated at the last queries.
+        queries = min(parameters.number_of_repetitions, number_of_leaves)
+        result += queries * (
+            self.pointwise_ns
+            + self.evaluate_ns * parameters.final_coefficients_length
+        )
+
+        return result
+
+    def predict_proof_size(self, parameters: FriParameters) -> float:
+        """Predict the serialized proof size in bytes.
+
+        :param parameters: FRI parameters.
+        :type parameters: FriParameters
+        :return: Proof size.
+        :rtype: float
+        """
+
+        return self.proof_size_overhead * CostModel.compute_proof_size(parameters)
+
+
+@dataclasses.dataclass(slots=True)
+class Candidate:
+    """FRI parameters with predicted costs."""
+
+    parameters: FriParameters
+    prover_ns: float
+    verifier_ns: float
+    proof_size: float
+    """Proof size in bytes."""
+    cost: float = 0.0
+    """Weighted cost relative to the best candidate for every objective."""
+
+    def get(self, objective: str) -> float:
+        assert objective in OBJECTIVES, f"unknown objective {objective}"
+
+        if objective == PROVER_TIME:
+            return self.prover_ns
+        if objective == VERIFIER_TIME:
+            return self.verifier_ns
+
+        return self.proof_size
+
+    def __repr__(self) -> str:
+        return (
+            f"ff = 2^{self.parameters.folding_factor_log}, "
+            + f"ef = 2^{self.parameters.expansion_factor_log}, "
+            + f"fd = 2^{self.parameters.final_coefficients_length_log}, "
+            + f"queries = {self.parameters.number_of_repetitions}: "
+            + f"prover {self.prover_ns / 1_000_000:.0f} ms, "
+            + f"verifier {self.verifier_ns / 1_000_000:.1f} ms, "
+            + f"proof {self.proof_size / 1024:.0f} KB, "
+            + f"cost {self.cost:.3f}"
+        )
+
+
+def get_candidates(
+    field: type[galois.FieldArray],
+    security_level_bits: int,
+    coefficients_length_log: int,
+    trace: bool = False,
+    grinding_bits: int = 0,
+    soundness_regime: str = CONJECTURED,
+) -> typing.List[FriParameters]:
+    """Get all the parameters reaching the security level.
+
+    :param field: Field.
+    :type field: type[galois.FieldArray]
+    :param security_level_bits: Security level in bits.
+    :type security_level_bits: int
+    :param coefficients_length_log: Number of coefficients of the polynomial
+        logarithm, or the STARK trace length logarithm when ``trace`` is set.
+    :type coefficients_length_log: int
+    :param trace: Tune STARK parameters, whose polynomial has the trace
+        length times the expansion factor coefficients, defaults to False.
+    :type trace: bool, optional
+    :param grinding_bits: Security bits from the proof-of-work, defaults to 0.
+    :type grinding_bits: int, optional
+    :param soundness_regime: Soundness regime, defaults to CONJECTURED.
+    :type soundness_regime: str, optional
+    :return: Parameters.
+    :rtype: typing.List[FriParameters]
+    """
+
+    two_adicity = _get_two_adicity(field)
+
+    result = []
+    for expansion_factor_log in range(1, MAX_EXPANSION_FACTOR_LOG + 1):
+        initial_coefficients_length_log = coefficients_length_log + (
+            expansion_factor_log if trace else 0
+        )
+        if initial_coefficients_length_log + expansion_factor_log > two_adicity:
+            continue
+
+        for folding_factor_log in range(1, MAX_FOLDING_FACTOR_LOG + 1):
+            # INFO: Final lengths between two numbers of folds give the same
+            #       protocol, so only the shortest one is taken.
+            final_coefficients_length_logs = sorted(
+                {
+                    max(0, initial_coefficients_length_log - folds * folding_factor_log)
+                    for folds in range(1, initial_coefficients_length_log + 1)
+                }
+            )
+            for final_coefficients_length_log in final_coefficients_length_logs:
+                # INFO: Parameters which do not reach the security level or
+                #       have more queries than rows are rejected on construction.
+                try:
+                    parameters = FriParameters(
+                        folding_factor_log=folding_factor_log,
+                        expansion_factor_log=expansion_factor_log,
+                        security_level_bits=security_level_bits,
+                        initial_coefficients_length_log=initial_coefficients_length_log,
+                        final_coefficients_length_log=final_coefficients_length_log,
+                        field=field,
+                        grinding_bits=grinding_bits,
+                        soundness_regime=soundness_regime,
+                    )
+                except AssertionError:
+                    continue
+
+                result.append(parameters)
+
+    return result
+
+
+def tune(
+    field: type[galois.FieldArray],
+    security_level_bits: int,
+    coefficients_length_log: int,
+    weights: typing.Dict[str, float],
+    cost_model: CostModel | None = None,
+    trace: bool = False,
+    grinding_bits: int = 0,
+    soundness_regime: str = CONJECTURED,
+) -> typing.List[Candidate]:
+    """Find the best FRI parameters for an objective.
+
+    Every predicted cost is divided by the best one among the candidates, so
+    the weights of the objectives are comparable: the cost of a candidate is
+    ``sum(weight * cost / best cost)``.
+
+    :param field: Field.
+    :type field: type[galois.FieldArray]
+    :param security_level_bits: Security level in bits.
+    :type security_level_bits: int
+    :param coefficients_length_log: Number of coefficients of the polynomial
+        logarithm, or the STARK trace length logarithm when ``trace`` is set.
+    :type coefficients_length_log: int
+    :param weights: Weight of every objective, see OBJECTIVES.
+    :type weights: typing.Dict[str, float]
+    :param cost_model: Cost model. Calibrated for the field when None,
+        defaults to None.
+    :type cost_model: CostModel | None, optional
+    :param trace: Tune STARK parameters, defaults to False.
+    :type trace: bool, optional
+    :param grinding_bits: Security bits from the proof-of-work, defaults to 0.
+    :type grinding_bits: int, optional
+    :param soundness_regime: Soundness regime, defaults to CONJECTURED.
+    :type soundness_regime: str, optional
+    :return: Candidates from the best one.
+    :rtype: typing.List[Candidate]
+    """
+
+    assert len(weights) > 0, "there must be an objective"
+    for objective in weights:
+        assert objective in OBJECTIVES, f"unknown objective {objective}"
+
+    if cost_model is None:
+        cost_model = CostModel.calibrate(field)
+
+    candidates = [
+        Candidate(
+            parameters=parameters,
+            prover_ns=cost_model.predict_prover_ns(parameters),
+            verifier_ns=cost_model.predict_verifier_ns(parameters),
+            proof_size=cost_model.predict_proof_size(parameters),
+        )
+        for parameters in get_candidates(
+            field,
+            security_level_bits,
+            coefficients_length_log,
+            trace,
+            grinding_bits,
+            soundness_regime,
+        )
+    ]
+    assert len(candidates) > 0, "no parameters reach the security level"
+
+    best = {
+        objective: min(candidate.get(objective) for candidate in candidates)
+        for objective in weights
+    }
+    for candidate in candidates:
+        candidate.cost = sum(
+            weight * candidate.get(objective) / best[objective]
+            for objective, weight in weights.items()
+        )
+
+    return sorted(candidates, key=lambda candidate: candidate.cost)
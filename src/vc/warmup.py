@@ -0,0 +1,97 @@
+"""JIT warmup.
+
+galois compiles numba kernels for every field and operation on first use, so
+the first proof in a process pays for compilation. :func:`warmup` runs every
+kind of operation the protocols use on small inputs, so that a long-running
+worker can pay this price on startup instead of on its first request.
+
+The compiled kernels only live as long as the process. galois generates them
+at runtime for every field, so numba cannot cache them on disk, and a new
+process compiles them again. Warmup is therefore meant to be called once by
+long-lived services before they serve requests. A short-lived process gains
+nothing from it.
+
+The kernels are vectorized over int64 element arrays, so they are compiled
+once per field and not per array shape: small inputs warm the kernels for
+all sizes.
+"""
+
+import logging
+import timeit
+import typing
+
+import galois
+import numpy
+
+from vc.fri.parameters import FriParameters
+from vc.fri.prover import FriProver
+from vc.fri.verifier import FriVerifier
+from vc.logging import phase
+
+
+logger = logging.getLogger(__name__)
+
+WARMUP_COEFFICIENTS_LENGTH_LOG = 4
+"""Size of the polynomial proven during warmup."""
+
+
+def _warmup_arithmetic(field: type[galois.FieldArray]) -> None:
+    a = field.Random(1 << WARMUP_COEFFICIENTS_LENGTH_LOG, seed=1)
+    b = field.Random(1 << WARMUP_COEFFICIENTS_LENGTH_LOG, low=1, seed=2)
+
+    # INFO: Division, reciprocal and power are separate kernels.
+    _ = a + b, a - b, -a, a * b, a / b, numpy.reciprocal(b), a**3
+
+
+def _warmup_polynomials(field: type[galois.FieldArray]) -> None:
+    n = 1 << WARMUP_COEFFICIENTS_LENGTH_LOG
+    xs = field.primitive_root_of_unity(n) ** numpy.arange(n)
+    ys = field.Random(n, seed=3)
+
+    g = galois.lagrange_poly(xs, ys)
+    zerofier = galois.Poly.Roots(xs[: n // 2], field=field)
+
+    _ = g(xs), g * g, g + zerofier, divmod(g, zerofier)
+
+
+def _warmup_fri(field: type[galois.FieldArray]) -> None:
+    parameters = FriParameters(
+        folding_factor_log=1,
+        expansion_factor_log=1,
+        security_level_bits=2,
+        initial_coefficients_length_log=WARMUP_COEFFICIENTS_LENGTH_LOG,
+        final_coefficients_length_log=1,
+        field=field,
+    )
+
+    g = galois.Poly.Random(
+        (1 << WARMUP_COEFFICIENTS_LENGTH_LOG) - 1,
+        field=field,
+        seed=4,
+    )
+
+    proof = FriProver(parameters).prove(g)
+    assert FriVerifier(parameters).verify(proof), "warmup proof must be valid"
+
+
+def warmup(fields: typing.Iterable[type[galois.FieldArray]]) -> typing.Dict[int, float]:
+    """Compile the kernels used by the protocols for the given fields.
+
+    :param fields: Fields to compile the kernels for.
+    :type fields: typing.Iterable[type[galois.FieldArray]]
+    :return: Time in seconds spent warming up by field order.
+    :rtype: typing.Dict[int, float]
+    """
+
+    timings: typing.Dict[int, float] = {}
+    for field in fields:
+        begin = timeit.default_timer()
+
+        with phase(logger, f"{field.name} warmup"):
+            _warmup_arithmetic(field)
+            _warmup_polynomials(field)
+            _warmup_fri(field)
+
+        timings[field.order] = timeit.default_timer() - begin
+
+    return timings
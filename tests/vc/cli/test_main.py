@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import pytest
+
+
+HEAVY_MODULES = ["galois", "numba", "numpy", "pymerkle"]
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["vc", "fri"],
+        ["vc", "stark", "-a", "factorial", "3"],
+        ["vc", "tune", "-o", "prover", "size"],
+    ],
+)
+def test_parse_arguments_does_not_import_heavy_modules(argv):
+    # INFO: A fresh interpreter is needed, the test session has them imported.
+    code = f"""
+import sys
+sys.argv = {argv!r}
+
+import vc.cli.main
+vc.cli.main.parse_arguments()
+
+print(" ".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))
+"""
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout.strip() == ""
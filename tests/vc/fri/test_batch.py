@@ -0,0 +1,98 @@
+import galois
+import pytest
+
+from vc.constants import FIELD_GOLDILOCKS
+from vc.fri.batch import BatchFriProver, BatchFriVerifier
+from vc.fri.parameters import FriParameters
+
+
+TEST_FIELD = FIELD_GOLDILOCKS
+
+
+def get_parameters(folding_factor_log: int) -> FriParameters:
+    return FriParameters(
+        folding_factor_log=folding_factor_log,
+        expansion_factor_log=2,
+        security_level_bits=16,
+        final_coefficients_length_log=1,
+        initial_coefficients_length_log=6,
+        field=TEST_FIELD,
+    )
+
+
+@pytest.mark.parametrize("folding_factor_log", [1, 2])
+def test_batch_fri(folding_factor_log: int) -> None:
+    parameters = get_parameters(folding_factor_log)
+    prover = BatchFriProver(parameters)
+    verifier = BatchFriVerifier(parameters)
+
+    coefficients_lengths = [64, 33, 8, 1]
+    fs = [
+        galois.Poly.Random(length - 1, field=TEST_FIELD, seed=length)
+        for length in coefficients_lengths
+    ]
+
+    proof = prover.prove(fs, coefficients_lengths)
+
+    assert verifier.verify(proof, coefficients_lengths)
+    assert verifier.verify(prover.prove(fs), [64] * len(fs))
+
+
+def test_batch_fri_invalid() -> None:
+    parameters = get_parameters(1)
+    prover = BatchFriProver(parameters)
+    verifier = BatchFriVerifier(parameters)
+
+    fs = [
+        galois.Poly.Random(31, field=TEST_FIELD, seed=1),
+        galois.Poly.Random(31, field=TEST_FIELD, seed=2),
+    ]
+
+    proof = prover.prove(fs, [32, 32])
+
+    assert verifier.verify(proof, [32, 32])
+    assert not verifier.verify(proof, [32, 64])
+    assert not verifier.verify(proof, [32, 32, 32])
+
+    # INFO: Claim that the second polynomial has the initial coefficients
+    #       length, which any polynomial has.
+    proof.degree_correction_lengths[1] = 1
+    assert not verifier.verify(proof, [32, 32])
+
+
+def test_batch_fri_above_bound() -> None:
+    parameters = get_parameters(1)
+    prover = BatchFriProver(parameters)
+    verifier = BatchFriVerifier(parameters)
+
+    fs = [
+        galois.Poly.Random(31, field=TEST_FIELD, seed=1),
+        galois.Poly.Random(63, field=TEST_FIELD, seed=2),
+    ]
+
+    # INFO: The second polynomial is proven for a bound above the one the
+    #       verifier expects, and the proof is made to claim the expected one.
+    proof = prover.prove(fs, [32, 64])
+
+    assert not verifier.verify(proof, [32, 32])
+
+    proof.degree_correction_lengths = [33, 33]
+    assert not verifier.verify(proof, [32, 32])
+
+
+def test_batch_fri_missing_rounds() -> None:
+    parameters = get_parameters(1)
+    prover = BatchFriProver(parameters)
+    verifier = BatchFriVerifier(parameters)
+
+    fs = [galois.Poly.Random(31, field=TEST_FIELD, seed=seed) for seed in range(2)]
+
+    proof = prover.prove(fs, [32, 32])
+    proof.round_proofs = []
+
+    assert not verifier.verify(proof, [32, 32])
+
+    proof = prover.prove(fs, [32, 32])
+    proof.merkle_roots = []
+
+    assert not verifier.verify(proof, [32, 32])
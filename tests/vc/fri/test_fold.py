@@ -3,9 +3,12 @@ import numpy
 import pytest
 
 from vc.constants import FIELD_193
+from vc.fri.parameters import FriParameters
+from vc.fri.plan import FriPlan
 from vc.fri.fold import (
     extend_indices,
     fold_domain,
+    fold_evaluations,
     fold_polynomial,
     fold_sort_generate,
     stack,
@@ -115,10 +118,60 @@ def test_consistency_check():
 
     query_indices_range //= folding_factor
     query_indices, check_indices, folded_answers = fold_sort_generate(
-        query_indices, query_indices_range, unordered_folded_answers
+        query_indices, query_indices_range, field(unordered_folded_answers)
     )
 
     for check_index, computed_answer, ys in zip(
         check_indices, folded_answers, folded_stacked_evaluations[list(query_indices)]
     ):
         assert computed_answer == ys[check_index]
+
+
+def test_extend_indices() -> None:
+    assert numpy.all([[0, 4], [2, 6]] == extend_indices([0, 2], 8, 2))
+    assert numpy.all(
+        [[1, 5, 9, 13]] == extend_indices(numpy.array([1]), 16, 4),
+    )
+
+
+def test_fold_sort_generate() -> None:
+    query_indices = numpy.array([1, 3, 5, 6, 9, 14])
+    values = FIELD_193([10, 11, 12, 13, 14, 15])
+
+    # 1, 3, 5, 6, 9, 14 fold to 1, 3, 1, 2, 1, 2 in range 4.
+    new_query_indices, check_indices, folded_values = fold_sort_generate(
+        query_indices,
+        4,
+        values,
+    )
+
+    assert numpy.all(new_query_indices == [1, 2, 3])
+    assert numpy.all(check_indices == [0, 1, 0])
+    assert numpy.all(folded_values == FIELD_193([10, 13, 11]))
+
+
+@pytest.mark.parametrize("folding_factor_log", [1, 2, 3])
+def test_fold_evaluations(folding_factor_log: int) -> None:
+    parameters = FriParameters(
+        folding_factor_log=folding_factor_log,
+        expansion_factor_log=2,
+        security_level_bits=1,
+        initial_coefficients_length_log=4,
+        final_coefficients_length_log=1,
+        field=FIELD_193,
+    )
+    plan = FriPlan.from_parameters(parameters)
+    folding_factor = parameters.folding_factor
+
+    g = galois.Poly.Random(15, field=FIELD_193, seed=folding_factor_log)
+    randomness = FIELD_193(14)
+
+    folded = fold_evaluations(
+        stack(g(plan.domains[0]), folding_factor),
+        randomness,
+        plan.coset_inverses[0],
+        plan.folding_matrix,
+    )
+
+    expected = fold_polynomial(g, randomness, folding_factor)(plan.domains[1])
+    assert numpy.all(folded == expected)
@@ -1,8 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
 import pytest
 import galois
 
 from vc.constants import FIELD_GOLDILOCKS
 from vc.fri.parameters import FriParameters
+from vc.fri.plan import FriPlan
 from vc.fri.prover import FriProver
 from vc.fri.verifier import FriVerifier
 
@@ -69,3 +73,330 @@ def test_fri_not_pow2(
     result = verifier.verify(proof)
 
     assert result
+
+
+def test_fri_concurrent() -> None:
+    initial_coefficients_length_log = 5
+
+    fri_parameters = FriParameters(
+        folding_factor_log=1,
+        expansion_factor_log=1,
+        security_level_bits=5,
+        final_coefficients_length_log=0,
+        initial_coefficients_length_log=initial_coefficients_length_log,
+        field=TEST_FIELD,
+    )
+
+    prover = FriProver(fri_parameters)
+    verifier = FriVerifier(fri_parameters)
+
+    fs = [
+        galois.Poly.Random(
+            (1 << initial_coefficients_length_log) - 1 - seed % 3,
+            field=TEST_FIELD,
+            seed=seed,
+        )
+        for seed in range(32)
+    ]
+    expected = [prover.prove(f).serialize() for f in fs]
+
+    def prove_and_verify(f: galois.Poly):
+        proof = prover.prove(f)
+        return proof.serialize(), verifier.verify(proof)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(prove_and_verify, fs))
+
+    assert [proof for proof, _ in results] == expected
+    assert all(result for _, result in results)
+
+
+@pytest.mark.parametrize(
+    "folding_factor_log, initial_coefficients_length_log, polynomial_degree, seed",
+    [
+        (1, 5, 31, 7),
+        (2, 6, 50, 8),
+        (3, 7, 127, 9),
+        (1, 4, 6, 10),
+    ],
+)
+def test_fri_evaluation_form(
+    folding_factor_log: int,
+    initial_coefficients_length_log: int,
+    polynomial_degree: int,
+    seed: int,
+) -> None:
+    fri_parameters = FriParameters(
+        folding_factor_log=folding_factor_log,
+        expansion_factor_log=2,
+        security_level_bits=16,
+        final_coefficients_length_log=1,
+        initial_coefficients_length_log=initial_coefficients_length_log,
+        field=TEST_FIELD,
+    )
+
+    f = galois.Poly.Random(polynomial_degree, field=TEST_FIELD, seed=seed)
+
+    proof = FriProver(fri_parameters, evaluation_form=True).prove(f)
+    expected = FriProver(fri_parameters, evaluation_form=False).prove(f)
+
+    assert proof.serialize() == expected.serialize()
+    assert FriVerifier(fri_parameters).verify(proof)
+
+
+@pytest.mark.parametrize("folding_factor_log", [1, 2, 3])
+def test_fri_tampered(folding_factor_log: int) -> None:
+    fri_parameters = FriParameters(
+        folding_factor_log=folding_factor_log,
+        expansion_factor_log=2,
+        security_level_bits=16,
+        final_coefficients_length_log=1,
+        initial_coefficients_length_log=7,
+        field=TEST_FIELD,
+    )
+    plan = FriPlan.from_parameters(fri_parameters)
+    verifiers = [FriVerifier(fri_parameters), FriVerifier(fri_parameters, plan)]
+
+    f = galois.Poly.Random(120, field=TEST_FIELD, seed=folding_factor_log)
+    proof = FriProver(fri_parameters, plan).prove(f)
+
+    assert all(verifier.verify(proof) for verifier in verifiers)
+
+    proof.degree_correction_length += 1
+
+    assert not any(verifier.verify(proof) for verifier in verifiers)
+
+    proof.degree_correction_length -= 1
+    proof.final_polynomial += galois.Poly([1], field=TEST_FIELD)
+
+    assert not any(verifier.verify(proof) for verifier in verifiers)
+
+
+def test_fri_verifier_without_domain() -> None:
+    def get_parameters() -> FriParameters:
+        return FriParameters(
+            folding_factor_log=2,
+            expansion_factor_log=2,
+            security_level_bits=16,
+            final_coefficients_length_log=1,
+            initial_coefficients_length_log=6,
+            field=TEST_FIELD,
+        )
+
+    prover_parameters = get_parameters()
+    plan = FriPlan.from_parameters(prover_parameters)
+
+    f = galois.Poly.Random(63, field=TEST_FIELD, seed=11)
+    proof = FriProver(prover_parameters, plan).prove(f)
+
+    verifier_parameters = get_parameters()
+
+    assert FriVerifier(verifier_parameters).verify(proof)
+    assert verifier_parameters._initial_evaluation_domain is None
+
+    for i, domain in enumerate(plan.domains):
+        indices = numpy.arange(domain.size)
+        assert numpy.all(verifier_parameters.get_domain_points(indices, i) == domain)
+
+
+@pytest.mark.parametrize("folding_factor_log", [1, 2])
+def test_fri_prove_many(folding_factor_log: int) -> None:
+    fri_parameters = FriParameters(
+        folding_factor_log=folding_factor_log,
+        expansion_factor_log=2,
+        security_level_bits=16,
+        final_coefficients_length_log=1,
+        initial_coefficients_length_log=6,
+        field=TEST_FIELD,
+    )
+
+    prover = FriProver(fri_parameters)
+    verifier = FriVerifier(fri_parameters)
+
+    fs = [
+        galois.Poly.Random(63 - 9 * seed, field=TEST_FIELD, seed=seed)
+        for seed in range(5)
+    ]
+
+    proofs = prover.prove_many(fs)
+    expected = [prover.prove(f).serialize() for f in fs]
+
+    assert [proof.serialize() for proof in proofs] == expected
+    assert all(verifier.verify(proof) for proof in proofs)
+
+
+def test_fri_verify_batch() -> None:
+    fri_parameters = FriParameters(
+        folding_factor_log=2,
+        expansion_factor_log=2,
+        security_level_bits=16,
+        final_coefficients_length_log=1,
+        initial_coefficients_length_log=6,
+        field=TEST_FIELD,
+    )
+
+    prover = FriProver(fri_parameters)
+    verifier = FriVerifier(fri_parameters)
+
+    fs = [galois.Poly.Random(63 - seed, field=TEST_FIELD, seed=seed) for seed in range(4)]
+    proofs = prover.prove_many(fs)
+
+    proofs[1].degree_correction_length += 1
+    proofs[2].final_polynomial += galois.Poly([1], field=TEST_FIELD)
+
+    assert verifier.verify_batch(proofs) == [True, False, False, True]
+    assert verifier.verify_batch([]) == []
+
+
+def test_fri_missing_rounds() -> None:
+    fri_parameters = FriParameters(
+        folding_factor_log=2,
+        expansion_factor_log=2,
+        security_level_bits=16,
+        final_coefficients_length_log=1,
+        initial_coefficients_length_log=6,
+        field=TEST_FIELD,
+    )
+
+    prover = FriProver(fri_parameters)
+    verifier = FriVerifier(fri_parameters)
+
+    fs = [galois.Poly.Random(63, field=TEST_FIELD, seed=seed) for seed in range(3)]
+    proofs = prover.prove_many(fs)
+
+    # INFO: One malformed proof does not abort the verification of the others.
+    proofs[1].merkle_roots = []
+    proofs[2].round_proofs = []
+
+    assert verifier.verify_batch(proofs) == [True, False, False]
+    assert not verifier.verify(proofs[1])
+
+
+def test_fri_grinding() -> None:
+    def get_parameters(grinding_bits: int) -> FriParameters:
+        return FriParameters(
+            folding_factor_log=2,
+            expansion_factor_log=2,
+            security_level_bits=16,
+            final_coefficients_length_log=1,
+            initial_coefficients_length_log=6,
+            field=TEST_FIELD,
+            grinding_bits=grinding_bits,
+        )
+
+    fri_parameters = get_parameters(8)
+
+    assert fri_parameters.number_of_repetitions == 4
+    assert get_parameters(0).number_of_repetitions == 8
+
+    f = galois.Poly.Random(63, field=TEST_FIELD, seed=12)
+    proof = FriProver(fri_parameters).prove(f)
+    verifier = FriVerifier(fri_parameters)
+
+    assert verifier.verify(proof)
+    assert len(proof.round_proofs[0].indices) == 4
+
+    proof.proof_of_work_nonce += 1
+
+    assert not verifier.verify(proof)
+
+
+@pytest.mark.parametrize("folding_schedule", [[3, 1, 2], [1, 2, 3], [2, 2, 1, 1]])
+def test_fri_folding_schedule(folding_schedule) -> None:
+    fri_parameters = FriParameters(
+        folding_factor_log=1,
+        expansion_factor_log=2,
+        security_level_bits=16,
+        final_coefficients_length_log=1,
+        initial_coefficients_length_log=7,
+        field=TEST_FIELD,
+        folding_schedule=folding_schedule,
+    )
+
+    assert fri_parameters.number_of_rounds == len(folding_schedule) - 1
+    assert fri_parameters.folding_factor_log == folding_schedule[0]
+
+    f = galois.Poly.Random(120, field=TEST_FIELD, seed=len(folding_schedule))
+    proof = FriProver(fri_parameters).prove(f)
+
+    assert [
+        round_proof.stacked_evaluations.shape[1] for round_proof in proof.round_proofs
+    ] == fri_parameters.folding_factors
+    assert (
+        FriProver(fri_parameters, evaluation_form=False).prove(f).serialize()
+        == proof.serialize()
+    )
+    assert FriVerifier(fri_parameters).verify(proof)
+
+    proof.round_proofs[-1].stacked_evaluations[0, 0] += TEST_FIELD(1)
+
+    assert not FriVerifier(fri_parameters).verify(proof)
+
+
+def test_fri_uniform_folding_schedule() -> None:
+    def get_parameters(folding_schedule) -> FriParameters:
+        return FriParameters(
+            folding_factor_log=2,
+            expansion_factor_log=2,
+            security_level_bits=16,
+            final_coefficients_length_log=1,
+            initial_coefficients_length_log=6,
+            field=TEST_FIELD,
+            folding_schedule=folding_schedule,
+        )
+
+    fri_parameters = get_parameters(None)
+
+    assert fri_parameters.folding_factor_logs == [2, 2, 2]
+
+    f = galois.Poly.Random(63, field=TEST_FIELD, seed=13)
+
+    assert (
+        FriProver(fri_parameters).prove(f).serialize()
+        == FriProver(get_parameters([2, 2, 2])).prove(f).serialize()
+    )
+
+    for folding_schedule in [[2, 2], [2, 2, 2, 1], [2, 0, 2, 2]]:
+        with pytest.raises(AssertionError):
+            get_parameters(folding_schedule)
+
+
+def test_fri_full_layers() -> None:
+    fri_parameters = FriParameters(
+        folding_factor_log=1,
+        expansion_factor_log=2,
+        security_level_bits=32,
+        final_coefficients_length_log=0,
+        initial_coefficients_length_log=6,
+        field=TEST_FIELD,
+    )
+
+    committed = fri_parameters.number_of_committed_rounds
+    assert 0 < committed <= fri_parameters.number_of_rounds
+
+    f = galois.Poly.Random(63, field=TEST_FIELD, seed=14)
+    proof = FriProver(fri_parameters).prove(f)
+    verifier = FriVerifier(fri_parameters)
+
+    assert len(proof.merkle_roots) == committed
+    assert proof.round_proofs[committed].proofs == []
+    assert (
+        FriProver(fri_parameters, evaluation_form=False).prove(f).serialize()
+        == proof.serialize()
+    )
+    assert verifier.verify(proof)
+
+    layer = proof.round_proofs[-1].stacked_evaluations
+    layer[-1, 0] += TEST_FIELD(1)
+
+    assert not verifier.verify(proof)
+
+    layer[-1, 0] -= TEST_FIELD(1)
+    proof.round_proofs[-1].stacked_evaluations = layer[:-1]
+
+    assert not verifier.verify(proof)
+
+    proof.round_proofs[-1].stacked_evaluations = layer
+    proof.merkle_roots.append(proof.merkle_roots[0])
+
+    assert not verifier.verify(proof)
@@ -0,0 +1,168 @@
+import galois
+import numpy
+import pytest
+
+from vc.constants import FIELD_GOLDILOCKS
+from vc.fri.parameters import FriParameters
+from vc.fri.pcs import FriPcsProver, FriPcsVerifier
+from vc.sponge import Sponge
+
+
+TEST_FIELD = FIELD_GOLDILOCKS
+
+
+def get_parameters(folding_factor_log: int) -> FriParameters:
+    return FriParameters(
+        folding_factor_log=folding_factor_log,
+        expansion_factor_log=2,
+        security_level_bits=16,
+        final_coefficients_length_log=1,
+        initial_coefficients_length_log=6,
+        field=TEST_FIELD,
+    )
+
+
+@pytest.mark.parametrize("folding_factor_log", [1, 2])
+def test_pcs(folding_factor_log: int) -> None:
+    parameters = get_parameters(folding_factor_log)
+    prover = FriPcsProver(parameters)
+    verifier = FriPcsVerifier(parameters)
+
+    fs = [
+        galois.Poly.Random(degree, field=TEST_FIELD, seed=degree)
+        for degree in [63, 40, 7, 0]
+    ]
+    committed = prover.commit(fs)
+
+    # INFO: The same commitment is opened more than once.
+    for points in [TEST_FIELD([2, 3, 5]), TEST_FIELD([11])]:
+        values, proof = prover.open(committed, points)
+
+        assert numpy.all(values == TEST_FIELD([f(points) for f in fs]))
+        assert verifier.verify_opening(committed.commitment, points, values, proof)
+
+
+def test_pcs_sponge() -> None:
+    parameters = get_parameters(1)
+    prover = FriPcsProver(parameters)
+    verifier = FriPcsVerifier(parameters)
+
+    committed = prover.commit([galois.Poly.Random(63, field=TEST_FIELD, seed=1)])
+    points = TEST_FIELD([2, 3])
+
+    sponge = Sponge(TEST_FIELD)
+    sponge.absorb(b"transcript")
+    values, proof = prover.open(committed, points, sponge)
+
+    sponge = Sponge(TEST_FIELD)
+    sponge.absorb(b"transcript")
+
+    assert verifier.verify_opening(
+        committed.commitment,
+        points,
+        values,
+        proof,
+        sponge,
+    )
+    assert not verifier.verify_opening(committed.commitment, points, values, proof)
+
+
+def test_pcs_invalid() -> None:
+    parameters = get_parameters(1)
+    prover = FriPcsProver(parameters)
+    verifier = FriPcsVerifier(parameters)
+
+    fs = [
+        galois.Poly.Random(63, field=TEST_FIELD, seed=1),
+        galois.Poly.Random(31, field=TEST_FIELD, seed=2),
+    ]
+    committed = prover.commit(fs)
+    points = TEST_FIELD([2, 3])
+    values, proof = prover.open(committed, points)
+
+    wrong_values = values.copy()
+    wrong_values[1, 0] += TEST_FIELD(1)
+
+    assert not verifier.verify_opening(
+        committed.commitment,
+        points,
+        wrong_values,
+        proof,
+    )
+    assert not verifier.verify_opening(
+        committed.commitment,
+        TEST_FIELD([2, 4]),
+        values,
+        proof,
+    )
+    assert not verifier.verify_opening(
+        prover.commit(fs[::-1]).commitment,
+        points,
+        values,
+        proof,
+    )
+    assert not verifier.verify_opening(
+        committed.commitment,
+        points,
+        values[:1],
+        proof,
+    )
+
+    in_domain = parameters.get_domain_points(numpy.arange(1))
+    with pytest.raises(AssertionError):
+        prover.open(committed, in_domain)
+
+    assert not verifier.verify_opening(
+        committed.commitment,
+        in_domain,
+        values[:, :1],
+        proof,
+    )
+
+
+def test_pcs_forged_opening() -> None:
+    parameters = get_parameters(1)
+    prover = FriPcsProver(parameters)
+    verifier = FriPcsVerifier(parameters)
+
+    f = galois.Poly.Random(63, field=TEST_FIELD, seed=1)
+    committed = prover.commit([f])
+    points = TEST_FIELD([2, 3])
+
+    # INFO: Another polynomial is opened under the commitment, which leaves
+    #       its rows without valid proofs, so they are dropped.
+    forged = prover.commit([f + TEST_FIELD(1)])
+    forged.commitment = committed.commitment
+    values, proof = prover.open(forged, points)
+    proof.merkle_proofs = []
+
+    assert not verifier.verify_opening(committed.commitment, points, values, proof)
+    assert numpy.all(values != TEST_FIELD([[f(z) for z in points]]))
+
+
+def test_pcs_changed_indices() -> None:
+    parameters = get_parameters(1)
+    prover = FriPcsProver(parameters)
+    verifier = FriPcsVerifier(parameters)
+
+    committed = prover.commit([galois.Poly.Random(63, field=TEST_FIELD, seed=1)])
+    points = TEST_FIELD([2, 3])
+    values, proof = prover.open(committed, points)
+
+    # INFO: Rows and proofs are valid for the changed indices, but they are
+    #       not the ones squeezed from the transcript.
+    round_proof = proof.fri_proof.round_proofs[0]
+    indices = (round_proof.indices + 1) % (
+        parameters.initial_evaluation_domain_length // parameters.folding_factor
+    )
+    round_proof.indices = indices
+    proof.stacked_evaluations = committed.stacked_evaluations[indices]
+    proof.merkle_proofs = committed.merkle_tree.prove_bulk(indices)
+
+    assert not verifier.verify_opening(committed.commitment, points, values, proof)
+
+    # INFO: Proofs of other rows do not authenticate the opened ones.
+    _, proof = prover.open(committed, points)
+    proof.merkle_proofs = proof.merkle_proofs[::-1]
+
+    assert not verifier.verify_opening(committed.commitment, points, values, proof)
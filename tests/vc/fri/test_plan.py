@@ -0,0 +1,166 @@
+import galois
+import numpy
+import pytest
+
+from vc.constants import FIELD_193, FIELD_BABYBEAR, FIELD_GOLDILOCKS
+from vc.fri.batch import BatchFriProver
+from vc.fri.fold import fold_domain
+from vc.fri.parameters import FriParameters
+from vc.fri.pcs import FriPcsProver, FriPcsVerifier
+from vc.fri.plan import FriPlan
+from vc.fri.prover import FriProver
+from vc.fri.verifier import FriVerifier
+
+
+def get_parameters(field: type[galois.FieldArray]) -> FriParameters:
+    return FriParameters(
+        folding_factor_log=1,
+        expansion_factor_log=1,
+        security_level_bits=2,
+        initial_coefficients_length_log=4,
+        final_coefficients_length_log=1,
+        field=field,
+    )
+
+
+def test_plan_domains() -> None:
+    parameters = get_parameters(FIELD_GOLDILOCKS)
+    plan = FriPlan.from_parameters(parameters)
+
+    assert len(plan.domains) == parameters.number_of_rounds + 2
+    assert numpy.array_equal(plan.domains[0], parameters.initial_evaluation_domain)
+    for previous, current in zip(plan.domains, plan.domains[1:]):
+        assert numpy.array_equal(
+            current,
+            fold_domain(previous, parameters.folding_factor),
+        )
+
+
+def test_plan_folding_schedule() -> None:
+    parameters = FriParameters(
+        folding_factor_log=1,
+        expansion_factor_log=1,
+        security_level_bits=1,
+        initial_coefficients_length_log=5,
+        final_coefficients_length_log=1,
+        field=FIELD_193,
+        folding_schedule=[2, 1, 1],
+    )
+    plan = FriPlan.from_parameters(parameters)
+
+    for i, k in enumerate(parameters.folding_factors):
+        assert numpy.array_equal(plan.domains[i + 1], fold_domain(plan.domains[i], k))
+        assert plan.folding_matrices[i].shape == (k, k)
+
+    for i, domain in enumerate(plan.domains):
+        indices = numpy.arange(domain.size)
+        assert numpy.array_equal(parameters.get_domain_points(indices, i), domain)
+        assert numpy.array_equal(
+            plan.evaluate(galois.Poly([1, 2], field=FIELD_193), i),
+            domain + FIELD_193(2),
+        )
+
+
+def test_plan_evaluate() -> None:
+    plan = FriPlan.from_parameters(get_parameters(FIELD_GOLDILOCKS))
+    g = galois.Poly.Random(3, field=FIELD_GOLDILOCKS, seed=1)
+
+    for i, domain in enumerate(plan.domains):
+        assert numpy.array_equal(plan.evaluate(g, i), g(domain))
+
+
+def test_plan_folding_matrix() -> None:
+    parameters = get_parameters(FIELD_GOLDILOCKS)
+    plan = FriPlan.from_parameters(parameters)
+
+    k = parameters.folding_factor
+    zeta = parameters.omega ** (parameters.initial_evaluation_domain_length // k)
+    dft = zeta ** numpy.outer(numpy.arange(k), numpy.arange(k))
+
+    assert numpy.array_equal(plan.folding_matrix @ dft, FIELD_GOLDILOCKS.Identity(k))
+
+
+def test_plan_is_read_only() -> None:
+    plan = FriPlan.from_parameters(get_parameters(FIELD_193))
+
+    with pytest.raises(ValueError):
+        plan.domains[0][0] = 1
+
+
+@pytest.mark.parametrize("field", [FIELD_193, FIELD_GOLDILOCKS])
+def test_plan_save_load(field: type[galois.FieldArray], tmp_path) -> None:
+    parameters = get_parameters(field)
+    plan = FriPlan.from_parameters(parameters)
+    plan.save(str(tmp_path))
+
+    loaded = FriPlan.load(str(tmp_path))
+
+    assert loaded.parameters.field is field
+    assert all(
+        numpy.array_equal(a, b) and type(b) is field
+        for a, b in zip(
+            plan.domains + plan.coset_inverses,
+            loaded.domains + loaded.coset_inverses,
+        )
+    )
+    assert numpy.array_equal(plan.twiddles, loaded.twiddles)
+    assert numpy.array_equal(plan.inverse_twiddles, loaded.inverse_twiddles)
+    assert numpy.array_equal(plan.folding_matrix, loaded.folding_matrix)
+    assert loaded.parameters.folding_factor_logs == parameters.folding_factor_logs
+
+    g = galois.Poly.Random(15, field=field, seed=2)
+    proof = FriProver(parameters, plan).prove(g)
+    loaded_proof = FriProver(loaded.parameters, loaded).prove(g)
+
+    assert proof.merkle_roots == loaded_proof.merkle_roots
+    assert FriVerifier(loaded.parameters, loaded).verify(loaded_proof)
+
+
+def test_plan_parameters_mismatch() -> None:
+    parameters = get_parameters(FIELD_GOLDILOCKS)
+    plan = FriPlan.from_parameters(parameters)
+
+    # INFO: Security parameters do not change the plan.
+    assert plan.is_built_for(
+        FriParameters(
+            folding_factor_log=1,
+            expansion_factor_log=1,
+            security_level_bits=8,
+            initial_coefficients_length_log=4,
+            final_coefficients_length_log=1,
+            field=FIELD_GOLDILOCKS,
+        )
+    )
+
+    others = [
+        get_parameters(FIELD_BABYBEAR),
+        FriParameters(
+            folding_factor_log=1,
+            expansion_factor_log=2,
+            security_level_bits=5,
+            initial_coefficients_length_log=4,
+            final_coefficients_length_log=1,
+            field=FIELD_GOLDILOCKS,
+        ),
+        FriParameters(
+            folding_factor_log=1,
+            expansion_factor_log=1,
+            security_level_bits=5,
+            initial_coefficients_length_log=4,
+            final_coefficients_length_log=1,
+            field=FIELD_GOLDILOCKS,
+            folding_schedule=[2, 1],
+        ),
+    ]
+    for other in others:
+        assert not plan.is_built_for(other)
+
+        for constructor in [
+            FriProver,
+            FriVerifier,
+            BatchFriProver,
+            FriPcsProver,
+            FriPcsVerifier,
+        ]:
+            with pytest.raises(AssertionError):
+                constructor(other, plan)
@@ -0,0 +1,115 @@
+import math
+
+import pytest
+
+from vc.constants import FIELD_GOLDILOCKS, FIELD_GOLDILOCKS_ORDER
+from vc.fri.parameters import FriParameters
+from vc.fri.soundness import (
+    CONJECTURED,
+    PROVEN,
+    UNIQUE,
+    get_bits_per_query,
+    get_number_of_ood_samples,
+    get_number_of_queries,
+    get_soundness,
+)
+
+
+@pytest.mark.parametrize("security_level_bits", [5, 16, 64, 100])
+@pytest.mark.parametrize("expansion_factor_log", [1, 2, 3])
+def test_number_of_queries_conjectured(
+    security_level_bits: int,
+    expansion_factor_log: int,
+) -> None:
+    assert get_number_of_queries(
+        CONJECTURED,
+        security_level_bits,
+        expansion_factor_log,
+    ) == math.ceil(security_level_bits / expansion_factor_log)
+
+
+def test_number_of_queries_proven() -> None:
+    number_of_queries = get_number_of_queries(PROVEN, 64, 2, grinding_bits=8)
+
+    assert get_bits_per_query(PROVEN, 2) < get_bits_per_query(CONJECTURED, 2)
+    assert number_of_queries * get_bits_per_query(PROVEN, 2) >= 64 - 8
+    assert (number_of_queries - 1) * get_bits_per_query(PROVEN, 2) < 64 - 8
+
+
+def test_number_of_queries_unique() -> None:
+    # INFO: Every query catches a polynomial (1 - 1/4) / 2 far from the code
+    #       with probability 3/8.
+    assert get_bits_per_query(UNIQUE, 2) == pytest.approx(-math.log2(5 / 8))
+    assert get_number_of_queries(UNIQUE, 64, 2) > get_number_of_queries(PROVEN, 64, 2)
+
+
+def test_number_of_ood_samples() -> None:
+    assert get_number_of_ood_samples(5, FIELD_GOLDILOCKS_ORDER, 1 << 10) == 1
+    assert get_number_of_ood_samples(64, FIELD_GOLDILOCKS_ORDER, 1 << 10) == 2
+    assert get_number_of_ood_samples(128, FIELD_GOLDILOCKS_ORDER, 1 << 16) == 3
+
+
+def test_soundness() -> None:
+    def get(regime: str, field_order: int):
+        return get_soundness(regime, 40, 4, field_order, 2, 1 << 12, [4] * 4)
+
+    conjectured = get(CONJECTURED, FIELD_GOLDILOCKS_ORDER)
+
+    assert conjectured.query_phase_bits == 84
+    assert conjectured.commit_phase_bits == pytest.approx(52, abs=0.01)
+    assert conjectured.bits == conjectured.commit_phase_bits
+
+    # INFO: The proven commit phase error grows with the squared domain length,
+    #       so 64 bit fields are not enough for it.
+    assert get(PROVEN, FIELD_GOLDILOCKS_ORDER).bits < 32
+    assert get(PROVEN, 1 << 128).bits > get(PROVEN, FIELD_GOLDILOCKS_ORDER).bits
+
+
+def test_parameters_soundness() -> None:
+    def get_parameters(regime: str) -> FriParameters:
+        return FriParameters(
+            folding_factor_log=2,
+            expansion_factor_log=2,
+            security_level_bits=32,
+            final_coefficients_length_log=1,
+            initial_coefficients_length_log=6,
+            field=FIELD_GOLDILOCKS,
+            grinding_bits=4,
+            soundness_regime=regime,
+        )
+
+    conjectured = get_parameters(CONJECTURED)
+    proven = get_parameters(PROVEN)
+
+    assert conjectured.number_of_repetitions == 14
+    assert proven.number_of_repetitions > conjectured.number_of_repetitions
+    assert conjectured.soundness.bits >= 32
+    assert "achieved" in repr(conjectured)
+
+
+def test_parameters_rejected() -> None:
+    # INFO: The proven commit phase of a 64 bit field does not reach 32 bits
+    #       over 2^10 points, however many queries there are.
+    with pytest.raises(AssertionError):
+        FriParameters(
+            folding_factor_log=2,
+            expansion_factor_log=2,
+            security_level_bits=32,
+            final_coefficients_length_log=1,
+            initial_coefficients_length_log=8,
+            field=FIELD_GOLDILOCKS,
+            soundness_regime=PROVEN,
+        )
+
+    # INFO: 155 queries do not fit in the 32 rows of the first round.
+    assert get_number_of_queries(UNIQUE, 64, 1) == 155
+    with pytest.raises(AssertionError):
+        FriParameters(
+            folding_factor_log=1,
+            expansion_factor_log=1,
+            security_level_bits=64,
+            final_coefficients_length_log=1,
+            initial_coefficients_length_log=5,
+            field=FIELD_GOLDILOCKS,
+            soundness_regime=UNIQUE,
+        )
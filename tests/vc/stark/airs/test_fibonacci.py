@@ -122,3 +122,11 @@ def test_get_transition_constraints(n: int):
         for constraint in transition_constraints:
             result = constraint.eval(field([*aet[i], *aet[i + 1]]))
             assert result == zero
+
+
+@pytest.mark.parametrize("n", [93, 128])
+def test_get_aet_does_not_overflow(n: int):
+    aet = get_aet(n)
+
+    assert aet[n - 1, 0] == field(fib(n - 1) % field.order)
+    assert aet[n - 1, 1] == field(fib(n) % field.order)
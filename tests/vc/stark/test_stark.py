@@ -1,4 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 import math
+import pickle
 import typing
 import pytest
 
@@ -17,12 +19,19 @@ from vc.stark.parameters import StarkParameters
 from vc.stark.prover import StarkProver
 from vc.constants import FIELD_GOLDILOCKS
 from vc.stark.verifier import StarkVerifier
+from vc.stir.parameters import StirParameters
+from vc.stir.prover import StirProver
+from vc.stir.verifier import StirVerifier
 
 
 TEST_FIELD = FIELD_GOLDILOCKS
 
 
-def get_test_stark(aet_height: int) -> typing.Tuple[StarkProver, StarkVerifier]:
+def get_test_stark(
+    aet_height: int,
+    stir: bool = False,
+    number_of_ood_samples: int = 1,
+) -> typing.Tuple[StarkProver, StarkVerifier]:
     expansion_factor_log = 1
     expansion_factor = 1 << expansion_factor_log
 
@@ -35,17 +44,33 @@ def get_test_stark(aet_height: int) -> typing.Tuple[StarkProver, StarkVerifier]:
     omega = TEST_FIELD.primitive_root_of_unity(omega_domain_len)
     omicron = omega**expansion_factor
 
-    stark_parameters = StarkParameters(omicron=omicron, field=TEST_FIELD)
-    fri_parameters = FriParameters(
-        folding_factor_log=1,
-        expansion_factor_log=expansion_factor_log,
-        security_level_bits=5,
-        initial_coefficients_length_log=aet_height_log + expansion_factor_log,
-        final_coefficients_length_log=0,
+    stark_parameters = StarkParameters(
+        omicron=omicron,
         field=TEST_FIELD,
+        number_of_ood_samples=number_of_ood_samples,
     )
-    fri_prover = FriProver(fri_parameters)
-    fri_verifier = FriVerifier(fri_parameters)
+    if stir:
+        fri_parameters = StirParameters(
+            folding_factor_log=1,
+            expansion_factor_log=expansion_factor_log,
+            security_level_bits=5,
+            initial_coefficients_length_log=aet_height_log + expansion_factor_log,
+            final_coefficients_length_log=0,
+            field=TEST_FIELD,
+        )
+        fri_prover = StirProver(fri_parameters)
+        fri_verifier = StirVerifier(fri_parameters)
+    else:
+        fri_parameters = FriParameters(
+            folding_factor_log=1,
+            expansion_factor_log=expansion_factor_log,
+            security_level_bits=5,
+            initial_coefficients_length_log=aet_height_log + expansion_factor_log,
+            final_coefficients_length_log=0,
+            field=TEST_FIELD,
+        )
+        fri_prover = FriProver(fri_parameters)
+        fri_verifier = FriVerifier(fri_parameters)
 
     return (
         StarkProver(
@@ -63,6 +88,7 @@ def get_test_stark(aet_height: int) -> typing.Tuple[StarkProver, StarkVerifier]:
                 fri_verifier=fri_verifier,
                 fri_parameters=fri_parameters,
                 omicron=omicron,
+                number_of_ood_samples=number_of_ood_samples,
             )
         ),
     )
@@ -158,3 +184,176 @@ def test_stark_factorial(n: int):
     )
 
     assert result, "invalid proof"
+
+
+def test_stark_concurrent():
+    n = 16
+    aet = get_aet(n)
+    boundary_constraints = get_boundary_constraints(n, fib(n))
+    transition_constraints = get_transition_constraints()
+
+    stark_prover, stark_verifier = get_test_stark(aet.shape[0])
+    expected = pickle.dumps(
+        stark_prover.prove(aet, transition_constraints, boundary_constraints)
+    )
+
+    def prove_and_verify(_):
+        proof = stark_prover.prove(aet, transition_constraints, boundary_constraints)
+        serialized_proof = pickle.dumps(proof)
+        result = stark_verifier.verify(
+            proof,
+            transition_constraints,
+            boundary_constraints,
+            aet.shape[1],
+            aet.shape[0],
+        )
+        return serialized_proof, result
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(prove_and_verify, range(8)))
+
+    assert all(proof == expected for proof, _ in results)
+    assert all(result for _, result in results)
+
+
+def test_stark_verify_batch():
+    n = 16
+    aet = get_aet(n)
+    boundary_constraints = get_boundary_constraints(n, fib(n))
+    transition_constraints = get_transition_constraints()
+
+    stark_prover, stark_verifier = get_test_stark(aet.shape[0])
+    proof = pickle.dumps(
+        stark_prover.prove(aet, transition_constraints, boundary_constraints)
+    )
+
+    proofs = [pickle.loads(proof) for _ in range(3)]
+    proofs[1].combination_polynomial_proof.degree_correction_length += 1
+
+    results = stark_verifier.verify_batch(
+        proofs,
+        transition_constraints,
+        boundary_constraints,
+        aet.shape[1],
+        aet.shape[0],
+    )
+
+    assert results == [True, False, True]
+
+
+@pytest.mark.parametrize("n", [16, 63])
+def test_stark_stir(n: int):
+    aet = get_aet(n)
+    boundary_constraints = get_boundary_constraints(n, fib(n))
+    transition_constraints = get_transition_constraints()
+
+    stark_prover, stark_verifier = get_test_stark(aet.shape[0], stir=True)
+    proof = stark_prover.prove(aet, transition_constraints, boundary_constraints)
+
+    proofs = [proof, pickle.loads(pickle.dumps(proof))]
+    proofs[1].combination_polynomial_proof.degree_correction_length += 1
+
+    results = stark_verifier.verify_batch(
+        proofs,
+        transition_constraints,
+        boundary_constraints,
+        aet.shape[1],
+        aet.shape[0],
+    )
+
+    assert results == [True, False]
+
+
+@pytest.mark.parametrize("number_of_ood_samples", [1, 3])
+def test_stark_ood(number_of_ood_samples: int):
+    n = 16
+    aet = get_aet(n)
+    boundary_constraints = get_boundary_constraints(n, fib(n))
+    transition_constraints = get_transition_constraints()
+
+    stark_prover, stark_verifier = get_test_stark(
+        aet.shape[0],
+        number_of_ood_samples=number_of_ood_samples,
+    )
+    proof = pickle.dumps(
+        stark_prover.prove(aet, transition_constraints, boundary_constraints)
+    )
+
+    proofs = [pickle.loads(proof) for _ in range(4)]
+    proofs[1].ood.current[0, -1] += TEST_FIELD(1)
+    proofs[2].ood.next[1, 0] += TEST_FIELD(1)
+    proofs[3].ood.composition[-1] += TEST_FIELD(1)
+
+    assert proofs[0].ood.composition.shape == (number_of_ood_samples,)
+
+    results = stark_verifier.verify_batch(
+        proofs,
+        transition_constraints,
+        boundary_constraints,
+        aet.shape[1],
+        aet.shape[0],
+    )
+
+    assert results == [True, False, False, False]
+
+
+def test_stark_wrong_result():
+    n = 16
+    aet = get_aet(n)
+    transition_constraints = get_transition_constraints()
+
+    stark_prover, stark_verifier = get_test_stark(aet.shape[0])
+    proof = stark_prover.prove(
+        aet,
+        transition_constraints,
+        get_boundary_constraints(n, fib(n)),
+    )
+
+    assert not stark_verifier.verify(
+        proof,
+        transition_constraints,
+        get_boundary_constraints(n, fib(n) + 1),
+        aet.shape[1],
+        aet.shape[0],
+    )
+
+
+def test_stark_invalid_openings():
+    n = 16
+    aet = get_aet(n)
+    boundary_constraints = get_boundary_constraints(n, fib(n))
+    transition_constraints = get_transition_constraints()
+
+    stark_prover, stark_verifier = get_test_stark(aet.shape[0])
+    proof = pickle.dumps(
+        stark_prover.prove(aet, transition_constraints, boundary_constraints)
+    )
+
+    proofs = [pickle.loads(proof) for _ in range(4)]
+
+    # INFO: Committed rows are opened with valid paths, but at each other's
+    #       query indices.
+    openings = [
+        (proofs[1].composition.stacked_evaluations, proofs[1].composition.merkle_proofs),
+        (
+            proofs[2].boundary_quotients.stacked_evaluations[0],
+            proofs[2].boundary_quotients.merkle_proofs[0],
+        ),
+    ]
+    for stacked_evaluations, merkle_proofs in openings:
+        stacked_evaluations[[0, 1]] = stacked_evaluations[[1, 0]]
+        merkle_proofs[0], merkle_proofs[1] = merkle_proofs[1], merkle_proofs[0]
+
+    composition = proofs[3].composition
+    composition.stacked_evaluations = composition.stacked_evaluations[:1]
+    composition.merkle_proofs = composition.merkle_proofs[:1]
+
+    results = stark_verifier.verify_batch(
+        proofs,
+        transition_constraints,
+        boundary_constraints,
+        aet.shape[1],
+        aet.shape[0],
+    )
+
+    assert results == [True, False, False, False]
@@ -0,0 +1,181 @@
+import galois
+import numpy
+import pytest
+
+from vc.constants import FIELD_193, FIELD_GOLDILOCKS
+from vc.stir.parameters import StirParameters
+from vc.stir.prover import StirProver
+from vc.stir.quotient import evaluate_quotient, get_quotient_polynomial
+from vc.stir.verifier import StirVerifier
+
+
+TEST_FIELD = FIELD_GOLDILOCKS
+
+
+@pytest.mark.parametrize(
+    "folding_factor_log, initial_coefficients_length_log, polynomial_degree, seed",
+    [
+        (1, 6, 63, 1),
+        (1, 6, 40, 2),
+        (2, 8, 255, 3),
+        (2, 8, 200, 4),
+        (3, 9, 511, 5),
+    ],
+)
+def test_stir(
+    folding_factor_log: int,
+    initial_coefficients_length_log: int,
+    polynomial_degree: int,
+    seed: int,
+) -> None:
+    stir_parameters = StirParameters(
+        folding_factor_log=folding_factor_log,
+        expansion_factor_log=1,
+        security_level_bits=16,
+        initial_coefficients_length_log=initial_coefficients_length_log,
+        final_coefficients_length_log=1,
+        field=TEST_FIELD,
+    )
+
+    assert stir_parameters.number_of_rounds > 0
+
+    f = galois.Poly.Random(polynomial_degree, field=TEST_FIELD, seed=seed)
+    proof = StirProver(stir_parameters).prove(f)
+
+    assert StirVerifier(stir_parameters).verify(proof)
+
+
+def test_stir_rounds() -> None:
+    stir_parameters = StirParameters(
+        folding_factor_log=2,
+        expansion_factor_log=2,
+        security_level_bits=64,
+        initial_coefficients_length_log=12,
+        final_coefficients_length_log=2,
+        field=TEST_FIELD,
+    )
+
+    # INFO: Rates drop by a factor of two every round, so the rounds need
+    #       fewer and fewer queries.
+    assert stir_parameters.number_of_rounds == 4
+    assert stir_parameters.number_of_queries == [32, 22, 16, 13, 11]
+    assert stir_parameters.number_of_ood_samples == 2
+    assert stir_parameters.final_coefficients_length == 4
+
+
+def test_stir_rounds_stop_early() -> None:
+    stir_parameters = StirParameters(
+        folding_factor_log=1,
+        expansion_factor_log=1,
+        security_level_bits=16,
+        initial_coefficients_length_log=5,
+        final_coefficients_length_log=0,
+        field=TEST_FIELD,
+    )
+
+    # INFO: The polynomial of every round must have more coefficients than
+    #       there are points to divide it by.
+    for i in range(stir_parameters.number_of_rounds):
+        assert stir_parameters.get_coefficients_length(
+            i + 1
+        ) > stir_parameters.number_of_ood_samples + (
+            stir_parameters.number_of_queries[i]
+        )
+
+    assert stir_parameters.final_coefficients_length > 1
+    assert (
+        len(stir_parameters.number_of_queries) == stir_parameters.number_of_rounds + 1
+    )
+
+
+def test_stir_tampered() -> None:
+    stir_parameters = StirParameters(
+        folding_factor_log=2,
+        expansion_factor_log=1,
+        security_level_bits=16,
+        initial_coefficients_length_log=8,
+        final_coefficients_length_log=1,
+        field=TEST_FIELD,
+    )
+    verifier = StirVerifier(stir_parameters)
+
+    f = galois.Poly.Random(250, field=TEST_FIELD, seed=6)
+    proof = StirProver(stir_parameters).prove(f)
+
+    assert verifier.verify(proof)
+
+    proof.degree_correction_length += 1
+
+    assert not verifier.verify(proof)
+
+    proof.degree_correction_length -= 1
+    proof.final_polynomial += galois.Poly([1], field=TEST_FIELD)
+
+    assert not verifier.verify(proof)
+
+    proof.final_polynomial -= galois.Poly([1], field=TEST_FIELD)
+    proof.ood_answers[0][0] += TEST_FIELD(1)
+
+    assert not verifier.verify(proof)
+
+
+def test_stir_reordered_rows() -> None:
+    stir_parameters = StirParameters(
+        folding_factor_log=1,
+        expansion_factor_log=1,
+        security_level_bits=16,
+        initial_coefficients_length_log=6,
+        final_coefficients_length_log=1,
+        field=TEST_FIELD,
+    )
+    verifier = StirVerifier(stir_parameters)
+
+    proof = StirProver(stir_parameters).prove(
+        galois.Poly.Random(63, field=TEST_FIELD, seed=7)
+    )
+
+    # INFO: Opened rows are reordered together with their valid paths, so
+    #       they no longer are the rows at the squeezed indices.
+    round_proof = proof.round_proofs[0]
+    round_proof.stacked_evaluations = round_proof.stacked_evaluations[::-1]
+    round_proof.proofs = round_proof.proofs[::-1]
+
+    assert not verifier.verify(proof)
+
+
+def test_stir_verify_batch() -> None:
+    stir_parameters = StirParameters(
+        folding_factor_log=1,
+        expansion_factor_log=1,
+        security_level_bits=16,
+        initial_coefficients_length_log=5,
+        final_coefficients_length_log=1,
+        field=TEST_FIELD,
+    )
+
+    prover = StirProver(stir_parameters)
+    verifier = StirVerifier(stir_parameters)
+
+    proofs = [
+        prover.prove(galois.Poly.Random(31 - seed, field=TEST_FIELD, seed=seed))
+        for seed in range(3)
+    ]
+    proofs[1].final_polynomial += galois.Poly([1], field=TEST_FIELD)
+
+    assert verifier.verify_batch(proofs) == [True, False, True]
+    assert verifier.verify_batch([]) == []
+
+
+def test_evaluate_quotient() -> None:
+    g = galois.Poly.Random(20, field=FIELD_193, seed=7)
+    points = FIELD_193([3, 5, 11])
+    answers = g(points)
+    randomness = FIELD_193(17)
+
+    quotient = get_quotient_polynomial(g, points, answers, randomness)
+    xs = FIELD_193([[2, 4], [6, 7]])
+
+    assert quotient.degree == g.degree
+    assert numpy.all(
+        evaluate_quotient(g(xs), xs, points, answers, randomness) == quotient(xs)
+    )
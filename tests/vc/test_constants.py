@@ -0,0 +1,12 @@
+import vc.constants
+from vc.constants import FIELD_193, FIELD_193_ORDER, FIELD_GOLDILOCKS_ORDER
+
+
+def test_field_is_constructed_from_order():
+    assert FIELD_193.order == FIELD_193_ORDER
+
+
+def test_field_is_constructed_once():
+    assert vc.constants.FIELD_193 is FIELD_193
+    assert vc.constants.FIELD_GOLDILOCKS is vc.constants.FIELD_GOLDILOCKS
+    assert vc.constants.FIELD_GOLDILOCKS.order == FIELD_GOLDILOCKS_ORDER
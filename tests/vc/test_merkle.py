@@ -1,9 +1,11 @@
 import typing
 
+import galois
+import numpy
 import pytest
 
-from vc.constants import FIELD_193
-from vc.merkle import MerkleTree
+from vc.constants import FIELD_193, FIELD_BABYBEAR, FIELD_GOLDILOCKS
+from vc.merkle import MerkleTree, hash_rows
 from vc.fri.fold import stack
 
 
@@ -45,3 +47,63 @@ def test_append_bulk(indices: typing.List[int]):
 
     result = MerkleTree.verify_bulk(stacked_evaluations[indices], root, proof)
     assert result == True
+
+
+@pytest.mark.parametrize("number_of_leaves", [1, 5, 8])
+def test_verify_bulk_indices(number_of_leaves: int):
+    stacked_evaluations = stack(
+        FIELD_GOLDILOCKS.Random(2 * number_of_leaves, seed=1),
+        2,
+    )
+    merkle_tree = MerkleTree()
+    merkle_tree.append_bulk(stacked_evaluations)
+    root = merkle_tree.get_root()
+
+    indices = numpy.arange(number_of_leaves)[::-1]
+    proofs = merkle_tree.prove_bulk(indices)
+    rows = stacked_evaluations[indices]
+
+    assert MerkleTree.verify_bulk(rows, root, proofs, indices, number_of_leaves)
+    assert not MerkleTree.verify_bulk(rows, root, proofs[:-1])
+    assert not MerkleTree.verify_bulk(rows, root, proofs, indices, 2 * number_of_leaves)
+
+    # INFO: The proofs resolve to the root wherever they are claimed to be.
+    if number_of_leaves > 1:
+        wrong_indices = numpy.roll(indices, 1)
+        assert MerkleTree.verify_bulk(rows, root, proofs)
+        assert not MerkleTree.verify_bulk(
+            rows, root, proofs, wrong_indices, number_of_leaves
+        )
+
+
+@pytest.mark.parametrize(
+    "field",
+    [FIELD_193, FIELD_BABYBEAR, FIELD_GOLDILOCKS],
+)
+def test_append_bulk_serialization(field: type[galois.FieldArray]):
+    stacked_evaluations = stack(field.Random(64, seed=1), 4)
+    stacked_evaluations[3] = 0
+
+    bulk_tree = MerkleTree()
+    bulk_tree.append_bulk(stacked_evaluations)
+
+    tree = MerkleTree()
+    for row in stacked_evaluations:
+        tree.append(row)
+
+    assert bulk_tree.get_root() == tree.get_root()
+    assert MerkleTree.verify_bulk(
+        stacked_evaluations,
+        tree.get_root(),
+        tree.prove_bulk(numpy.arange(16)),
+    )
+
+
+def test_hash_rows() -> None:
+    stack = FIELD_GOLDILOCKS.Random((8, 2), seed=1)
+    changed = stack.copy()
+    changed[3, 1] += FIELD_GOLDILOCKS(1)
+
+    assert hash_rows(stack) == hash_rows(FIELD_GOLDILOCKS(stack.tolist()))
+    assert hash_rows(stack) != hash_rows(changed)
+    assert hash_rows(stack) != hash_rows(stack.reshape((4, 4)))
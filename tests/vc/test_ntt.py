@@ -0,0 +1,73 @@
+import galois
+import numpy
+import pytest
+
+from vc.constants import FIELD_193, FIELD_GOLDILOCKS
+from vc.ntt import (
+    evaluate_many_on_coset,
+    evaluate_on_coset,
+    get_twiddles,
+    interpolate_many_on_coset,
+    interpolate_on_coset,
+    intt,
+    ntt,
+)
+
+
+@pytest.mark.parametrize("field", [FIELD_193, FIELD_GOLDILOCKS])
+@pytest.mark.parametrize("n", [1, 2, 8, 32])
+def test_ntt(field: type[galois.FieldArray], n: int) -> None:
+    omega = field.primitive_root_of_unity(n)
+    g = galois.Poly.Random(n - 1, field=field, seed=n)
+    coefficients = field.Zeros(n)
+    coefficients[: g.degree + 1] = g.coefficients(order="asc")
+
+    result = ntt(coefficients, get_twiddles(omega, n))
+
+    assert numpy.array_equal(result, g(omega ** numpy.arange(n)))
+
+
+@pytest.mark.parametrize("field", [FIELD_193, FIELD_GOLDILOCKS])
+def test_intt(field: type[galois.FieldArray]) -> None:
+    n = 16
+    omega = field.primitive_root_of_unity(n)
+    values = field.Random(n, seed=1)
+
+    result = intt(
+        ntt(values, get_twiddles(omega, n)),
+        get_twiddles(omega**-1, n),
+    )
+
+    assert numpy.array_equal(result, values)
+
+
+@pytest.mark.parametrize("field", [FIELD_193, FIELD_GOLDILOCKS])
+def test_evaluate_and_interpolate_on_coset(field: type[galois.FieldArray]) -> None:
+    n = 32
+    omega = field.primitive_root_of_unity(n)
+    offset = field.primitive_element
+    g = galois.Poly.Random(n // 4 - 1, field=field, seed=2)
+
+    evaluations = evaluate_on_coset(g, offset, get_twiddles(omega, n), n)
+
+    assert numpy.array_equal(evaluations, g(offset * omega ** numpy.arange(n)))
+    assert interpolate_on_coset(evaluations, offset, get_twiddles(omega**-1, n)) == g
+
+
+@pytest.mark.parametrize("field", [FIELD_193, FIELD_GOLDILOCKS])
+def test_evaluate_and_interpolate_many_on_coset(
+    field: type[galois.FieldArray],
+) -> None:
+    n = 32
+    omega = field.primitive_root_of_unity(n)
+    offset = field.primitive_element
+    gs = [galois.Poly.Random(degree, field=field, seed=degree) for degree in [0, 5, 31]]
+
+    evaluations = evaluate_many_on_coset(gs, offset, get_twiddles(omega, n), n)
+
+    for g, row in zip(gs, evaluations):
+        expected = evaluate_on_coset(g, offset, get_twiddles(omega, n), n)
+        assert numpy.array_equal(row, expected)
+
+    inverse_twiddles = get_twiddles(omega**-1, n)
+    assert interpolate_many_on_coset(evaluations, offset, inverse_twiddles) == gs
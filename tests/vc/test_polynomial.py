@@ -3,9 +3,11 @@ import galois
 import numpy
 import pytest
 
-from vc.constants import FIELD_193
+from vc.constants import FIELD_193, FIELD_BABYBEAR
 from vc.polynomial import (
     MPoly,
+    evaluate_degree_correction,
+    expand_ext,
     expand_to_nearest_power_of_two,
     expand_to_nearest_power_of_two2,
     scale,
@@ -166,6 +168,16 @@ def test_evaluate_mpoly(
     assert expected_element == result
 
 
+def test_evaluate_mpoly_large_elements() -> None:
+    # INFO: Products of the elements do not fit in 64 bits.
+    field = FIELD_BABYBEAR
+    x, y, z = field([field.order - 1, field.order - 2, field.order - 3])
+
+    mpoly = MPoly({(1, 2, 0): field(3), (0, 1, 1): field(1)}, field)
+
+    assert mpoly.eval(field([x, y, z])) == field(3) * x * y**2 + y * z
+
+
 @pytest.mark.parametrize(
     "coeffs, point, expected",
     [
@@ -254,3 +266,18 @@ def test_evalv_mpoly(coeffs, points, expected):
 
     result = mpoly.evalv(points)
     assert numpy.all(result == expected)
+
+
+@pytest.mark.parametrize("length", [1, 2, 7, 16])
+def test_evaluate_degree_correction(length: int) -> None:
+    randomness = TEST_FIELD(5)
+    g = galois.Poly.Random(16 - length, field=TEST_FIELD, seed=length)
+    _, correction = expand_ext(g, randomness, 16)
+
+    # INFO: All the field elements, including the root 1 / randomness.
+    xs = TEST_FIELD.Range(0, TEST_FIELD.order)
+    assert numpy.any(randomness * xs == TEST_FIELD(1))
+
+    result = evaluate_degree_correction(randomness, length, xs)
+
+    assert numpy.all(result == correction(xs))
@@ -20,3 +20,23 @@ def test_same():
     sponge2.absorb(random_bytes)
 
     assert sponge1.squeeze_field_element() == sponge2.squeeze_field_element()
+
+
+def test_grinding():
+    bits = 8
+
+    prover_sponge = Sponge(FIELD_193)
+    verifier_sponge = Sponge(FIELD_193)
+    other_sponge = Sponge(FIELD_193)
+
+    random_bytes = random.randbytes(NBYTES)
+    prover_sponge.absorb(random_bytes)
+    verifier_sponge.absorb(random_bytes)
+    other_sponge.absorb(random_bytes)
+
+    nonce = prover_sponge.grind(bits)
+
+    # INFO: The prover takes the first nonce that works.
+    assert not any(other_sponge.check_grinding(i, bits) for i in range(nonce))
+    assert verifier_sponge.check_grinding(nonce, bits)
+    assert prover_sponge.squeeze_field_element() == verifier_sponge.squeeze_field_element()
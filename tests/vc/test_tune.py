@@ -0,0 +1,128 @@
+import galois
+import pytest
+
+from vc.constants import FIELD_BABYBEAR, FIELD_GOLDILOCKS
+from vc.fri.parameters import FriParameters
+from vc.fri.prover import FriProver
+from vc.tune import (
+    OBJECTIVES,
+    PROOF_SIZE,
+    PROVER_TIME,
+    VERIFIER_TIME,
+    CostModel,
+    get_candidates,
+    tune,
+)
+
+
+def get_cost_model() -> CostModel:
+    return CostModel(
+        field=FIELD_GOLDILOCKS,
+        ntt_ns=5000,
+        pointwise_ns=50000,
+        fold_ns=500,
+        leaf_ns=50000,
+        leaf_element_ns=200,
+        open_ns=1000,
+        verify_ns=7000,
+        evaluate_ns=6000,
+        grinding_ns=3000,
+        proof_size_overhead=1.25,
+    )
+
+
+@pytest.mark.parametrize("trace", [False, True])
+def test_get_candidates(trace: bool) -> None:
+    candidates = get_candidates(FIELD_GOLDILOCKS, 32, 8, trace=trace)
+
+    assert len(candidates) > 0
+
+    protocols = set()
+    for parameters in candidates:
+        assert parameters.soundness.bits >= 32
+        assert parameters.initial_coefficients_length_log == 8 + (
+            parameters.expansion_factor_log if trace else 0
+        )
+
+        protocols.add(
+            (
+                parameters.folding_factor_log,
+                parameters.expansion_factor_log,
+                parameters.number_of_rounds,
+            )
+        )
+
+    assert len(protocols) == len(candidates)
+
+
+def test_tune() -> None:
+    cost_model = get_cost_model()
+
+    for objective in OBJECTIVES:
+        candidates = tune(FIELD_GOLDILOCKS, 32, 8, {objective: 1}, cost_model)
+
+        assert candidates[0].cost == 1
+        assert candidates[0].get(objective) == min(c.get(objective) for c in candidates)
+
+    candidates = tune(
+        FIELD_GOLDILOCKS,
+        32,
+        8,
+        {PROVER_TIME: 1, PROOF_SIZE: 2},
+        cost_model,
+    )
+
+    assert candidates[0].cost >= 3
+    assert candidates == sorted(candidates, key=lambda candidate: candidate.cost)
+    assert candidates[0].prover_ns < candidates[-1].prover_ns
+
+
+def test_predict_grinding() -> None:
+    cost_model = get_cost_model()
+
+    def get_parameters(grinding_bits: int) -> FriParameters:
+        return FriParameters(
+            folding_factor_log=2,
+            expansion_factor_log=2,
+            security_level_bits=32,
+            initial_coefficients_length_log=8,
+            final_coefficients_length_log=1,
+            field=FIELD_GOLDILOCKS,
+            grinding_bits=grinding_bits,
+        )
+
+    # INFO: Grinding saves queries, but the prover pays for every nonce.
+    assert cost_model.predict_prover_ns(get_parameters(20)) > (
+        cost_model.predict_prover_ns(get_parameters(0))
+        + cost_model.grinding_ns * (1 << 19)
+    )
+
+
+def test_tune_unreachable() -> None:
+    with pytest.raises(AssertionError):
+        tune(FIELD_BABYBEAR, 64, 8, {VERIFIER_TIME: 1}, get_cost_model())
+
+
+def test_cost_model_calibrate() -> None:
+    cost_model = CostModel.calibrate(FIELD_BABYBEAR)
+
+    assert cost_model.ntt_ns > 0
+    assert cost_model.leaf_ns > 0
+    assert cost_model.verify_ns > 0
+    assert cost_model.grinding_ns > 0
+
+    parameters = FriParameters(
+        folding_factor_log=3,
+        expansion_factor_log=1,
+        security_level_bits=16,
+        initial_coefficients_length_log=9,
+        final_coefficients_length_log=0,
+        field=FIELD_BABYBEAR,
+    )
+    g = galois.Poly.Random(511, field=FIELD_BABYBEAR, seed=1)
+    proof_size = len(FriProver(parameters).prove(g).serialize())
+
+    assert cost_model.predict_proof_size(parameters) == pytest.approx(
+        proof_size,
+        rel=0.25,
+    )
@@ -0,0 +1,9 @@
+from vc.constants import FIELD_193
+from vc.warmup import warmup
+
+
+def test_warmup():
+    timings = warmup([FIELD_193])
+
+    assert list(timings.keys()) == [FIELD_193.order]
+    assert timings[FIELD_193.order] >= 0